@@ -209,7 +209,7 @@ class CommandHandler:
             if visible:
                 text.append(f" {self.deco.DOT_MEDIUM} ", style=self.theme.TEXT_DIM)
             text.append(f"+{remaining} more", style=self.theme.TEXT_SECONDARY)
-        if not text.plain:
+        if not text:
             text.append("(none)", style=self.theme.TEXT_DIM)
         return text
 
@@ -12716,7 +12716,7 @@ class CommandHandler:
         
         if not parts:
             # Use interactive UI
-            from .rollback_ui import RollbackUI
+            from .rollback_ui import RollbackAction, RollbackUI
             rollback_ui = RollbackUI(self.console, rollback_manager, operation_history)
             
             action = rollback_ui.show_main_menu()
@@ -12726,7 +12726,7 @@ class CommandHandler:
             
             session_id = self.app.get('session_manager').current_session.id if self.app.get('session_manager') and self.app['session_manager'].current_session else "default"
             
-            if action == rollback_ui.RollbackAction.ROLLBACK_TO_QUESTION:
+            if action == RollbackAction.ROLLBACK_TO_QUESTION:
                 result = rollback_manager.rollback_to_previous_question(session_id)
                 rollback_ui.show_rollback_summary(result)
                 
@@ -12734,11 +12734,11 @@ class CommandHandler:
                 if result.success and result.restored_messages and self.app.get('agent'):
                     self.app['agent'].messages = result.restored_messages
             
-            elif action == rollback_ui.RollbackAction.ROLLBACK_TO_TOOL:
+            elif action == RollbackAction.ROLLBACK_TO_TOOL:
                 result = rollback_manager.rollback_to_previous_tool_call(session_id)
                 rollback_ui.show_rollback_summary(result)
             
-            elif action == rollback_ui.RollbackAction.ROLLBACK_TO_CHECKPOINT:
+            elif action == RollbackAction.ROLLBACK_TO_CHECKPOINT:
                 checkpoint_id = rollback_ui.show_checkpoint_selector()
                 if checkpoint_id:
                     result = rollback_manager.rollback_to_checkpoint(checkpoint_id)
@@ -12748,11 +12748,11 @@ class CommandHandler:
                     if result.success and result.restored_messages and self.app.get('agent'):
                         self.app['agent'].messages = result.restored_messages
             
-            elif action == rollback_ui.RollbackAction.UNDO:
+            elif action == RollbackAction.UNDO:
                 result = rollback_manager.undo()
                 rollback_ui.show_rollback_summary(result)
             
-            elif action == rollback_ui.RollbackAction.REDO:
+            elif action == RollbackAction.REDO:
                 result = rollback_manager.redo()
                 rollback_ui.show_rollback_summary(result)
             
@@ -12887,22 +12887,14 @@ class CommandHandler:
             self.console.print(f"[{self.theme.TEXT_DIM}]No checkpoints available.[/{self.theme.TEXT_DIM}]")
             return True
         
-        # Prepare checkpoint data for selector
-        checkpoints_data = []
-        for cp in checkpoints:
-            created_at = cp.created_at[:19].replace('T', ' ')
-            description = f"{cp.description} â€¢ {cp.message_count} messages"
-            
-            checkpoints_data.append({
-                'id': cp.id,
-                'description': cp.description,
-                'created_at': created_at,
-                'message_count': cp.message_count,
-                'checkpoint': cp
-            })
-        
         # Use TUI selector for checkpoint selection
-        from .tui_selector import CheckpointSelector, SelectorAction
+        from .tui_selector import CheckpointRow, CheckpointSelector, SelectorAction
+        
+        # Prepare checkpoint data for selector
+        checkpoints_data = [
+            CheckpointRow(cp.id, cp.description, cp.created_at[:19].replace('T', ' '), cp.message_count, cp)
+            for cp in checkpoints
+        ]
         
         # Create and run selector
         selector = CheckpointSelector(
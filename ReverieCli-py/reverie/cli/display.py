@@ -28,7 +28,7 @@ from rich.markup import escape
 from rich import box
 from rich.pager import Pager
 
-from .theme import THEME, DECO, DREAM, DreamBoxes
+from .theme import THEME, DECO, DREAM, DreamBoxes, GRADIENT_PINK_PURPLE_STYLES
 
 
 class DisplayComponents:
@@ -1799,7 +1799,7 @@ class DisplayComponents:
     
     def show_gradient_header(self, text: str) -> None:
         """Show a header with gradient effect"""
-        gradient = DREAM.gradient_text(text, self.theme.get_gradient_pink_purple())
+        gradient = DREAM.gradient_text(text, GRADIENT_PINK_PURPLE_STYLES)
         self.console.print(Align.center(gradient))
     
     def clear(self) -> None:
@@ -12,6 +12,8 @@ terminal blocks so model output feels closer to a modern agent TUI:
 from __future__ import annotations
 
 import re
+import signal
+import threading
 from typing import List, Optional
 
 from rich import box
@@ -24,28 +26,37 @@ from rich.text import Text
 from .theme import DECO, THEME
 
 
-COLORS = {
-    "h1": THEME.PINK_GLOW,
-    "h2": THEME.PINK_SOFT,
-    "h3": THEME.BLUE_SOFT,
-    "h4": THEME.TEXT_SECONDARY,
-    "h5": THEME.TEXT_SECONDARY,
-    "h6": THEME.TEXT_DIM,
-    "bold": THEME.TEXT_PRIMARY,
-    "italic": THEME.PURPLE_SOFT,
-    "bold_italic": THEME.PINK_SOFT,
-    "code_inline": THEME.MINT_SOFT,
-    "code_block": THEME.BLUE_SOFT,
-    "link": THEME.BLUE_MEDIUM,
-    "link_url": THEME.TEXT_DIM,
-    "list_marker": THEME.PINK_SOFT,
-    "list_number": THEME.PURPLE_SOFT,
-    "blockquote": THEME.TEXT_SECONDARY,
-    "blockquote_bar": THEME.PURPLE_SOFT,
-    "text": THEME.TEXT_SECONDARY,
-    "hr": THEME.TEXT_DIM,
+# Markdown roles map to THEME attribute names and are resolved on every lookup,
+# so presets applied through ``apply_theme`` reach rendered markdown instead of
+# a palette snapshot taken at import time.
+_COLOR_ROLES = {
+    "h1": "PINK_GLOW",
+    "h2": "PINK_SOFT",
+    "h3": "BLUE_SOFT",
+    "h4": "TEXT_SECONDARY",
+    "h5": "TEXT_SECONDARY",
+    "h6": "TEXT_DIM",
+    "bold": "TEXT_PRIMARY",
+    "italic": "PURPLE_SOFT",
+    "bold_italic": "PINK_SOFT",
+    "code_inline": "MINT_SOFT",
+    "code_block": "BLUE_SOFT",
+    "link": "BLUE_MEDIUM",
+    "link_url": "TEXT_DIM",
+    "list_marker": "PINK_SOFT",
+    "list_number": "PURPLE_SOFT",
+    "blockquote": "TEXT_SECONDARY",
+    "blockquote_bar": "PURPLE_SOFT",
+    "text": "TEXT_SECONDARY",
+    "hr": "TEXT_DIM",
 }
 
+
+def _color(role: str) -> str:
+    """Resolve a markdown color role against the live shared theme."""
+    return getattr(THEME, _COLOR_ROLES[role])
+
+
 HEADER_RE = re.compile(r"^(#{1,6})\s+(.+)$")
 BLOCKQUOTE_RE = re.compile(r"^>\s*(.*)$")
 UNORDERED_LIST_RE = re.compile(r"^(\s*)[-*+]\s+(.+)$")
@@ -68,6 +79,47 @@ INLINE_PATTERNS = [
     (re.compile(r"\[([^\]]+)\]\(([^)]+)\)"), "link"),
 ]
 
+# Bumped by SIGWINCH so formatters can reuse their last measured width instead
+# of querying the terminal size for every streamed chunk.
+_RESIZE_GENERATION = 0
+_PREVIOUS_SIGWINCH_HANDLER = None
+_RESIZE_HANDLER_REQUESTED = False
+
+
+def _note_terminal_resize(signum, frame) -> None:
+    global _RESIZE_GENERATION
+    _RESIZE_GENERATION += 1
+    if callable(_PREVIOUS_SIGWINCH_HANDLER):
+        _PREVIOUS_SIGWINCH_HANDLER(signum, frame)
+
+
+def _install_resize_handler() -> None:
+    """Chain a SIGWINCH handler on POSIX main threads; other platforms stay uncached.
+
+    Called on the first width lookup rather than at import, so merely
+    importing this module never replaces a process-wide signal handler.
+    """
+    global _PREVIOUS_SIGWINCH_HANDLER, _RESIZE_HANDLER_REQUESTED
+    if _RESIZE_HANDLER_REQUESTED:
+        return
+    if not hasattr(signal, "SIGWINCH") or threading.current_thread() is not threading.main_thread():
+        return
+    _RESIZE_HANDLER_REQUESTED = True
+    try:
+        previous = signal.getsignal(signal.SIGWINCH)
+        if previous is _note_terminal_resize:
+            return
+        signal.signal(signal.SIGWINCH, _note_terminal_resize)
+    except (ValueError, OSError):
+        return
+    _PREVIOUS_SIGWINCH_HANDLER = previous
+
+
+def _resize_handler_active() -> bool:
+    """Return True while resizes are reported to us (prompt_toolkit may swap the handler)."""
+    return hasattr(signal, "SIGWINCH") and signal.getsignal(signal.SIGWINCH) is _note_terminal_resize
+
+
 SYNTAX_LANGUAGE_MAP = {
     "py": "python",
     "js": "javascript",
@@ -86,6 +138,8 @@ class MarkdownFormatter:
         self.console = console or Console(width=None)
         self.deco = DECO
         self.theme = THEME
+        self._cached_width: Optional[int] = None
+        self._cached_width_generation = -1
 
     def format_text(self, markdown_text: str) -> RenderableType:
         return self.format_text_with_wrapping(markdown_text)
@@ -96,11 +150,11 @@ class MarkdownFormatter:
         max_width: Optional[int] = None,
     ) -> RenderableType:
         if max_width is None:
-            max_width = self.console.width or 80
+            max_width = self._terminal_width()
         normalized_text = str(markdown_text or "")
 
         if self._looks_like_plain_text(normalized_text):
-            return Text(normalized_text, style=COLORS["text"])
+            return Text(normalized_text, style=_color("text"))
 
         renderables = self._parse_blocks(normalized_text, max_width=max_width)
         if not renderables:
@@ -109,6 +163,17 @@ class MarkdownFormatter:
             return renderables[0]
         return Group(*renderables)
 
+    def _terminal_width(self) -> int:
+        """Return the console width, re-measuring only after a terminal resize."""
+        if not _RESIZE_HANDLER_REQUESTED:
+            _install_resize_handler()
+        if not _resize_handler_active():
+            return self.console.width or 80
+        if self._cached_width is None or self._cached_width_generation != _RESIZE_GENERATION:
+            self._cached_width = self.console.width or 80
+            self._cached_width_generation = _RESIZE_GENERATION
+        return self._cached_width
+
     def format_streaming_chunk(self, chunk: str) -> RenderableType:
         return self.format_text(chunk)
 
@@ -233,7 +298,7 @@ class MarkdownFormatter:
             if HORIZONTAL_RULE_RE.match(line):
                 rule_char = self._safe_symbol(self.deco.LINE_HORIZONTAL, "-")
                 renderables.append(
-                    Text(rule_char * max(12, min(max_width - 4, 42)), style=COLORS["hr"])
+                    Text(rule_char * max(12, min(max_width - 4, 42)), style=_color("hr"))
                 )
                 i += 1
                 continue
@@ -262,14 +327,14 @@ class MarkdownFormatter:
             renderables.append(self._render_paragraph("\n".join(paragraph_lines)))
             continue
 
-        while renderables and isinstance(renderables[-1], Text) and not renderables[-1].plain:
+        while renderables and isinstance(renderables[-1], Text) and not renderables[-1]:
             renderables.pop()
         return renderables
 
     def _render_header(self, match: re.Match[str]) -> RenderableType:
         level = len(match.group(1))
         content = match.group(2).strip()
-        color = COLORS[f"h{min(level, 6)}"]
+        color = _color(f"h{min(level, 6)}")
         text = Text()
         if level == 1:
             text.append(content, style=f"bold {color}")
@@ -284,11 +349,11 @@ class MarkdownFormatter:
     def _render_blockquote(self, content: str) -> RenderableType:
         text = Text()
         quote_bar = self._safe_symbol(self.deco.LINE_VERTICAL, "|")
-        text.append(f"{quote_bar} ", style=COLORS["blockquote_bar"])
+        text.append(f"{quote_bar} ", style=_color("blockquote_bar"))
         text.append_text(
             self._format_inline(
                 content,
-                base_style=f"italic {COLORS['blockquote']}",
+                base_style=f"italic {_color('blockquote')}",
             )
         )
         return Padding(text, (0, 0, 0, 1))
@@ -304,7 +369,7 @@ class MarkdownFormatter:
         text = Text(" " * indent)
         bullet = self._safe_symbol("\u2022", "-")
         marker_text = f"{marker}. " if ordered and marker.isdigit() else f"{bullet} "
-        marker_style = COLORS["list_number"] if ordered else COLORS["list_marker"]
+        marker_style = _color("list_number") if ordered else _color("list_marker")
         text.append(marker_text, style=f"bold {marker_style}")
         text.append_text(self._format_inline(item_text))
         return text
@@ -368,7 +433,7 @@ class MarkdownFormatter:
 
     def _format_inline(self, text: str, base_style: Optional[str] = None) -> Text:
         pos = 0
-        default_style = base_style or COLORS["text"]
+        default_style = base_style or _color("text")
         if not text:
             return Text("", style=default_style)
         if not any(token in text for token in ("`", "*", "_", "](")):
@@ -396,16 +461,16 @@ class MarkdownFormatter:
             if best_pattern_type == "link":
                 link_text = best_match.group(1)
                 link_url = best_match.group(2)
-                result.append(link_text, style=f"underline {COLORS['link']}")
-                result.append(f" ({link_url})", style=COLORS["link_url"])
+                result.append(link_text, style=f"underline {_color('link')}")
+                result.append(f" ({link_url})", style=_color("link_url"))
             elif best_pattern_type == "code_inline":
-                result.append(best_match.group(1), style=f"bold {COLORS['code_inline']}")
+                result.append(best_match.group(1), style=f"bold {_color('code_inline')}")
             elif best_pattern_type == "bold":
-                result.append(best_match.group(1), style=f"bold {COLORS['bold']}")
+                result.append(best_match.group(1), style=f"bold {_color('bold')}")
             elif best_pattern_type == "italic":
-                result.append(best_match.group(1), style=f"italic {COLORS['italic']}")
+                result.append(best_match.group(1), style=f"italic {_color('italic')}")
             elif best_pattern_type == "bold_italic":
-                result.append(best_match.group(1), style=f"bold italic {COLORS['bold_italic']}")
+                result.append(best_match.group(1), style=f"bold italic {_color('bold_italic')}")
 
             pos = best_start + len(best_match.group(0))
         return result
@@ -17,17 +17,58 @@ Features:
 """
 
 from typing import List, Dict, Optional, Callable, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from rich.cells import cell_len, set_cell_size
+from rich.console import Console, Group
 from rich.text import Text
-from rich.align import Align
-from rich import box
 
-from .theme import THEME, DECO
+from .theme import THEME, DECO, theme_revision
+
+
+_tui_selector = None
+
+# Histories at least this long skip the bordered Table layout.
+_HISTORY_TABLE_LIMIT = 30
+
+
+def _get_tui():
+    """Import the selector module on first menu open and reuse it afterwards."""
+    global _tui_selector
+    if _tui_selector is None:
+        from . import tui_selector as _tui_selector
+    return _tui_selector
+
+
+# Constant status-bar markup fragments, rebuilt only when a theme preset changes.
+_STATUS_BAR_REVISION: Optional[int] = None
+_STATUS_BAR_MARKUP: Dict[str, str] = {}
+
+
+def _status_bar_markup() -> Dict[str, str]:
+    """Return the pre-rendered status bar fragments for the active theme."""
+    global _STATUS_BAR_REVISION
+    revision = theme_revision()
+    if _STATUS_BAR_REVISION != revision:
+        rule = f"[{THEME.PURPLE_MEDIUM}]{DECO.LINE_HORIZONTAL * 2}[/{THEME.PURPLE_MEDIUM}]"
+        sparkle = f"[{THEME.PINK_SOFT}]{DECO.SPARKLE}[/{THEME.PINK_SOFT}]"
+        _STATUS_BAR_MARKUP.clear()
+        _STATUS_BAR_MARKUP.update({
+            "prefix": f"{rule} {sparkle} ",
+            "suffix": f"{sparkle} {rule} ",
+            "dot": f"[{THEME.TEXT_DIM}]{DECO.DOT_MEDIUM}[/{THEME.TEXT_DIM}] ",
+            "ops_open": f"[bold {THEME.TEXT_PRIMARY}]",
+            "ops_close": f" ops[/bold {THEME.TEXT_PRIMARY}] ",
+            "files_open": f"[{THEME.PURPLE_SOFT}]",
+            "files_close": f" files[/{THEME.PURPLE_SOFT}] ",
+            "undo_on": f"[bold {THEME.MINT_SOFT}]Undo[/bold {THEME.MINT_SOFT}] ",
+            "redo_on": f"[bold {THEME.MINT_SOFT}]Redo[/bold {THEME.MINT_SOFT}] ",
+            "undo_off": "[dim]Undo[/dim] ",
+            "redo_off": "[dim]Redo[/dim] ",
+        })
+        _STATUS_BAR_REVISION = revision
+    return _STATUS_BAR_MARKUP
 
 
 class RollbackAction(Enum):
@@ -41,7 +82,7 @@ class RollbackAction(Enum):
     VIEW_DETAILS = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class RollbackPoint:
     """A rollback point in the history"""
     id: str
@@ -50,11 +91,53 @@ class RollbackPoint:
     timestamp: str
     message_index: int = -1
     checkpoint_id: Optional[str] = None
-    metadata: Dict = None
-    
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict = field(default_factory=dict)
+
+
+_MAIN_MENU_ACTIONS: Dict[str, RollbackAction] = {
+    "rollback_question": RollbackAction.ROLLBACK_TO_QUESTION,
+    "rollback_tool": RollbackAction.ROLLBACK_TO_TOOL,
+    "rollback_checkpoint": RollbackAction.ROLLBACK_TO_CHECKPOINT,
+    "undo": RollbackAction.UNDO,
+    "redo": RollbackAction.REDO,
+}
+
+_MAIN_MENU_ITEMS: Optional[tuple] = None
+
+
+def _main_menu_items() -> tuple:
+    """Build the constant main-menu entries once; selection maps back via ``_MAIN_MENU_ACTIONS``."""
+    global _MAIN_MENU_ITEMS
+    if _MAIN_MENU_ITEMS is None:
+        SelectorItem = _get_tui().SelectorItem
+        _MAIN_MENU_ITEMS = (
+            SelectorItem(
+                id="rollback_question",
+                title="Rollback to Previous Question",
+                description="Restore state before the last user question",
+            ),
+            SelectorItem(
+                id="rollback_tool",
+                title="Rollback to Previous Tool Call",
+                description="Restore state before the last tool execution",
+            ),
+            SelectorItem(
+                id="rollback_checkpoint",
+                title="Rollback to Checkpoint",
+                description="Select a specific checkpoint to restore",
+            ),
+            SelectorItem(
+                id="undo",
+                title="Undo Last Rollback",
+                description="Undo the most recent rollback operation",
+            ),
+            SelectorItem(
+                id="redo",
+                title="Redo Last Undo",
+                description="Redo the most recently undone rollback",
+            ),
+        )
+    return _MAIN_MENU_ITEMS
 
 
 class RollbackUI:
@@ -85,45 +168,13 @@ class RollbackUI:
         Returns:
             The selected action, or None if cancelled
         """
-        from .tui_selector import TUISelector, SelectorItem, SelectorAction
-        
-        items = [
-            SelectorItem(
-                id="rollback_question",
-                title="Rollback to Previous Question",
-                description="Restore state before the last user question",
-                metadata={"action": RollbackAction.ROLLBACK_TO_QUESTION}
-            ),
-            SelectorItem(
-                id="rollback_tool",
-                title="Rollback to Previous Tool Call",
-                description="Restore state before the last tool execution",
-                metadata={"action": RollbackAction.ROLLBACK_TO_TOOL}
-            ),
-            SelectorItem(
-                id="rollback_checkpoint",
-                title="Rollback to Checkpoint",
-                description="Select a specific checkpoint to restore",
-                metadata={"action": RollbackAction.ROLLBACK_TO_CHECKPOINT}
-            ),
-            SelectorItem(
-                id="undo",
-                title="Undo Last Rollback",
-                description="Undo the most recent rollback operation",
-                metadata={"action": RollbackAction.UNDO}
-            ),
-            SelectorItem(
-                id="redo",
-                title="Redo Last Undo",
-                description="Redo the most recently undone rollback",
-                metadata={"action": RollbackAction.REDO}
-            ),
-        ]
+        tui = _get_tui()
+        TUISelector, SelectorAction = tui.TUISelector, tui.SelectorAction
         
         selector = TUISelector(
             console=self.console,
             title=f"[bold {self.theme.PINK_SOFT}]{self.deco.SPARKLE} Rollback Menu {self.deco.SPARKLE}[/bold {self.theme.PINK_SOFT}]",
-            items=items,
+            items=list(_main_menu_items()),
             allow_search=False,
             allow_cancel=True,
             show_descriptions=True,
@@ -135,10 +186,7 @@ class RollbackUI:
         if result.action == SelectorAction.CANCEL:
             return None
         
-        if result.selected_item:
-            return result.selected_item.metadata.get("action")
-        
-        return None
+        return _MAIN_MENU_ACTIONS.get(result.selected_item.id) if result.selected_item else None
     
     def show_checkpoint_selector(self) -> Optional[str]:
         """
@@ -147,7 +195,8 @@ class RollbackUI:
         Returns:
             The selected checkpoint ID, or None if cancelled
         """
-        from .tui_selector import CheckpointSelector, SelectorAction
+        tui = _get_tui()
+        CheckpointSelector, SelectorAction = tui.CheckpointSelector, tui.SelectorAction
         
         # Get checkpoints
         checkpoints = self.rollback_manager.checkpoint_manager.list_checkpoints()
@@ -157,19 +206,11 @@ class RollbackUI:
             self.console.print(f"[{self.theme.TEXT_DIM}]No checkpoints available.[/{self.theme.TEXT_DIM}]")
             return None
         
-        # Prepare checkpoint data for selector
-        checkpoints_data = []
-        for cp in checkpoints[:20]:  # Show last 20
-            created_at = cp.created_at[:19].replace('T', ' ')
-            description = f"{cp.description} • {cp.message_count} messages"
-            
-            checkpoints_data.append({
-                'id': cp.id,
-                'description': cp.description,
-                'created_at': created_at,
-                'message_count': cp.message_count,
-                'checkpoint': cp
-            })
+        # Prepare checkpoint data for selector (last 20)
+        checkpoints_data = [
+            tui.CheckpointRow(cp.id, cp.description, cp.created_at[:19].replace('T', ' '), cp.message_count, cp)
+            for cp in checkpoints[:20]
+        ]
         
         selector = CheckpointSelector(
             console=self.console,
@@ -186,13 +227,18 @@ class RollbackUI:
         
         return None
     
-    def show_operation_history(self, limit: int = 20) -> None:
+    def show_operation_history(self, limit: int = 20, type_filter: Optional[Any] = None) -> None:
         """
         Show operation history.
         
         Args:
             limit: Maximum number of operations to show
+            type_filter: Optional OperationType to restrict the view to
         """
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        
         self.console.print()
         title_panel = Panel(
             f"[bold {self.theme.PINK_SOFT}]{self.deco.SPARKLE} Operation History {self.deco.SPARKLE}[/bold {self.theme.PINK_SOFT}]",
@@ -204,35 +250,69 @@ class RollbackUI:
         self.console.print()
         
         # Get operations
-        operations = self.operation_history.get_operations(limit=limit)
+        operations = self.operation_history.get_operations(operation_type=type_filter, limit=limit)
         
         if not operations:
             self.console.print(f"[{self.theme.TEXT_DIM}]No operations recorded yet.[/{self.theme.TEXT_DIM}]")
             return
         
-        # Create table
-        table = Table(
-            box=box.ROUNDED,
-            border_style=self.theme.BORDER_PRIMARY,
-            show_lines=True
-        )
-        table.add_column("#", style=f"bold {self.theme.BLUE_SOFT}", width=4)
-        table.add_column("Type", style=self.theme.TEXT_SECONDARY, width=12)
-        table.add_column("Description", style=self.theme.TEXT_PRIMARY)
-        table.add_column("Time", style=f"dim {self.theme.TEXT_DIM}", width=20)
-        
-        for i, op in enumerate(operations, 1):
-            table.add_row(
-                str(i),
-                op.operation_type.value,
-                op.description[:60],
-                op.timestamp[:19].replace('T', ' ')
+        if len(operations) >= _HISTORY_TABLE_LIMIT:
+            # Rich re-measures every Table cell on render; long histories are
+            # padded once here and printed as a single Text block instead.
+            self.console.print(self._build_history_rows(operations), no_wrap=True, overflow="ellipsis")
+        else:
+            table = Table(
+                box=box.ROUNDED,
+                border_style=self.theme.BORDER_PRIMARY,
+                show_lines=True
             )
-        
-        self.console.print(table)
+            table.add_column("#", style=f"bold {self.theme.BLUE_SOFT}", width=4)
+            table.add_column("Type", style=self.theme.TEXT_SECONDARY, width=12)
+            table.add_column("Description", style=self.theme.TEXT_PRIMARY)
+            table.add_column("Time", style=f"dim {self.theme.TEXT_DIM}", width=20)
+            
+            for i, op in enumerate(operations, 1):
+                table.add_row(
+                    str(i),
+                    op.operation_type.value,
+                    op.description[:60],
+                    op.timestamp[:19].replace('T', ' ')
+                )
+            
+            self.console.print(table)
         self.console.print()
         self.console.print(f"[{self.theme.TEXT_DIM}]Showing last {len(operations)} operations.[/{self.theme.TEXT_DIM}]")
     
+    def _build_history_rows(self, operations: List[Any]) -> Text:
+        """Render operations as pre-padded rows in one Text, for histories too long for a Table."""
+        separator = f" {self.deco.LINE_VERTICAL} "
+        # Keep each operation on one line, and pad by terminal cells (not
+        # characters) so CJK and emoji descriptions stay aligned like a Table.
+        descriptions = [
+            " ".join(op.description.splitlines())[:60]
+            for op in operations
+        ]
+        desc_width = max(max(cell_len(desc) for desc in descriptions), len("Description"))
+        
+        rows = Text()
+        rows.append(f"{'#':>3}", style=f"bold {self.theme.BLUE_SOFT}")
+        rows.append(separator, style=self.theme.BORDER_PRIMARY)
+        rows.append(f"{'Type':<12}", style=f"bold {self.theme.TEXT_SECONDARY}")
+        rows.append(separator, style=self.theme.BORDER_PRIMARY)
+        rows.append(f"{'Description':<{desc_width}}", style=f"bold {self.theme.TEXT_PRIMARY}")
+        rows.append(separator, style=self.theme.BORDER_PRIMARY)
+        rows.append("Time", style=f"bold {self.theme.TEXT_DIM}")
+        for i, (op, desc) in enumerate(zip(operations, descriptions), 1):
+            rows.append("\n")
+            rows.append(f"{i:>3}", style=f"bold {self.theme.BLUE_SOFT}")
+            rows.append(separator, style=self.theme.BORDER_PRIMARY)
+            rows.append(set_cell_size(op.operation_type.value, 12), style=self.theme.TEXT_SECONDARY)
+            rows.append(separator, style=self.theme.BORDER_PRIMARY)
+            rows.append(set_cell_size(desc, desc_width), style=self.theme.TEXT_PRIMARY)
+            rows.append(separator, style=self.theme.BORDER_PRIMARY)
+            rows.append(op.timestamp[:19].replace('T', ' '), style=f"dim {self.theme.TEXT_DIM}")
+        return rows
+    
     def show_rollback_summary(self, result) -> None:
         """
         Show a summary of the rollback operation.
@@ -240,26 +320,39 @@ class RollbackUI:
         Args:
             result: RollbackResult from the rollback operation
         """
-        self.console.print()
+        # Collect everything first so the summary is rendered and written in
+        # one console.print, however many files were restored.
+        renderables: List[Any] = [Text("")]
         
         if result.success:
-            self.console.print(f"[{self.theme.MINT_VIBRANT}]{self.deco.CHECK_FANCY} {result.message}[/{self.theme.MINT_VIBRANT}]")
+            renderables.append(Text.from_markup(f"[{self.theme.MINT_VIBRANT}]{self.deco.CHECK_FANCY} {result.message}[/{self.theme.MINT_VIBRANT}]"))
             
             if result.restored_files:
-                self.console.print()
-                self.console.print(f"[{self.theme.TEXT_DIM}]Restored files:[/{self.theme.TEXT_DIM}]")
-                for file_path in result.restored_files:
-                    self.console.print(f"  [{self.theme.MINT_SOFT}]✓[/{self.theme.MINT_SOFT}] {file_path}")
+                renderables.append(Text(""))
+                renderables.append(Text("Restored files:", style=self.theme.TEXT_DIM))
+                renderables.append(self._build_marked_lines(result.restored_files, "✓", self.theme.MINT_SOFT))
             
             if result.errors:
-                self.console.print()
-                self.console.print(f"[{self.theme.AMBER_GLOW}]{self.deco.DOT_MEDIUM} Errors:[/{self.theme.AMBER_GLOW}]")
-                for error in result.errors:
-                    self.console.print(f"  [{self.theme.CORAL_SOFT}]✗[/{self.theme.CORAL_SOFT}] {error}")
+                renderables.append(Text(""))
+                renderables.append(Text(f"{self.deco.DOT_MEDIUM} Errors:", style=self.theme.AMBER_GLOW))
+                renderables.append(self._build_marked_lines(result.errors, "✗", self.theme.CORAL_SOFT))
         else:
-            self.console.print(f"[{self.theme.CORAL_SOFT}]{self.deco.CROSS} {result.message}[/{self.theme.CORAL_SOFT}]")
+            renderables.append(Text.from_markup(f"[{self.theme.CORAL_SOFT}]{self.deco.CROSS} {result.message}[/{self.theme.CORAL_SOFT}]"))
         
-        self.console.print()
+        renderables.append(Text(""))
+        self.console.print(Group(*renderables))
+    
+    @staticmethod
+    def _build_marked_lines(entries: List[Any], mark: str, mark_style: str) -> Text:
+        """Join entries into one Text, one indented line per entry with a styled mark."""
+        lines = Text()
+        for index, entry in enumerate(entries):
+            if index:
+                lines.append("\n")
+            lines.append("  ")
+            lines.append(mark, style=mark_style)
+            lines.append(f" {entry}")
+        return lines
     
     def show_status_bar(self) -> None:
         """Show a status bar with rollback information"""
@@ -267,33 +360,18 @@ class RollbackUI:
             return
         
         summary = self.rollback_manager.get_operation_summary()
-        
-        status_text = Text()
-        status_text.append(f"[{self.theme.PURPLE_MEDIUM}]{self.deco.LINE_HORIZONTAL * 2}[/{self.theme.PURPLE_MEDIUM}] ", style="")
-        status_text.append(f"[{self.theme.PINK_SOFT}]{self.deco.SPARKLE}[/{self.theme.PINK_SOFT}] ", style="")
-        
-        # Show operation count
-        status_text.append(f"[bold {self.theme.TEXT_PRIMARY}]{summary['total_operations']} ops[/bold {self.theme.TEXT_PRIMARY}] ", style="")
-        status_text.append(f"[{self.theme.TEXT_DIM}]{self.deco.DOT_MEDIUM}[/{self.theme.TEXT_DIM}] ", style="")
-        
-        # Show modified files
-        status_text.append(f"[{self.theme.PURPLE_SOFT}]{len(summary['modified_files'])} files[/{self.theme.PURPLE_SOFT}] ", style="")
-        status_text.append(f"[{self.theme.TEXT_DIM}]{self.deco.DOT_MEDIUM}[/{self.theme.TEXT_DIM}] ", style="")
-        
-        # Show undo/redo status
-        if summary['can_undo']:
-            status_text.append(f"[bold {self.theme.MINT_SOFT}]Undo[/bold {self.theme.MINT_SOFT}] ", style="")
-        else:
-            status_text.append(f"[dim]Undo[/dim] ", style="")
-        
-        status_text.append(f"[{self.theme.TEXT_DIM}]{self.deco.DOT_MEDIUM}[/{self.theme.TEXT_DIM}] ", style="")
-        
-        if summary['can_redo']:
-            status_text.append(f"[bold {self.theme.MINT_SOFT}]Redo[/bold {self.theme.MINT_SOFT}] ", style="")
-        else:
-            status_text.append(f"[dim]Redo[/dim] ", style="")
-        
-        status_text.append(f"[{self.theme.PINK_SOFT}]{self.deco.SPARKLE}[/{self.theme.PINK_SOFT}] ", style="")
-        status_text.append(f"[{self.theme.PURPLE_MEDIUM}]{self.deco.LINE_HORIZONTAL * 2}[/{self.theme.PURPLE_MEDIUM}] ", style="")
+        markup = _status_bar_markup()
+        
+        status_text = Text.from_markup(
+            markup["prefix"]
+            + markup["ops_open"] + str(summary['total_operations']) + markup["ops_close"]
+            + markup["dot"]
+            + markup["files_open"] + str(len(summary['modified_files'])) + markup["files_close"]
+            + markup["dot"]
+            + (markup["undo_on"] if summary['can_undo'] else markup["undo_off"])
+            + markup["dot"]
+            + (markup["redo_on"] if summary['can_redo'] else markup["redo_off"])
+            + markup["suffix"]
+        )
         
         self.console.print(status_text)
\ No newline at end of file
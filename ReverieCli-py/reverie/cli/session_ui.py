@@ -3,10 +3,27 @@ Session UI - Interactive session management
 """
 
 from dataclasses import asdict
+from importlib import import_module
 from typing import Optional
 from rich.console import Console
 
-from .tui_selector import SelectorAction, SessionSelector
+# Loaded on first use so importing the CLI package does not pay for the
+# selector module; still reachable as attributes of this module.
+_LAZY_EXPORTS = {
+    'SelectorAction': ('.tui_selector', 'SelectorAction'),
+    'SessionSelector': ('.tui_selector', 'SessionSelector'),
+}
+
+
+def __getattr__(name: str):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute_name = target
+    value = getattr(import_module(module_name, __package__), attribute_name)
+    globals()[name] = value
+    return value
 
 
 class SessionUI:
@@ -18,6 +35,8 @@ class SessionUI:
     
     def show_selector(self) -> Optional[str]:
         """Show interactive session selector, returns selected session ID"""
+        from .tui_selector import SelectorAction, SessionSelector
+
         sessions = list(self.session_manager.list_sessions())
         if not sessions:
             self.console.print("[dim]No saved sessions are available for this workspace.[/dim]")
@@ -5,13 +5,15 @@ A unified theme system for the Reverie TUI featuring a dreamy,
 ethereal color palette with pink, purple, and blue gradients.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import lru_cache, wraps
+from typing import Dict, List, Sequence, Tuple, Union
 from rich.style import Style
 from rich.text import Text
 
 
-@dataclass
+@dataclass(slots=True)
 class DreamscapeTheme:
     """
     The Dreamscape theme - A dreamy, ethereal color palette.
@@ -25,101 +27,101 @@ class DreamscapeTheme:
     # ═══════════════════════════════════════════════════════════════════════════
     
     # Pink spectrum (warm, gentle)
-    PINK_SOFT = "#ffb8d1"          # Soft cherry blossom
-    PINK_MEDIUM = "#ff9ec4"        # Rose quartz
-    PINK_VIBRANT = "#ff85b8"       # Bright sakura
-    PINK_GLOW = "#ffd6e7"          # Luminous pink
+    PINK_SOFT: str = "#ffb8d1"          # Soft cherry blossom
+    PINK_MEDIUM: str = "#ff9ec4"        # Rose quartz
+    PINK_VIBRANT: str = "#ff85b8"       # Bright sakura
+    PINK_GLOW: str = "#ffd6e7"          # Luminous pink
     
     # Purple spectrum (mystical, magical)
-    PURPLE_SOFT = "#e4b0ff"        # Soft lavender
-    PURPLE_MEDIUM = "#ce93d8"      # Muted amethyst
-    PURPLE_VIBRANT = "#ba68c8"     # Vivid violet
-    PURPLE_DEEP = "#9c27b0"        # Deep magenta
-    PURPLE_GLOW = "#ead0fe"        # Glowing lavender
+    PURPLE_SOFT: str = "#e4b0ff"        # Soft lavender
+    PURPLE_MEDIUM: str = "#ce93d8"      # Muted amethyst
+    PURPLE_VIBRANT: str = "#ba68c8"     # Vivid violet
+    PURPLE_DEEP: str = "#9c27b0"        # Deep magenta
+    PURPLE_GLOW: str = "#ead0fe"        # Glowing lavender
     
     # Blue spectrum (celestial, dreamy)
-    BLUE_SOFT = "#81d4fa"          # Soft sky blue
-    BLUE_MEDIUM = "#64b5f6"        # Cerulean dream
-    BLUE_VIBRANT = "#42a5f5"       # Electric azure
-    BLUE_DEEP = "#1e88e5"          # Deep sapphire
-    BLUE_GLOW = "#b3e5fc"          # Luminous cyan
+    BLUE_SOFT: str = "#81d4fa"          # Soft sky blue
+    BLUE_MEDIUM: str = "#64b5f6"        # Cerulean dream
+    BLUE_VIBRANT: str = "#42a5f5"       # Electric azure
+    BLUE_DEEP: str = "#1e88e5"          # Deep sapphire
+    BLUE_GLOW: str = "#b3e5fc"          # Luminous cyan
     
     # ═══════════════════════════════════════════════════════════════════════════
     # ACCENT COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
     # Success/Nature accents
-    MINT_SOFT = "#a5d6a7"          # Soft mint green
-    MINT_VIBRANT = "#66bb6a"       # Fresh spearmint
+    MINT_SOFT: str = "#a5d6a7"          # Soft mint green
+    MINT_VIBRANT: str = "#66bb6a"       # Fresh spearmint
     
     # Warning/Warm accents
-    PEACH_SOFT = "#ffcc80"         # Soft peach
-    AMBER_GLOW = "#ffb86c"         # Warm amber
+    PEACH_SOFT: str = "#ffcc80"         # Soft peach
+    AMBER_GLOW: str = "#ffb86c"         # Warm amber
     
     # Error/Alert accents
-    CORAL_SOFT = "#ff8a80"         # Soft coral
-    CORAL_VIBRANT = "#ff5252"      # Bright coral
+    CORAL_SOFT: str = "#ff8a80"         # Soft coral
+    CORAL_VIBRANT: str = "#ff5252"      # Bright coral
     
     # Thinking/Reasoning accents (ethereal, mystical)
-    THINKING_SOFT = "#b39ddb"      # Soft twilight purple
-    THINKING_MEDIUM = "#9575cd"    # Mystical violet
-    THINKING_DIM = "#7e57c2"       # Deep thought purple
-    THINKING_BORDER = "#673ab7"    # Thinking panel border
-    THINKING_GLOW = "#d1c4e9"      # Soft lavender glow
+    THINKING_SOFT: str = "#b39ddb"      # Soft twilight purple
+    THINKING_MEDIUM: str = "#9575cd"    # Mystical violet
+    THINKING_DIM: str = "#7e57c2"       # Deep thought purple
+    THINKING_BORDER: str = "#673ab7"    # Thinking panel border
+    THINKING_GLOW: str = "#d1c4e9"      # Soft lavender glow
     
     # ═══════════════════════════════════════════════════════════════════════════
     # TEXT COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    TEXT_PRIMARY = "#f8fbff"       # Crisp white for main transcript text
-    TEXT_SECONDARY = "#dde7f5"     # Brighter secondary copy
-    TEXT_DIM = "#a7b6cb"           # Muted but readable status text
-    TEXT_MUTED = "#73839b"         # Low-priority metadata
+    TEXT_PRIMARY: str = "#f8fbff"       # Crisp white for main transcript text
+    TEXT_SECONDARY: str = "#dde7f5"     # Brighter secondary copy
+    TEXT_DIM: str = "#a7b6cb"           # Muted but readable status text
+    TEXT_MUTED: str = "#73839b"         # Low-priority metadata
     
     # ═══════════════════════════════════════════════════════════════════════════
     # SEMANTIC COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    SUCCESS = "#66bb6a"
-    WARNING = "#ffb86c"
-    ERROR = "#ff5252"
-    INFO = "#81d4fa"
+    SUCCESS: str = "#66bb6a"
+    WARNING: str = "#ffb86c"
+    ERROR: str = "#ff5252"
+    INFO: str = "#81d4fa"
     
     # ═══════════════════════════════════════════════════════════════════════════
     # GAME DEVELOPMENT SPECIFIC COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
     # Tool categories
-    TOOL_GDD = "#ffb8d1"           # GDD Manager (pink)
-    TOOL_STORY = "#e4b0ff"         # Story Design (purple)
-    TOOL_ASSET = "#81d4fa"         # Asset Manager (blue)
-    TOOL_BALANCE = "#66bb6a"       # Balance Analyzer (green)
-    TOOL_LEVEL = "#ffcc80"         # Level Design (peach)
-    TOOL_CONFIG = "#ce93d8"        # Config Editor (purple)
+    TOOL_GDD: str = "#ffb8d1"           # GDD Manager (pink)
+    TOOL_STORY: str = "#e4b0ff"         # Story Design (purple)
+    TOOL_ASSET: str = "#81d4fa"         # Asset Manager (blue)
+    TOOL_BALANCE: str = "#66bb6a"       # Balance Analyzer (green)
+    TOOL_LEVEL: str = "#ffcc80"         # Level Design (peach)
+    TOOL_CONFIG: str = "#ce93d8"        # Config Editor (purple)
     
     # Task phases
-    PHASE_DESIGN = "#ffb8d1"       # Design phase (pink)
-    PHASE_IMPLEMENTATION = "#81d4fa"  # Implementation (blue)
-    PHASE_CONTENT = "#e4b0ff"      # Content creation (purple)
-    PHASE_TESTING = "#66bb6a"      # Testing (green)
-    PHASE_RELEASE = "#ffcc80"      # Release (peach)
+    PHASE_DESIGN: str = "#ffb8d1"       # Design phase (pink)
+    PHASE_IMPLEMENTATION: str = "#81d4fa"  # Implementation (blue)
+    PHASE_CONTENT: str = "#e4b0ff"      # Content creation (purple)
+    PHASE_TESTING: str = "#66bb6a"      # Testing (green)
+    PHASE_RELEASE: str = "#ffcc80"      # Release (peach)
     
     # Priority levels
-    PRIORITY_LOW = "#9e9e9e"       # Low priority (gray)
-    PRIORITY_MEDIUM = "#81d4fa"    # Medium priority (blue)
-    PRIORITY_HIGH = "#ffcc80"      # High priority (peach)
-    PRIORITY_CRITICAL = "#ff5252"  # Critical priority (red)
+    PRIORITY_LOW: str = "#9e9e9e"       # Low priority (gray)
+    PRIORITY_MEDIUM: str = "#81d4fa"    # Medium priority (blue)
+    PRIORITY_HIGH: str = "#ffcc80"      # High priority (peach)
+    PRIORITY_CRITICAL: str = "#ff5252"  # Critical priority (red)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # UI ELEMENT COLORS
     # ═══════════════════════════════════════════════════════════════════════════
     
-    BORDER_PRIMARY = "#8ec5ff"      # Primary border for important panels
-    BORDER_SECONDARY = "#c7a8ff"    # Secondary border
-    BORDER_SUBTLE = "#6f89ad"       # Subtle borders
+    BORDER_PRIMARY: str = "#8ec5ff"      # Primary border for important panels
+    BORDER_SECONDARY: str = "#c7a8ff"    # Secondary border
+    BORDER_SUBTLE: str = "#6f89ad"       # Subtle borders
     
-    PANEL_HEADER = "#ffb8d1"        # Panel titles (pink)
-    PANEL_SUBTITLE = "#ce93d8"      # Panel subtitles (purple)
+    PANEL_HEADER: str = "#ffb8d1"        # Panel titles (pink)
+    PANEL_SUBTITLE: str = "#ce93d8"      # Panel subtitles (purple)
     
     # ═══════════════════════════════════════════════════════════════════════════
     # GRADIENTS FOR DECORATIVE ELEMENTS
@@ -161,89 +163,123 @@ class DreamscapeTheme:
         ]
 
 
+# Gradient palettes resolved to Styles once at import, so gradient rendering
+# hands Rich ready-made styles instead of re-parsing hex strings per append.
+GRADIENT_PINK_PURPLE_STYLES: Tuple[Style, ...] = tuple(Style(color=c) for c in DreamscapeTheme.get_gradient_pink_purple())
+GRADIENT_PURPLE_BLUE_STYLES: Tuple[Style, ...] = tuple(Style(color=c) for c in DreamscapeTheme.get_gradient_purple_blue())
+GRADIENT_FULL_SPECTRUM_STYLES: Tuple[Style, ...] = tuple(Style(color=c) for c in DreamscapeTheme.get_gradient_full_spectrum())
+RAINBOW_DREAMY_STYLES: Tuple[Style, ...] = tuple(Style(color=c) for c in DreamscapeTheme.get_rainbow_dreamy())
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SPECIAL CHARACTERS & DECORATORS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@dataclass(slots=True)
 class DreamDecorators:
     """
     Unicode decorators for a dreamy, ethereal UI aesthetic.
     """
     
     # Sparkles and stars
-    SPARKLE = "✧"
-    SPARKLE_FILLED = "✦"
-    STAR = "★"
-    STAR_OUTLINE = "☆"
-    TWINKLE = "✨"
+    SPARKLE: str = "✧"
+    SPARKLE_FILLED: str = "✦"
+    STAR: str = "★"
+    STAR_OUTLINE: str = "☆"
+    TWINKLE: str = "✨"
     
     # Geometric shapes
-    DIAMOND = "◇"
-    DIAMOND_FILLED = "◆"
-    RHOMBUS = "◈"
-    CRYSTAL = "❖"
+    DIAMOND: str = "◇"
+    DIAMOND_FILLED: str = "◆"
+    RHOMBUS: str = "◈"
+    CRYSTAL: str = "❖"
     
     # Circles and dots
-    CIRCLE = "○"
-    CIRCLE_FILLED = "●"
-    DOT_SMALL = "·"
-    DOT_MEDIUM = "•"
-    RING = "◎"
+    CIRCLE: str = "○"
+    CIRCLE_FILLED: str = "●"
+    DOT_SMALL: str = "·"
+    DOT_MEDIUM: str = "•"
+    RING: str = "◎"
     
     # Arrows and pointers
-    ARROW_RIGHT = "→"
-    ARROW_CURVED = "↳"
-    CHEVRON_RIGHT = "›"
-    CHEVRON_DOUBLE = "»"
-    TRIANGLE_RIGHT = "▸"
+    ARROW_RIGHT: str = "→"
+    ARROW_CURVED: str = "↳"
+    CHEVRON_RIGHT: str = "›"
+    CHEVRON_DOUBLE: str = "»"
+    TRIANGLE_RIGHT: str = "▸"
     
     # Box drawing (dreamy style)
-    LINE_HORIZONTAL = "─"
-    LINE_VERTICAL = "│"
-    CORNER_TOP_LEFT = "╭"
-    CORNER_TOP_RIGHT = "╮"
-    CORNER_BOTTOM_LEFT = "╰"
-    CORNER_BOTTOM_RIGHT = "╯"
+    LINE_HORIZONTAL: str = "─"
+    LINE_VERTICAL: str = "│"
+    CORNER_TOP_LEFT: str = "╭"
+    CORNER_TOP_RIGHT: str = "╮"
+    CORNER_BOTTOM_LEFT: str = "╰"
+    CORNER_BOTTOM_RIGHT: str = "╯"
     
     # Decorative lines
-    WAVE = "～"
-    SPARKLE_LINE = "・゜・"
-    DREAM_DIVIDER = "✧･ﾟ: *✧･ﾟ:*"
-    STARS_LINE = "✦ · ✧ · ✦"
+    WAVE: str = "～"
+    SPARKLE_LINE: str = "・゜・"
+    DREAM_DIVIDER: str = "✧･ﾟ: *✧･ﾟ:*"
+    STARS_LINE: str = "✦ · ✧ · ✦"
     
     # Status indicators
-    CHECK = "✓"
-    CHECK_FANCY = "✔"
-    CROSS = "✗"
-    CROSS_FANCY = "✘"
-    LOADING_DOTS = "⋯"
-    SEARCH = "🔍"  # Search icon for selector
+    CHECK: str = "✓"
+    CHECK_FANCY: str = "✔"
+    CROSS: str = "✗"
+    CROSS_FANCY: str = "✘"
+    LOADING_DOTS: str = "⋯"
+    SEARCH: str = "🔍"  # Search icon for selector
     
     # Mood/emotion
-    HEART = "♡"
-    HEART_FILLED = "♥"
-    MOON = "☽"
-    MOON_CRESCENT = "🌙"
-    CLOUD = "☁"
+    HEART: str = "♡"
+    HEART_FILLED: str = "♥"
+    MOON: str = "☽"
+    MOON_CRESCENT: str = "🌙"
+    CLOUD: str = "☁"
     
     # Thinking/Reasoning indicators
-    THOUGHT_BUBBLE = "💭"
-    CRYSTAL_BALL = "🔮"
-    BRAIN = "🧠"
-    THINKING = "⟐"                 # Diamond with dot (thinking symbol)
-    THOUGHT_WAVE = "∿"             # Wavy thinking line
+    THOUGHT_BUBBLE: str = "💭"
+    CRYSTAL_BALL: str = "🔮"
+    BRAIN: str = "🧠"
+    THINKING: str = "⟐"                 # Diamond with dot (thinking symbol)
+    THOUGHT_WAVE: str = "∿"             # Wavy thinking line
     
     # Brackets and frames
-    BRACKET_OPEN = "「"
-    BRACKET_CLOSE = "」"
-    ANGLE_OPEN = "《"
-    ANGLE_CLOSE = "》"
+    BRACKET_OPEN: str = "「"
+    BRACKET_CLOSE: str = "」"
+    ANGLE_OPEN: str = "《"
+    ANGLE_CLOSE: str = "》"
+    
+    def __post_init__(self) -> None:
+        # Glyphs are concatenated into markup on every redraw; interning lets
+        # equal glyphs share one object across the process.
+        for name in self.__slots__:
+            setattr(self, name, sys.intern(getattr(self, name)))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # STYLED TEXT HELPERS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _theme_cached(func):
+    """Memoize a DreamText markup builder, keyed on the theme revision as well as its arguments."""
+
+    @lru_cache(maxsize=256)
+    def cached(cls, revision, *args, **kwargs):
+        return func(cls, *args, **kwargs)
+
+    @wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        try:
+            return cached(cls, theme_revision(), *args, **kwargs)
+        except TypeError:
+            # Unhashable arguments (e.g. a list label) skip the cache.
+            return func(cls, *args, **kwargs)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 class DreamText:
     """Helper class for creating themed text elements"""
     
@@ -251,6 +287,7 @@ class DreamText:
     deco = DreamDecorators()
     
     @classmethod
+    @_theme_cached
     def header(cls, text: str, level: int = 1) -> str:
         """Create a styled header"""
         colors = [
@@ -269,26 +306,31 @@ class DreamText:
             return f"[{color}]{cls.deco.DOT_MEDIUM} {text}[/{color}]"
     
     @classmethod
+    @_theme_cached
     def success(cls, text: str) -> str:
         """Success message"""
         return f"[bold {cls.theme.MINT_VIBRANT}]{cls.deco.CHECK_FANCY}[/bold {cls.theme.MINT_VIBRANT}] [{cls.theme.MINT_SOFT}]{text}[/{cls.theme.MINT_SOFT}]"
     
     @classmethod
+    @_theme_cached
     def error(cls, text: str) -> str:
         """Error message"""
         return f"[bold {cls.theme.CORAL_VIBRANT}]{cls.deco.CROSS_FANCY}[/bold {cls.theme.CORAL_VIBRANT}] [{cls.theme.CORAL_SOFT}]{text}[/{cls.theme.CORAL_SOFT}]"
     
     @classmethod
+    @_theme_cached
     def warning(cls, text: str) -> str:
         """Warning message"""
         return f"[bold {cls.theme.AMBER_GLOW}]![/bold {cls.theme.AMBER_GLOW}] [{cls.theme.PEACH_SOFT}]{text}[/{cls.theme.PEACH_SOFT}]"
     
     @classmethod
+    @_theme_cached
     def info(cls, text: str) -> str:
         """Info message"""
         return f"[{cls.theme.BLUE_SOFT}]{cls.deco.RHOMBUS}[/{cls.theme.BLUE_SOFT}] [{cls.theme.TEXT_SECONDARY}]{text}[/{cls.theme.TEXT_SECONDARY}]"
     
     @classmethod
+    @_theme_cached
     def dim(cls, text: str) -> str:
         """Dimmed/muted text"""
         return f"[dim {cls.theme.TEXT_DIM}]{text}[/dim {cls.theme.TEXT_DIM}]"
@@ -309,6 +351,7 @@ class DreamText:
         )
     
     @classmethod
+    @_theme_cached
     def tool_header(cls, tool_name: str) -> str:
         """Create a tool execution header"""
         return (
@@ -330,6 +373,7 @@ class DreamText:
         return f"[italic {cls.theme.THINKING_SOFT}]{text}[/italic {cls.theme.THINKING_SOFT}]"
     
     @classmethod
+    @_theme_cached
     def thinking_line(cls, text: str) -> str:
         """Format a single line of thinking content"""
         return (
@@ -350,19 +394,25 @@ class DreamText:
             return f"[{cls.theme.PURPLE_MEDIUM}]{cls.deco.LINE_HORIZONTAL * width}[/{cls.theme.PURPLE_MEDIUM}]"
     
     @classmethod
-    def gradient_text(cls, text: str, colors: List[str] = None) -> Text:
-        """Create gradient-colored text using Rich Text"""
+    def gradient_text(cls, text: str, colors: Sequence[Union[str, Style]] = None) -> Text:
+        """Create gradient-colored text using Rich Text (hex strings or pre-resolved Styles)"""
         if colors is None:
-            colors = cls.theme.get_gradient_pink_purple()
+            colors = GRADIENT_PINK_PURPLE_STYLES
         
         result = Text()
         text_len = len(text)
         color_len = len(colors)
+        if not text_len or not color_len:
+            return result
         
-        for i, char in enumerate(text):
-            color_idx = int((i / text_len) * color_len)
-            color_idx = min(color_idx, color_len - 1)
-            result.append(char, style=colors[color_idx])
+        # Character i takes color floor(i * color_len / text_len), so each color
+        # owns one contiguous band starting at ceil(c * text_len / color_len).
+        start = 0
+        for color_idx, color in enumerate(colors):
+            end = -(-(color_idx + 1) * text_len // color_len)
+            if end > start:
+                result.append(text[start:end], style=color)
+            start = end
         
         return result
 
@@ -422,6 +472,16 @@ _BASE_THEME_VALUES = {
     )
 }
 
+# Incremented by ``apply_theme`` so caches of pre-rendered markup can tell when
+# the shared palette or decorators have changed underneath them.
+_THEME_REVISION = 0
+
+
+def theme_revision() -> int:
+    """Return a counter that changes whenever a theme preset is applied."""
+    return _THEME_REVISION
+
+
 THEME_PRESETS = {
     "default": {},
     "dark": {
@@ -459,6 +519,7 @@ THEME_PRESETS = {
 
 def apply_theme(name: str) -> str:
     """Mutate the shared theme object so existing UI components update immediately."""
+    global _THEME_REVISION
     selected = str(name or "default").strip().lower()
     if selected not in THEME_PRESETS:
         selected = "default"
@@ -479,6 +540,8 @@ def apply_theme(name: str) -> str:
             "SEARCH": "?", "THOUGHT_BUBBLE": "",
         }
         for key, value in minimal_decorators.items():
+            value = sys.intern(value)
             setattr(DECO, key, value)
             setattr(DreamText.deco, key, value)
+    _THEME_REVISION += 1
     return selected
@@ -19,8 +19,9 @@ Features:
 
 import os
 import sys
-from typing import List, Dict, Optional, Callable, Any
-from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Callable, Any, NamedTuple
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 from rich.console import Console, Group
@@ -31,73 +32,144 @@ from rich.align import Align
 from rich.columns import Columns
 from rich import box
 
-from .theme import THEME, DECO
+from .theme import THEME, DECO, theme_revision
 
 
 _IS_WINDOWS = os.name == "nt"
 
+if _IS_WINDOWS:
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
+
+# Windows extended-key scan codes (after a 0x00/0xE0 prefix) as ANSI sequences.
+_WINDOWS_SCAN_CODES = {
+    b'H': b'\x1b[A',
+    b'P': b'\x1b[B',
+    b'M': b'\x1b[C',
+    b'K': b'\x1b[D',
+    b'I': b'\x1b[5~',
+    b'Q': b'\x1b[6~',
+    b'G': b'\x1b[H',
+    b'O': b'\x1b[F',
+}
+
+
+# How long to wait for the rest of an escape sequence after a bare ESC byte.
+_ESCAPE_FOLLOWUP_TIMEOUT = 0.05
+
+# True while ``_raw_terminal`` holds stdin in raw mode for a whole selector run.
+_RAW_SESSION_ACTIVE = False
+
+# DEC private mode 2026: terminals that support it hold the screen until the
+# end marker, so a repaint appears at once instead of tearing. Others ignore it.
+_SYNC_UPDATE_BEGIN = "\x1b[?2026h"
+_SYNC_UPDATE_END = "\x1b[?2026l"
+
+
+@contextmanager
+def _raw_terminal():
+    """
+    Keep POSIX stdin in raw mode for the duration of a selector run.
+
+    Output post-processing stays enabled so Rich's newlines still render
+    correctly. No-op on Windows, for non-tty stdin, or when already active.
+    """
+    global _RAW_SESSION_ACTIVE
+    if _IS_WINDOWS or _RAW_SESSION_ACTIVE or not sys.stdin.isatty():
+        yield
+        return
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd, termios.TCSANOW)
+        mode = termios.tcgetattr(fd)
+        mode[1] |= termios.OPOST
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        _RAW_SESSION_ACTIVE = True
+        yield
+    finally:
+        _RAW_SESSION_ACTIVE = False
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+@contextmanager
+def _synchronized_update(console: Console):
+    """
+    Emit one repaint as a single, atomically presented terminal write.
+
+    Rich output inside the block is buffered by the console and written once
+    on exit, bracketed by the synchronized-update markers. No-op for
+    non-terminal and legacy Windows consoles.
+    """
+    if not console.is_terminal or console.legacy_windows:
+        yield
+        return
+    console.file.write(_SYNC_UPDATE_BEGIN)
+    try:
+        with console:
+            yield
+    finally:
+        console.file.write(_SYNC_UPDATE_END)
+        console.file.flush()
+
 
 def _getch() -> bytes:
     if _IS_WINDOWS:
-        import msvcrt
         return msvcrt.getch()
     else:
-        import termios
-        import tty
+        # os.read takes exactly one byte from the kernel, so any remaining bytes
+        # of an escape sequence stay visible to select() in _kbhit.
         fd = sys.stdin.fileno()
+        if _RAW_SESSION_ACTIVE or not sys.stdin.isatty():
+            return os.read(fd, 1)
         old = termios.tcgetattr(fd)
         try:
             tty.setraw(fd)
-            ch = sys.stdin.buffer.read(1)
+            ch = os.read(fd, 1)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old)
         return ch
 
 
-def _kbhit() -> bool:
+def _kbhit(timeout: float = 0) -> bool:
     if _IS_WINDOWS:
-        import msvcrt
         return msvcrt.kbhit()
     else:
-        import select
-        return select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], [])
+        return bool(select.select([sys.stdin.fileno()], [], [], timeout)[0])
 
 
 def _read_key() -> bytes:
     if _IS_WINDOWS:
-        import msvcrt
         key = msvcrt.getch()
         if key in (b'\x00', b'\xe0'):
-            seq = msvcrt.getch()
-            if seq == b'H':
-                return b'\x1b[A'
-            elif seq == b'P':
-                return b'\x1b[B'
-            elif seq == b'M':
-                return b'\x1b[C'
-            elif seq == b'K':
-                return b'\x1b[D'
-            elif seq == b'I':
-                return b'\x1b[5~'
-            elif seq == b'Q':
-                return b'\x1b[6~'
-            elif seq == b'G':
-                return b'\x1b[H'
-            elif seq == b'O':
-                return b'\x1b[F'
-            return key
+            return _WINDOWS_SCAN_CODES.get(msvcrt.getch(), key)
         return key
     else:
         ch = _getch()
         if ch == b'\x1b':
-            seq = ch
-            if _kbhit():
-                for _ in range(2):
-                    seq += _getch()
-            return seq
+            return _read_escape_sequence()
         return ch
 
 
+def _read_escape_sequence() -> bytes:
+    """Collect a full CSI/SS3 sequence after ESC; a lone ESC is returned as-is."""
+    if not _kbhit(_ESCAPE_FOLLOWUP_TIMEOUT):
+        return b'\x1b'
+    introducer = _getch()
+    if introducer not in (b'[', b'O'):
+        return b'\x1b' + introducer
+    seq = b'\x1b['
+    while _kbhit(_ESCAPE_FOLLOWUP_TIMEOUT):
+        ch = _getch()
+        seq += ch
+        if ch.isalpha() or ch == b'~':
+            break
+    return seq
+
+
 class SelectorAction(Enum):
     """Actions that can be performed in the selector"""
     SELECT = auto()
@@ -111,20 +183,32 @@ class SelectorAction(Enum):
     END = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectorItem:
     """An item in the selector"""
     id: str
     title: str
     description: str = ""
     metadata: Dict = None
+    # Lowercased search text, built on first use and reused by every selector
+    # that shows this item.
+    _search_blob: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.metadata is None:
             self.metadata = {}
 
 
-@dataclass
+class CheckpointRow(NamedTuple):
+    """A checkpoint prepared for ``CheckpointSelector``."""
+    id: str
+    description: str
+    created_at: str
+    message_count: int
+    checkpoint: Any = None
+
+
+@dataclass(slots=True)
 class SelectorResult:
     """Result of selector interaction"""
     action: SelectorAction
@@ -166,26 +250,38 @@ class TUISelector:
         self.scroll_offset = 0
         self.search_query = ""
         self.is_searching = False
-        self.filtered_items = items.copy()
-        self._search_index = [self._build_search_blob(item) for item in self.items]
+        # Aliases ``items`` while no query is active; only ever replaced, never mutated.
+        self.filtered_items = items
+        # Built on the first search so opening a long list does not format and
+        # lowercase every item up front.
+        self._search_index_cache: Optional[List[str]] = None
+        # Last filtered query and the item positions it matched. Substring
+        # matches only shrink as the query grows, so a longer query that
+        # contains the previous one only re-checks the previous matches.
+        self._matched_query = ""
+        self._matched_indices: List[int] = []
         self._render_cache_key = None
         self._render_cache = None
-
-    def _console_width(self) -> int:
-        """Best-effort terminal width."""
+        # Options panel for the current scroll window, its per-row cells and the
+        # index currently painted as selected, so cursor moves inside the window
+        # only restyle the rows that changed.
+        self._list_panel_key = None
+        self._list_panel_cache: Optional[Panel] = None
+        self._list_row_cells: List[List[Text]] = []
+        self._painted_index: Optional[int] = None
+        # Row cells are pooled per visible slot and refilled when the window
+        # scrolls, instead of allocating fresh Text objects for every row.
+        self._row_cell_pool: List[List[Text]] = []
+
+    def _console_dimensions(self) -> tuple[int, int]:
+        """Best-effort (width, height) from a single terminal size query."""
         try:
-            width = int(getattr(self.console.size, "width", 0) or self.console.width or 0)
+            size = self.console.size
+            width = int(getattr(size, "width", 0) or self.console.width or 0)
+            height = int(getattr(size, "height", 0) or 0)
         except Exception:
-            width = 0
-        return max(width, 60)
-
-    def _console_height(self) -> int:
-        """Best-effort terminal height."""
-        try:
-            height = int(getattr(self.console.size, "height", 0) or 0)
-        except Exception:
-            height = 0
-        return max(height, 20)
+            width, height = 0, 0
+        return max(width, 60), max(height, 20)
 
     def _truncate(self, value: str, max_length: int) -> str:
         """Trim long selector fields for narrow terminals."""
@@ -196,8 +292,28 @@ class TUISelector:
             return text[:max_length]
         return f"{text[:max_length - 3]}..."
 
+    @property
+    def _search_index(self) -> List[str]:
+        if self._search_index_cache is None:
+            self._search_index_cache = [self._item_search_blob(item) for item in self.items]
+        return self._search_index_cache
+
+    def _item_description(self, item: SelectorItem) -> str:
+        """
+        Return the description shown for an item.
+        
+        Specialized selectors override this to format the text from
+        ``item.metadata`` the first time the item is displayed or searched.
+        """
+        return item.description
+
+    def _item_search_blob(self, item: SelectorItem) -> str:
+        if item._search_blob is None:
+            item._search_blob = self._build_search_blob(item)
+        return item._search_blob
+
     def _build_search_blob(self, item: SelectorItem) -> str:
-        parts = [item.id, item.title, item.description]
+        parts = [item.id, item.title, self._item_description(item)]
         metadata = item.metadata or {}
         for key, value in metadata.items():
             if isinstance(value, dict):
@@ -210,9 +326,10 @@ class TUISelector:
                 parts.append(str(key))
         return " ".join(part.lower() for part in parts if str(part).strip())
 
-    def _visible_rows(self) -> int:
-        reserve = 15 if self._console_width() >= 110 else 18
-        return max(6, min(18, self._console_height() - reserve))
+    def _visible_rows(self, dimensions: Optional[tuple[int, int]] = None) -> int:
+        width, height = dimensions or self._console_dimensions()
+        reserve = 15 if width >= 110 else 18
+        return max(6, min(18, height - reserve))
 
     def _selected_item(self) -> Optional[SelectorItem]:
         if not self.filtered_items:
@@ -228,7 +345,7 @@ class TUISelector:
             return [Text("No item selected.", style=self.theme.TEXT_DIM)]
 
         lines = [Text(item.title, style=f"bold {self.theme.PURPLE_SOFT}")]
-        description = str(item.description or "").strip()
+        description = str(self._item_description(item) or "").strip()
         if description:
             lines.append(Text(description, style=self.theme.TEXT_SECONDARY))
 
@@ -282,7 +399,7 @@ class TUISelector:
         content = self._build_content()
         use_alt_screen = bool(getattr(self.console, "is_terminal", False))
         
-        with Live(
+        with _raw_terminal(), Live(
             content,
             console=self.console,
             auto_refresh=False,
@@ -290,10 +407,13 @@ class TUISelector:
             transient=use_alt_screen,
             vertical_overflow="crop",
         ) as live:
-            last_size = (self._console_width(), self._console_height())
+            last_size = self._console_dimensions()
+            pending_key: Optional[bytes] = None
             while True:
-                key = _read_key()
+                key = pending_key if pending_key is not None else _read_key()
+                pending_key = None
                 state_changed = False
+                view_before = self._view_state()
 
                 # Escape sequences (Linux) or function key prefix (Windows)
                 if key == b'\x1b[A':  # Up arrow
@@ -330,9 +450,7 @@ class TUISelector:
                         if self.is_searching:
                             self.is_searching = False
                             self.search_query = ""
-                            self.filtered_items = self.items.copy()
-                            self.selected_index = 0
-                            self.scroll_offset = 0
+                            self._apply_search()
                             state_changed = True
 
                 elif key == b'/':  # Slash to start search
@@ -345,6 +463,7 @@ class TUISelector:
                     if key == b'\x7f' or key == b'\x08':  # Backspace
                         if self.search_query:
                             self.search_query = self.search_query[:-1]
+                            pending_key = self._absorb_pending_search_keys()
                             self._apply_search()
                             state_changed = True
                         else:
@@ -352,6 +471,7 @@ class TUISelector:
                             state_changed = True
                     elif len(key) == 1 and 32 <= key[0] <= 126:  # Printable characters
                         self.search_query += key.decode('ascii', errors='replace')
+                        pending_key = self._absorb_pending_search_keys()
                         self._apply_search()
                         state_changed = True
 
@@ -368,13 +488,49 @@ class TUISelector:
                     self._go_end()
                     state_changed = True
 
-                current_size = (self._console_width(), self._console_height())
+                # Keys that hit a boundary (Up on the first row, Home at the top,
+                # a search edit that yields the same matches) leave nothing to repaint.
+                if state_changed and self._view_state() == view_before:
+                    state_changed = False
+
+                current_size = self._console_dimensions()
                 if current_size != last_size:
                     last_size = current_size
                     state_changed = True
 
                 if state_changed:
-                    live.update(self._build_content(), refresh=True)
+                    with _synchronized_update(self.console):
+                        live.update(self._build_content(), refresh=True)
+    
+    def _view_state(self) -> tuple:
+        """Everything the rendered frame depends on besides terminal size and theme."""
+        return (
+            self.selected_index,
+            self.scroll_offset,
+            self.search_query,
+            self.is_searching,
+            self.filtered_items,
+        )
+
+    def _absorb_pending_search_keys(self) -> Optional[bytes]:
+        """
+        Fold search keystrokes already waiting in the input buffer into the query.
+        
+        Pastes and fast typing then cost one filter pass and one repaint instead
+        of one per character. Returns the first key that is not a search edit so
+        the main loop can dispatch it normally.
+        """
+        while _kbhit():
+            key = _read_key()
+            if key == b'\x7f' or key == b'\x08':
+                if not self.search_query:
+                    return key
+                self.search_query = self.search_query[:-1]
+            elif len(key) == 1 and 32 <= key[0] <= 126 and key != b'/':
+                self.search_query += key.decode('ascii', errors='replace')
+            else:
+                return key
+        return None
     
     def _navigate_up(self) -> None:
         """Navigate up in the list"""
@@ -439,13 +595,19 @@ class TUISelector:
     def _apply_search(self) -> None:
         """Apply search filter"""
         if not self.search_query:
-            self.filtered_items = self.items.copy()
+            self.filtered_items = self.items
+            self._matched_query = ""
+            self._matched_indices = []
         else:
             query = self.search_query.lower()
-            self.filtered_items = [
-                item for item, search_blob in zip(self.items, self._search_index)
-                if query in search_blob
-            ]
+            if self._matched_query and self._matched_query in query:
+                candidates = self._matched_indices
+            else:
+                candidates = range(len(self.items))
+            search_index = self._search_index
+            self._matched_indices = [i for i in candidates if query in search_index[i]]
+            self._matched_query = query
+            self.filtered_items = [self.items[i] for i in self._matched_indices]
         
         self.selected_index = 0
         self.scroll_offset = 0
@@ -454,14 +616,14 @@ class TUISelector:
     
     def _build_content(self) -> Align:
         """Build the complete content for display."""
-        width = self._console_width()
-        height = self._console_height()
+        width, height = self._console_dimensions()
         compact = width < 96
         wide = width >= 116
         show_description = self.show_descriptions and width >= 92
-        self.max_visible = self._visible_rows()
+        self.max_visible = self._visible_rows((width, height))
         selected_item = self._selected_item()
         cache_key = (
+            theme_revision(),
             width,
             height,
             self.selected_index,
@@ -506,48 +668,12 @@ class TUISelector:
                 box=box.ROUNDED,
             )
 
-        table = Table(
-            show_header=False,
-            box=box.SIMPLE_HEAVY,
-            border_style=self.theme.BORDER_SECONDARY,
-            padding=(0, 1),
-            show_lines=False,
-            expand=True,
-        )
-        table.add_column("indicator", width=3, no_wrap=True)
-        table.add_column("index", width=4, style=self.theme.TEXT_DIM, justify="right", no_wrap=True)
-        table.add_column("title", style=self.theme.TEXT_PRIMARY)
-        if show_description:
-            table.add_column("description", style=self.theme.TEXT_SECONDARY)
-
         end_index = min(self.scroll_offset + self.max_visible, len(self.filtered_items))
         visible_items = self.filtered_items[self.scroll_offset:end_index]
 
-        for i, item in enumerate(visible_items):
-            actual_index = self.scroll_offset + i
-            is_selected = actual_index == self.selected_index
-            indicator = Text(f"{self.deco.CHEVRON_RIGHT}", style=f"bold {self.theme.PINK_SOFT}") if is_selected else Text("  ")
-            title_style = f"bold {self.theme.BLUE_SOFT} on {self.theme.PURPLE_DEEP}" if is_selected else self.theme.TEXT_PRIMARY
-            title_text = Text(self._truncate(item.title, 30 if compact else 48), style=title_style)
-            row_index = Text(f"{actual_index + 1}.", style=self.theme.TEXT_DIM)
-
-            if show_description:
-                desc_style = self.theme.TEXT_SECONDARY if is_selected else self.theme.TEXT_DIM
-                desc_text = Text(self._truncate(item.description, 34 if compact else 62), style=desc_style)
-                table.add_row(indicator, row_index, title_text, desc_text)
-            else:
-                table.add_row(indicator, row_index, title_text)
-
         content_parts = [title_panel]
         if visible_items:
-            list_panel = Panel(
-                table,
-                title=f"[bold {self.theme.BLUE_SOFT}]Options[/bold {self.theme.BLUE_SOFT}]",
-                subtitle=f"[{self.theme.TEXT_DIM}]Visible {self.scroll_offset + 1}-{end_index} / {len(self.filtered_items)}[/{self.theme.TEXT_DIM}]",
-                border_style=self.theme.BORDER_SUBTLE,
-                box=box.ROUNDED,
-                padding=(0, 1),
-            )
+            list_panel = self._build_list_panel(visible_items, end_index, compact=compact, show_description=show_description)
             detail_panel = self._build_detail_panel(selected_item, compact=compact)
             body = Columns([list_panel, detail_panel], expand=True, equal=False) if wide else Group(list_panel, detail_panel)
             content_parts.extend(["", body])
@@ -596,6 +722,94 @@ class TUISelector:
         self._render_cache = renderable
         return renderable
 
+    def _build_list_panel(
+        self,
+        visible_items: List[SelectorItem],
+        end_index: int,
+        *,
+        compact: bool,
+        show_description: bool,
+    ) -> Panel:
+        """
+        Return the options panel for the visible window.
+        
+        The table is rebuilt only when the window itself changes (scroll,
+        filter, layout or theme). Moving the cursor inside the window restyles
+        the previously and newly selected rows in place.
+        """
+        key = (
+            theme_revision(),
+            compact,
+            show_description,
+            self.scroll_offset,
+            len(self.filtered_items),
+            tuple(map(id, visible_items)),
+        )
+        if key != self._list_panel_key or self._list_panel_cache is None:
+            table = Table(
+                show_header=False,
+                box=box.SIMPLE_HEAVY,
+                border_style=self.theme.BORDER_SECONDARY,
+                padding=(0, 1),
+                show_lines=False,
+                expand=True,
+            )
+            table.add_column("indicator", width=3, no_wrap=True)
+            table.add_column("index", width=4, style=self.theme.TEXT_DIM, justify="right", no_wrap=True)
+            table.add_column("title", style=self.theme.TEXT_PRIMARY)
+            if show_description:
+                table.add_column("description", style=self.theme.TEXT_SECONDARY)
+
+            pool = self._row_cell_pool
+            while len(pool) < len(visible_items):
+                pool.append([Text(), Text(), Text(), Text()])
+            rows = pool[:len(visible_items)]
+            for i, (item, cells) in enumerate(zip(visible_items, rows)):
+                indicator, row_index, title, description = cells
+                indicator.plain, indicator.style = "  ", ""
+                row_index.plain, row_index.style = f"{self.scroll_offset + i + 1}.", self.theme.TEXT_DIM
+                title.plain, title.style = self._truncate(item.title, 30 if compact else 48), self.theme.TEXT_PRIMARY
+                if show_description:
+                    description.plain = self._truncate(self._item_description(item), 34 if compact else 62)
+                    description.style = self.theme.TEXT_DIM
+                    table.add_row(indicator, row_index, title, description)
+                else:
+                    table.add_row(indicator, row_index, title)
+
+            self._list_panel_cache = Panel(
+                table,
+                title=f"[bold {self.theme.BLUE_SOFT}]Options[/bold {self.theme.BLUE_SOFT}]",
+                subtitle=f"[{self.theme.TEXT_DIM}]Visible {self.scroll_offset + 1}-{end_index} / {len(self.filtered_items)}[/{self.theme.TEXT_DIM}]",
+                border_style=self.theme.BORDER_SUBTLE,
+                box=box.ROUNDED,
+                padding=(0, 1),
+            )
+            self._list_panel_key = key
+            self._list_row_cells = rows
+            self._painted_index = None
+
+        if self._painted_index != self.selected_index:
+            if self._painted_index is not None:
+                self._style_row(self._painted_index - self.scroll_offset, selected=False)
+            self._style_row(self.selected_index - self.scroll_offset, selected=True)
+            self._painted_index = self.selected_index
+        return self._list_panel_cache
+
+    def _style_row(self, slot: int, *, selected: bool) -> None:
+        """Apply the selected or idle look to one visible row's cells."""
+        if not 0 <= slot < len(self._list_row_cells):
+            return
+        indicator, _, title, description = self._list_row_cells[slot]
+        if selected:
+            indicator.plain = self.deco.CHEVRON_RIGHT
+            indicator.style = f"bold {self.theme.PINK_SOFT}"
+            title.style = f"bold {self.theme.BLUE_SOFT} on {self.theme.PURPLE_DEEP}"
+        else:
+            indicator.plain = "  "
+            indicator.style = ""
+            title.style = self.theme.TEXT_PRIMARY
+        description.style = self.theme.TEXT_SECONDARY if selected else self.theme.TEXT_DIM
+
     def _render(self) -> None:
         """Render the selector UI (deprecated, use _build_content with Live)"""
         # This method is kept for backward compatibility but should not be used
@@ -700,17 +914,11 @@ class SettingsSelector(TUISelector):
         settings: List[Dict[str, Any]],
         current_values: Dict[str, Any]
     ):
-        items = []
-        for setting in settings:
-            current_value = current_values.get(setting['key'], setting.get('default', ''))
-            description = f"Current: {current_value}"
-            
-            items.append(SelectorItem(
-                id=setting['key'],
-                title=setting['name'],
-                description=description,
-                metadata=setting
-            ))
+        self._current_values = current_values
+        items = [
+            SelectorItem(id=setting['key'], title=setting['name'], metadata=setting)
+            for setting in settings
+        ]
         
         super().__init__(
             console=console,
@@ -722,6 +930,13 @@ class SettingsSelector(TUISelector):
         )
 
 
+    def _item_description(self, item: SelectorItem) -> str:
+        if not item.description:
+            setting = item.metadata
+            item.description = f"Current: {self._current_values.get(setting['key'], setting.get('default', ''))}"
+        return item.description
+
+
 class SessionSelector(TUISelector):
     """Specialized selector for session selection"""
     
@@ -734,15 +949,7 @@ class SessionSelector(TUISelector):
         items = []
         current_index = 0
         for session in sessions:
-            created_at = session.get('created_at', '')
-            message_count = session.get('message_count', 0)
-            description = f"{created_at} | {message_count} messages"
-            items.append(SelectorItem(
-                id=session['id'],
-                title=session['name'],
-                description=description,
-                metadata=session
-            ))
+            items.append(SelectorItem(id=session['id'], title=session['name'], metadata=session))
             if current_session and session['id'] == current_session:
                 current_index = len(items) - 1
         
@@ -757,6 +964,12 @@ class SessionSelector(TUISelector):
         self.selected_index = current_index
         self.scroll_offset = max(0, self.selected_index - self.max_visible + 1)
 
+    def _item_description(self, item: SelectorItem) -> str:
+        if not item.description:
+            session = item.metadata
+            item.description = f"{session.get('created_at', '')} | {session.get('message_count', 0)} messages"
+        return item.description
+
 
 class CheckpointSelector(TUISelector):
     """Specialized selector for checkpoint selection"""
@@ -764,23 +977,18 @@ class CheckpointSelector(TUISelector):
     def __init__(
         self,
         console: Console,
-        checkpoints: List[Dict[str, Any]],
+        checkpoints: List[CheckpointRow],
         file_path: Optional[str] = None
     ):
-        items = []
-        for checkpoint in checkpoints:
-            created_at = checkpoint.get('created_at', '')
-            description = f"Created: {created_at}"
-            
-            if file_path:
-                description += f" • File: {file_path}"
-            
-            items.append(SelectorItem(
-                id=checkpoint['id'],
-                title=checkpoint.get('description', 'Checkpoint'),
-                description=description,
-                metadata=checkpoint
-            ))
+        self._file_suffix = f" • File: {file_path}" if file_path else ""
+        items = [
+            SelectorItem(
+                id=checkpoint.id,
+                title=checkpoint.description or 'Checkpoint',
+                metadata=checkpoint._asdict()
+            )
+            for checkpoint in checkpoints
+        ]
         
         title = f"Select Checkpoint for {file_path}" if file_path else "Select Checkpoint"
         
@@ -792,3 +1000,8 @@ class CheckpointSelector(TUISelector):
             allow_cancel=True,
             show_descriptions=True
         )
+
+    def _item_description(self, item: SelectorItem) -> str:
+        if not item.description:
+            item.description = f"Created: {item.metadata['created_at']}{self._file_suffix}"
+        return item.description
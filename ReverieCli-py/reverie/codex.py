@@ -9,6 +9,7 @@ This module centralizes:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import json
@@ -237,7 +238,31 @@ def _effective_context_length(raw_context_window: Any, effective_percent: Any) -
 
 def _iter_local_codex_source_model_paths() -> List[Path]:
     """Search common repo-relative locations for a downloaded Codex source tree."""
-    candidates: List[Path] = []
+    return [candidate for _, candidate in _local_codex_source_candidates()]
+
+
+def _local_codex_source_candidates() -> Tuple[Tuple[Path, Path], ...]:
+    return _local_codex_source_model_paths(
+        __file__,
+        os.getcwd(),
+        sys.argv[0] if sys.argv else None,
+        sys.executable or None,
+    )
+
+
+@lru_cache(maxsize=8)
+def _local_codex_source_model_paths(
+    module_file: str,
+    cwd_text: str,
+    argv0: Optional[str],
+    executable: Optional[str],
+) -> Tuple[Tuple[Path, Path], ...]:
+    """
+    (top-level directory, candidate) pairs for the given process location.
+
+    Every config load/save walks these, so they are built once per location.
+    """
+    candidates: List[Tuple[Path, Path]] = []
     seen = set()
 
     def add_candidate(root: Optional[Path], relative_path: Tuple[str, ...]) -> None:
@@ -252,7 +277,7 @@ def _iter_local_codex_source_model_paths() -> List[Path]:
         if key in seen:
             return
         seen.add(key)
-        candidates.append(candidate)
+        candidates.append((resolved_root / relative_path[0], candidate))
 
     def iter_roots(root: Optional[Path]) -> List[Path]:
         if root is None:
@@ -269,10 +294,10 @@ def _iter_local_codex_source_model_paths() -> List[Path]:
             current = current.parent
         return roots
 
-    module_root = Path(__file__).resolve().parent.parent
-    cwd = Path.cwd()
-    argv_root = Path(sys.argv[0]).resolve(strict=False).parent if sys.argv else None
-    executable_root = Path(sys.executable).resolve(strict=False).parent if sys.executable else None
+    module_root = Path(module_file).resolve().parent.parent
+    cwd = Path(cwd_text)
+    argv_root = Path(argv0).resolve(strict=False).parent if argv0 is not None else None
+    executable_root = Path(executable).resolve(strict=False).parent if executable else None
 
     roots = (
         module_root,
@@ -287,12 +312,24 @@ def _iter_local_codex_source_model_paths() -> List[Path]:
         for candidate_root in iter_roots(root):
             for relative_path in _CODEX_LOCAL_SOURCE_MODELS_RELATIVE_PATHS:
                 add_candidate(candidate_root, relative_path)
-    return candidates
+    return tuple(candidates)
+
+
+def _find_local_codex_source_model_path() -> Optional[Path]:
+    """Return the first existing candidate, skipping roots without a `references/` tree in one stat."""
+    present: Dict[Path, bool] = {}
+    for top_dir, candidate in _local_codex_source_candidates():
+        has_top_dir = present.get(top_dir)
+        if has_top_dir is None:
+            has_top_dir = present[top_dir] = top_dir.is_dir()
+        if has_top_dir and candidate.exists():
+            return candidate
+    return None
 
 
 def _load_local_codex_source_catalog(errors: List[str]) -> List[Dict[str, Any]]:
     """Load model definitions from the downloaded Codex source tree when available."""
-    path = next((candidate for candidate in _iter_local_codex_source_model_paths() if candidate.exists()), None)
+    path = _find_local_codex_source_model_path()
     if path is None:
         return []
 
@@ -11,6 +11,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+import codecs
 import json
 import os
 import sys
@@ -18,8 +21,13 @@ import hashlib
 import re
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from .diagnostics import report_suppressed_exception
-from .security_utils import write_json_secure
+from .security_utils import encode_json_document, write_json_secure
 from .security_policy import normalize_permission_level
 from .storage import (
     ProjectStorageResolver,
@@ -75,6 +83,8 @@ from .webgemini import (
 from .modes import normalize_mode
 from .version import CONFIG_VERSION, __version__
 
+logger = logging.getLogger(__name__)
+
 EXTERNAL_MODEL_SOURCES = ("codex", "aihubmix", "agnes", "sensenova", "nvidia", "modelscope", "webgemini", "opencode")
 SUPPORTED_ACTIVE_MODEL_SOURCES = ("standard",) + EXTERNAL_MODEL_SOURCES
 MODEL_SOURCE_DISPLAY_NAMES = {
@@ -101,24 +111,29 @@ SUPPORTED_MODEL_PROVIDERS = (
     "codex",
     "webgemini",
 )
+_MODEL_PROVIDER_ALIASES = {
+    "openai": "openai-chat",
+    "openai-old": "openai-chat",
+    "openai-sdk": "openai-chat",
+    "openai-chat.completions": "openai-chat",
+    "openai-chat-completions": "openai-chat",
+    "chat.completions": "openai-chat",
+    "chat-completions": "openai-chat",
+    "openai-res": "openai-responses",
+    "openai-response": "openai-responses",
+    "responses": "openai-responses",
+}
+_ACTIVE_MODEL_SOURCE_ALIASES = {
+    "oc": "opencode",
+}
+# Provider sub-sections of `text_to_image` that are merged over their defaults.
+_TTI_PROVIDER_SECTIONS = ("aihubmix", "pollinations", "agnes", "sensenova")
 
 
 def normalize_model_provider(value: Any, default: str = "openai-chat") -> str:
     """Normalize persisted model transport names to one stable spelling."""
     candidate = str(value or "").strip().lower().replace("_", "-")
-    aliases = {
-        "openai": "openai-chat",
-        "openai-old": "openai-chat",
-        "openai-sdk": "openai-chat",
-        "openai-chat.completions": "openai-chat",
-        "openai-chat-completions": "openai-chat",
-        "chat.completions": "openai-chat",
-        "chat-completions": "openai-chat",
-        "openai-res": "openai-responses",
-        "openai-response": "openai-responses",
-        "responses": "openai-responses",
-    }
-    candidate = aliases.get(candidate, candidate)
+    candidate = _MODEL_PROVIDER_ALIASES.get(candidate, candidate)
     if candidate in SUPPORTED_MODEL_PROVIDERS:
         return candidate
     return default
@@ -136,10 +151,7 @@ def is_config_version_older(value: Any, target: str = CONFIG_VERSION) -> bool:
 def normalize_active_model_source(value: Any, default: str = "standard") -> str:
     """Normalize the persisted chat model source selector."""
     candidate = str(value or "").strip().lower().replace("-", "_")
-    aliases = {
-        "oc": "opencode",
-    }
-    candidate = aliases.get(candidate, candidate)
+    candidate = _ACTIVE_MODEL_SOURCE_ALIASES.get(candidate, candidate)
     if candidate in SUPPORTED_ACTIVE_MODEL_SOURCES:
         return candidate
     return default
@@ -167,6 +179,21 @@ def normalize_thinking_output_style(value: Any, default: str = "full") -> str:
     return default
 
 
+_UTF8_BOM = codecs.BOM_UTF8
+
+
+def _parse_json_text(raw_text: str) -> Any:
+    """Parse JSON with orjson when available, deferring to json for anything it rejects."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_text)
+        except orjson.JSONDecodeError:
+            # json accepts a few inputs orjson does not (NaN, huge integers) and
+            # produces the error positions the repair path reports.
+            pass
+    return json.loads(raw_text)
+
+
 def _escape_invalid_json_string_control_chars(raw: str) -> tuple[str, bool]:
     """Escape literal control characters that appear inside JSON strings."""
     if not raw:
@@ -219,27 +246,45 @@ def _escape_invalid_json_string_control_chars(raw: str) -> tuple[str, bool]:
 
 def _resolve_runner_root() -> Path:
     """Return the physical launcher root: exe dir, script dir, or source root."""
-    if getattr(sys, 'frozen', False):
-        return Path(sys.executable).resolve().parent
+    runner_root = _probe_runner_root(
+        bool(getattr(sys, 'frozen', False)),
+        sys.executable,
+        sys.argv[0] if sys.argv else "",
+        __file__,
+    )
+    return runner_root if runner_root is not None else Path.cwd()
+
+
+@lru_cache(maxsize=8)
+def _probe_runner_root(frozen: bool, executable: str, argv0: str, module_file: str) -> Optional[Path]:
+    """
+    Filesystem probing behind `_resolve_runner_root`.
 
-    if sys.argv and sys.argv[0]:
+    The launcher location cannot change while the process runs, so the stat
+    calls are done once per distinct set of inputs. A relative `argv0` is
+    taken against the working directory of the first lookup, i.e. startup.
+    """
+    if frozen:
+        return Path(executable).resolve().parent
+
+    if argv0:
         try:
-            exec_path = Path(os.path.abspath(sys.argv[0])).resolve()
+            exec_path = Path(os.path.abspath(argv0)).resolve()
             if exec_path.name == '__main__.py':
                 return exec_path.parent.parent
-            if exec_path.exists() and exec_path.is_file():
+            if exec_path.is_file():
                 return exec_path.parent
         except Exception:
             report_suppressed_exception("resolve launcher path from argv")
 
     try:
-        source_root = Path(__file__).resolve().parent.parent
+        source_root = Path(module_file).resolve().parent.parent
         if (source_root / 'reverie').exists():
             return source_root
     except Exception:
         report_suppressed_exception("resolve launcher source root")
 
-    return Path.cwd()
+    return None
 
 
 def get_launcher_root() -> Path:
@@ -327,52 +372,64 @@ def default_text_to_video_config() -> Dict[str, Any]:
         },
     }
 
+
+# Shared, read-only defaults for the mode sections. The factories hand out
+# shallow copies (mappingproxy.copy() is a plain dict copy); list values are
+# stored as tuples and copied back to lists.
+_WRITER_MODE_DEFAULTS = MappingProxyType({
+    "memory_system_enabled": True,
+    "auto_consistency_check": True,
+    "auto_character_tracking": True,
+    "max_chapter_context_window": 5,
+    "narrative_analysis_enabled": True,
+    "emotion_tracking_enabled": True,
+    "plot_tracking_enabled": True,
+})
+_GAMER_MODE_DEFAULTS = MappingProxyType({
+    "target_engine": "reverie_engine",
+    "supported_dimensions": ("2D", "2.5D", "3D"),
+    "supported_engines": ("reverie_engine", "custom", "web", "pygame", "love2d", "cocos2d", "godot", "o3de"),
+    "supported_frameworks": (
+        "reverie_engine", "phaser", "pixijs", "threejs", "pygame", "love2d", "cocos2d", "godot", "o3de"
+    ),
+    "asset_tracking_enabled": True,
+    "asset_packaging_enabled": True,
+    "game_balance_analysis": True,
+    "math_simulation_enabled": True,
+    "statistics_tools_enabled": True,
+    "gdd_required": True,
+    "story_design_enabled": True,
+    "rpg_focus_enabled": True,
+    "level_design_assistant": True,
+    "config_editing_enabled": True,
+    "modeling_pipeline_enabled": True,
+    "modeling_tools_enabled": True,
+    "blender_modeling_enabled": True,
+    "blender_path": "",
+    "blender_default_export_format": "glb",
+    "blender_timeout_seconds": 240,
+    "ashfox_server_name": "ashfox",
+    "ashfox_endpoint": "http://127.0.0.1:8787/mcp",
+    "proactive_mode_switching": True,
+    "mandatory_verification_loop": True,
+    "playtest_iteration_enabled": True,
+    "max_asset_context_window": 10,
+    "context_compression_enabled": True,
+})
+
+
 def default_writer_mode_config() -> Dict[str, Any]:
     """Default configuration for writer mode."""
-    return {
-        "memory_system_enabled": True,
-        "auto_consistency_check": True,
-        "auto_character_tracking": True,
-        "max_chapter_context_window": 5,
-        "narrative_analysis_enabled": True,
-        "emotion_tracking_enabled": True,
-        "plot_tracking_enabled": True,
-    }
+    return _WRITER_MODE_DEFAULTS.copy()
 
 
 def default_gamer_mode_config() -> Dict[str, Any]:
     """Default configuration for gamer mode."""
-    return {
-        "target_engine": "reverie_engine",
-        "supported_dimensions": ["2D", "2.5D", "3D"],
-        "supported_engines": ["reverie_engine", "custom", "web", "pygame", "love2d", "cocos2d", "godot", "o3de"],
-        "supported_frameworks": [
-            "reverie_engine", "phaser", "pixijs", "threejs", "pygame", "love2d", "cocos2d", "godot", "o3de"
-        ],
-        "asset_tracking_enabled": True,
-        "asset_packaging_enabled": True,
-        "game_balance_analysis": True,
-        "math_simulation_enabled": True,
-        "statistics_tools_enabled": True,
-        "gdd_required": True,
-        "story_design_enabled": True,
-        "rpg_focus_enabled": True,
-        "level_design_assistant": True,
-        "config_editing_enabled": True,
-        "modeling_pipeline_enabled": True,
-        "modeling_tools_enabled": True,
-        "blender_modeling_enabled": True,
-        "blender_path": "",
-        "blender_default_export_format": "glb",
-        "blender_timeout_seconds": 240,
-        "ashfox_server_name": "ashfox",
-        "ashfox_endpoint": "http://127.0.0.1:8787/mcp",
-        "proactive_mode_switching": True,
-        "mandatory_verification_loop": True,
-        "playtest_iteration_enabled": True,
-        "max_asset_context_window": 10,
-        "context_compression_enabled": True,
-    }
+    config = _GAMER_MODE_DEFAULTS.copy()
+    config["supported_dimensions"] = list(config["supported_dimensions"])
+    config["supported_engines"] = list(config["supported_engines"])
+    config["supported_frameworks"] = list(config["supported_frameworks"])
+    return config
 
 
 _SUBAGENT_COLOR_PALETTE = (
@@ -724,16 +781,42 @@ def get_app_root() -> Path:
     builds. Source-checkout runs use the local `dist/` depot so the repository
     root is not polluted with a top-level `.reverie` directory.
     """
-    env_root = os.getenv("REVERIE_APP_ROOT")
+    return _app_root(
+        os.getenv("REVERIE_APP_ROOT") or "",
+        bool(getattr(sys, "frozen", False)),
+        get_launcher_root(),
+        __file__,
+    )
+
+
+@lru_cache(maxsize=8)
+def _app_root(env_root: str, frozen: bool, launcher_root: Path, module_file: str) -> Path:
+    """Resolution behind `get_app_root`, done once per distinct set of inputs."""
     if env_root:
-        return Path(env_root).expanduser().resolve()
+        return Path(env_root).expanduser().absolute().resolve()
 
-    launcher_root = get_launcher_root().resolve()
-    if getattr(sys, "frozen", False):
+    launcher_root = launcher_root.absolute().resolve()
+    if frozen:
         return launcher_root
 
+    return _source_checkout_app_root(module_file) or launcher_root
+
+
+def _clear_app_root_cache() -> None:
+    """Forget memoized launcher/app roots (tests that relocate the app)."""
+    _app_root.cache_clear()
+    _source_checkout_app_root.cache_clear()
+    _probe_runner_root.cache_clear()
+
+
+get_app_root.cache_clear = _clear_app_root_cache
+
+
+@lru_cache(maxsize=8)
+def _source_checkout_app_root(module_file: str) -> Optional[Path]:
+    """Return the `dist/` depot for source-checkout runs, or None when packaged/installed."""
     try:
-        source_root = Path(__file__).resolve().parent.parent
+        source_root = Path(module_file).resolve().parent.parent
         repo_root = source_root
         if source_root.name.lower() == "reveriecli-py" and (source_root.parent / ".git").exists():
             repo_root = source_root.parent
@@ -751,7 +834,7 @@ def get_app_root() -> Path:
     except Exception:
         report_suppressed_exception("resolve source-checkout application root")
 
-    return launcher_root
+    return None
 
 
 def get_computer_controller_data_dir(app_root: Optional[Path] = None) -> Path:
@@ -766,6 +849,13 @@ def get_project_data_name(project_path: Path) -> str:
 
     Example: `G:\\Vtuber` -> `G_Vtuber`.
     """
+    return _project_data_name(Path(project_path).expanduser().absolute())
+
+
+@lru_cache(maxsize=64)
+def _project_data_name(project_path: Path) -> str:
+    # Still canonicalized (symlinks followed) so the name matches the folder
+    # ProjectStorageResolver picks; only the repeat resolve() calls are saved.
     return sanitize_project_name(project_path)
 
 
@@ -775,10 +865,22 @@ def get_project_data_dir(project_path: Path, app_root: Optional[Path] = None) ->
 
     Project data lives under the app's `.reverie/projects/` directory.
     """
-    return ProjectStorageResolver.for_project(project_path, launcher_root=app_root).project_dir
+    launcher_root = Path(app_root) if app_root is not None else get_app_root()
+    return _project_storage(project_path, launcher_root).project_dir
+
+
+def _project_storage(project_path: Path, launcher_root: Path) -> ProjectStorageResolver:
+    """Shared resolver for a project; both roots are canonicalized once per pair."""
+    return _project_storage_for(Path(project_path).expanduser().absolute(), Path(launcher_root))
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _project_storage_for(project_path: Path, launcher_root: Path) -> ProjectStorageResolver:
+    # ProjectStorageResolver is frozen, so every caller can share one instance.
+    return ProjectStorageResolver.for_project(project_path, launcher_root=launcher_root)
+
+
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for a single model"""
     model: str
@@ -834,7 +936,7 @@ class ModelConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration"""
     models: List[ModelConfig] = field(default_factory=list)
@@ -961,30 +1063,11 @@ class Config:
         for key, value in text_to_image_defaults.items():
             if key not in text_to_image:
                 text_to_image[key] = value
-        if isinstance(text_to_image.get("aihubmix"), dict):
-            nested_aihubmix = dict(text_to_image_defaults["aihubmix"])
-            nested_aihubmix.update(text_to_image.get("aihubmix", {}))
-            text_to_image["aihubmix"] = nested_aihubmix
-        else:
-            text_to_image["aihubmix"] = dict(text_to_image_defaults["aihubmix"])
-        if isinstance(text_to_image.get("pollinations"), dict):
-            nested_pollinations = dict(text_to_image_defaults["pollinations"])
-            nested_pollinations.update(text_to_image.get("pollinations", {}))
-            text_to_image["pollinations"] = nested_pollinations
-        else:
-            text_to_image["pollinations"] = dict(text_to_image_defaults["pollinations"])
-        if isinstance(text_to_image.get("agnes"), dict):
-            nested_agnes_tti = dict(text_to_image_defaults["agnes"])
-            nested_agnes_tti.update(text_to_image.get("agnes", {}))
-            text_to_image["agnes"] = nested_agnes_tti
-        else:
-            text_to_image["agnes"] = dict(text_to_image_defaults["agnes"])
-        if isinstance(text_to_image.get("sensenova"), dict):
-            nested_sensenova_tti = dict(text_to_image_defaults["sensenova"])
-            nested_sensenova_tti.update(text_to_image.get("sensenova", {}))
-            text_to_image["sensenova"] = nested_sensenova_tti
-        else:
-            text_to_image["sensenova"] = dict(text_to_image_defaults["sensenova"])
+        for section in _TTI_PROVIDER_SECTIONS:
+            nested = dict(text_to_image_defaults[section])
+            if isinstance(text_to_image.get(section), dict):
+                nested.update(text_to_image[section])
+            text_to_image[section] = nested
         text_to_image['active_source'] = normalize_tti_source(text_to_image.get('active_source', 'local'))
         text_to_image['models'] = normalize_tti_models(
             text_to_image.get('models', []),
@@ -1180,6 +1263,54 @@ class Config:
         )
 
 
+# Top-level fields every current config file carries; a file missing any of
+# them (or still holding a legacy one) is rewritten after load.
+_REQUIRED_CONFIG_FIELDS = frozenset({
+    'config_version',
+    'use_workspace_config',
+    'api_max_retries',
+    'api_initial_backoff',
+    'api_timeout',
+    'api_enable_debug_logging',
+    'tool_output_style',
+    'thinking_output_style',
+    'subagents',
+    'text_to_image',
+    'text_to_video',
+})
+_LEGACY_CONFIG_FIELDS = frozenset({'geminicli', 'tti-models', 'ttv'})
+_REQUIRED_MODEL_FIELDS = frozenset({'provider', 'supports_vision'})
+_REQUIRED_TTI_MODEL_FIELDS = frozenset({'path', 'display_name', 'introduction'})
+
+
+@lru_cache(maxsize=1)
+def _default_section_fields() -> Dict[tuple, frozenset]:
+    """Key path -> default field names for each dict section checked on load."""
+    fields = {
+        (name,): frozenset(factory())
+        for name, factory in (
+            ('codex', default_codex_config),
+            ('aihubmix', default_aihubmix_config),
+            ('agnes', default_agnes_config),
+            ('sensenova', default_sensenova_config),
+            ('nvidia', default_nvidia_config),
+            ('modelscope', default_modelscope_config),
+            ('opencode', default_opencode_config),
+            ('atlas_mode', default_atlas_mode_config),
+            ('gamer_mode', default_gamer_mode_config),
+            ('writer_mode', default_writer_mode_config),
+        )
+    }
+    text_to_image = default_text_to_image_config()
+    fields[('text_to_image',)] = frozenset(text_to_image)
+    for provider in _TTI_PROVIDER_SECTIONS:
+        fields[('text_to_image', provider)] = frozenset(text_to_image.get(provider, {}))
+    text_to_video = default_text_to_video_config()
+    fields[('text_to_video',)] = frozenset(text_to_video)
+    fields[('text_to_video', 'agnes')] = frozenset(text_to_video.get('agnes', {}))
+    return fields
+
+
 class ConfigManager:
     """
     Manages configuration persistence with workspace isolation support.
@@ -1197,11 +1328,11 @@ class ConfigManager:
     
     def __init__(self, project_root: Path, force_workspace_config: bool = False):
         self.project_root = project_root
-        self._logger = logging.getLogger(__name__)
+        self._logger = logger
 
         # Use app root for runtime data (next to exe file or script directory).
         self.app_root = get_app_root()
-        self.storage_resolver = ProjectStorageResolver.for_project(project_root, launcher_root=self.app_root)
+        self.storage_resolver = _project_storage(project_root, self.app_root)
         self.data_root = self.storage_resolver.projects_root
         self.project_data_dir = self.storage_resolver.project_dir
         self.global_config_path = self.app_root / '.reverie' / 'config.json'
@@ -1216,9 +1347,23 @@ class ConfigManager:
 
         self._config: Optional[Config] = None
         self._last_mtime: float = 0
+        # Size and content digest of the file ``_config`` was parsed from, so a
+        # rewrite with identical bytes only bumps the mtime instead of reparsing.
+        self._last_size: int = -1
+        self._last_digest: Optional[bytes] = None
+        # Candidate path -> ((mtime_ns, size), use_workspace_config flag), so
+        # picking the active source does not reparse unchanged candidates.
+        self._workspace_flags: Dict[str, tuple] = {}
+        # Stat of every config candidate when ``_config`` was last loaded or
+        # saved; _current_config() reuses the cache only while it still matches.
+        self._candidate_stats: Optional[tuple] = None
+        self._scanned_candidate_stats: tuple = ()
         self._loaded_config_path: Optional[Path] = None
         self._pending_load_notice: Optional[Dict[str, str]] = None
+        # mtime of the last repaired config written back by _load_json_payload.
+        self._last_repair_mtime: Optional[float] = None
         self._last_load_notice_key: Optional[tuple[str, str, str]] = None
+        self._dirs_ensured = False
 
         # Determine config path based on setting and any persisted workspace state.
         self._use_workspace_config = bool(
@@ -1228,10 +1373,7 @@ class ConfigManager:
     
     def _update_config_path(self) -> None:
         """Update config path based on current mode"""
-        if self._use_workspace_config:
-            self.config_path = self.workspace_config_path
-        else:
-            self.config_path = self.global_config_path
+        self.config_path = self.workspace_config_path if self._use_workspace_config else self.global_config_path
 
     def _get_legacy_mirror_path(self) -> Optional[Path]:
         """Return the compatibility config path for the current storage mode."""
@@ -1241,11 +1383,11 @@ class ConfigManager:
 
     def _read_json_dict(self, path: Path) -> Optional[Dict[str, Any]]:
         """Best-effort JSON object reader used for lightweight mode detection."""
-        if not path.exists():
-            return None
         try:
             data = self._load_json_payload(path, persist_repairs=False, record_notice=False)
             return data if isinstance(data, dict) else None
+        except FileNotFoundError:
+            return None
         except Exception as exc:
             self._logger.debug("Failed to read JSON config candidate %s", path, exc_info=True)
             return None
@@ -1295,9 +1437,18 @@ class ConfigManager:
         *,
         persist_repairs: bool,
         record_notice: bool,
+        raw_bytes: Optional[bytes] = None,
     ) -> Any:
         """Load JSON with best-effort repair for literal control chars in strings."""
-        raw_text = path.read_text(encoding="utf-8-sig")
+        if raw_bytes is None:
+            raw_bytes = path.read_bytes()
+        if orjson is not None:
+            try:
+                # orjson parses the UTF-8 bytes directly, skipping the text decode.
+                return orjson.loads(raw_bytes[len(_UTF8_BOM):] if raw_bytes.startswith(_UTF8_BOM) else raw_bytes)
+            except orjson.JSONDecodeError:
+                pass
+        raw_text = raw_bytes.decode("utf-8-sig")
         try:
             return json.loads(raw_text)
         except json.JSONDecodeError as exc:
@@ -1310,7 +1461,7 @@ class ConfigManager:
                 ) from exc
 
             try:
-                data = json.loads(repaired_text)
+                data = _parse_json_text(repaired_text)
             except json.JSONDecodeError as repair_exc:
                 backup_detail = f" Backup saved to {backup_path}." if backup_path is not None else ""
                 raise ValueError(
@@ -1319,7 +1470,7 @@ class ConfigManager:
 
             if persist_repairs:
                 try:
-                    write_json_secure(path, data)
+                    self._last_repair_mtime = write_json_secure(path, data)
                 except Exception:
                     self._logger.debug("Failed to persist repaired config at %s", path, exc_info=True)
                 if record_notice:
@@ -1345,11 +1496,8 @@ class ConfigManager:
         Older workspace configs without the flag no longer override the global
         profile by mere existence.
         """
-        workspace_found = False
         for candidate in (self.workspace_config_path, self.legacy_workspace_config_path):
-            if not candidate.exists():
-                continue
-            workspace_found = True
+            # Missing candidates read as None, so no separate exists() probe.
             data = self._read_json_dict(candidate)
             if isinstance(data, dict) and 'use_workspace_config' in data:
                 return bool(data.get('use_workspace_config', False))
@@ -1382,22 +1530,32 @@ class ConfigManager:
     def _candidate_records(self) -> List[Dict[str, Any]]:
         """Inspect existing config candidates with enough metadata to choose a source."""
         records: List[Dict[str, Any]] = []
+        stats = []
         seen = set()
         for workspace_mode in (False, True):
             canonical = self.workspace_config_path if workspace_mode else self.global_config_path
             for candidate in self._path_candidates_for_mode(workspace_mode):
                 key = str(candidate.resolve(strict=False)).lower()
-                if key in seen or not candidate.exists():
+                if key in seen:
                     continue
                 seen.add(key)
-                data = self._read_json_dict(candidate)
-                workspace_flag = None
-                if isinstance(data, dict) and 'use_workspace_config' in data:
-                    workspace_flag = bool(data.get('use_workspace_config', False))
                 try:
-                    mtime = os.path.getmtime(candidate)
+                    candidate_stat = os.stat(candidate)
                 except OSError:
-                    mtime = 0.0
+                    stats.append((key, None))
+                    continue
+                mtime = candidate_stat.st_mtime
+                signature = (candidate_stat.st_mtime_ns, candidate_stat.st_size)
+                stats.append((key, signature))
+                cached_flag = self._workspace_flags.get(key)
+                if cached_flag is not None and cached_flag[0] == signature:
+                    workspace_flag = cached_flag[1]
+                else:
+                    data = self._read_json_dict(candidate)
+                    workspace_flag = None
+                    if isinstance(data, dict) and 'use_workspace_config' in data:
+                        workspace_flag = bool(data.get('use_workspace_config', False))
+                    self._workspace_flags[key] = (signature, workspace_flag)
                 records.append(
                     {
                         "path": candidate,
@@ -1407,8 +1565,30 @@ class ConfigManager:
                         "is_canonical": candidate.resolve(strict=False) == canonical.resolve(strict=False),
                     }
                 )
+        self._scanned_candidate_stats = tuple(stats)
         return records
 
+    def _stat_candidates(self) -> tuple:
+        """Return (path key, (mtime_ns, size) or None) for every config candidate.
+
+        Matches the stats _candidate_records() leaves in ``_scanned_candidate_stats``.
+        """
+        stats = []
+        seen = set()
+        for workspace_mode in (False, True):
+            for candidate in self._path_candidates_for_mode(workspace_mode):
+                key = str(candidate.resolve(strict=False)).lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                try:
+                    candidate_stat = os.stat(candidate)
+                except OSError:
+                    stats.append((key, None))
+                    continue
+                stats.append((key, (candidate_stat.st_mtime_ns, candidate_stat.st_size)))
+        return tuple(stats)
+
     def _pick_active_record(self) -> Optional[Dict[str, Any]]:
         """Choose the config source record to load from."""
         records = self._candidate_records()
@@ -1540,8 +1720,7 @@ class ConfigManager:
             
             return True
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to copy config to workspace: {e}")
+            logger.error("Failed to copy config to workspace: %s", e)
             return False
 
     def set_workspace_config_enabled(self, enabled: bool) -> bool:
@@ -1604,8 +1783,7 @@ class ConfigManager:
             
             return True
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"Failed to copy config to global: {e}")
+            logger.error("Failed to copy config to global: %s", e)
             return False
     
     def has_workspace_config(self) -> bool:
@@ -1617,40 +1795,64 @@ class ConfigManager:
         return self._find_existing_path(False) is not None
     
     def ensure_dirs(self) -> None:
-        """Create necessary directories"""
+        """Create necessary directories (once per manager; the layout is stable afterwards)."""
+        if self._dirs_ensured:
+            return
         self.storage_resolver.ensure_project_dir()
+        self._dirs_ensured = True
     
     def load(self) -> Config:
         """Load configuration from file, reloading if file changed"""
         active_record = self._pick_active_record()
+        # The scan that picked the source; a save() below refreshes it.
+        self._candidate_stats = self._scanned_candidate_stats
         source_path = active_record["path"] if active_record is not None else None
 
         # Check if we need to switch config mode based on loaded config
         if source_path is not None:
-            self._use_workspace_config = bool(active_record.get("workspace_mode")) if active_record else self._is_workspace_candidate_path(source_path)
-            self._update_config_path()
-            current_mtime = os.path.getmtime(source_path)
+            workspace_mode = bool(active_record.get("workspace_mode"))
+            # config_path always tracks the mode, so only re-point it on a switch.
+            if workspace_mode != self._use_workspace_config:
+                self._use_workspace_config = workspace_mode
+                self._update_config_path()
+            # Already stat'ed by _candidate_records() when picking the record.
+            current_mtime = active_record["mtime"]
             # Reload if file changed or not loaded yet
             if self._config is None or current_mtime > self._last_mtime:
                 try:
+                    raw_bytes = source_path.read_bytes()
+                    digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+                    if (
+                        self._config is not None
+                        and self._loaded_config_path == source_path
+                        and len(raw_bytes) == self._last_size
+                        and digest == self._last_digest
+                    ):
+                        # Touched or rewritten with identical content.
+                        self._last_mtime = current_mtime
+                        return self._config
+
+                    self._last_repair_mtime = None
                     data = self._load_json_payload(
                         source_path,
                         persist_repairs=True,
                         record_notice=True,
+                        raw_bytes=raw_bytes,
                     )
                     self._config = Config.from_dict(data)
-                    try:
-                        self._last_mtime = os.path.getmtime(source_path)
-                    except OSError:
-                        self._last_mtime = current_mtime
+                    # A persisted repair rewrote the file; the digest no longer matches it.
+                    repaired = self._last_repair_mtime is not None
+                    self._last_mtime = self._last_repair_mtime if repaired else current_mtime
+                    self._last_size = -1 if repaired else len(raw_bytes)
+                    self._last_digest = None if repaired else digest
                     self._loaded_config_path = source_path
 
                     # Auto-update config file if it's missing new fields or still
                     # lives in the active canonical location.
                     if self._needs_config_update(data):
+                        # save() records the written mtime (so this does not loop)
+                        # and skips the write when the bytes are already current.
                         self.save(self._config)
-                        # Update mtime after saving to avoid infinite loop
-                        self._last_mtime = os.path.getmtime(self.get_active_config_path())
                     else:
                         if not self._is_workspace_candidate_path(source_path):
                             self._sync_legacy_mirror(self._config.to_dict())
@@ -1675,9 +1877,11 @@ class ConfigManager:
                     self._config = Config()
                     self._loaded_config_path = source_path
                     self._last_mtime = current_mtime
+                    self._last_digest = None
         else:
-            self._use_workspace_config = False
-            self._update_config_path()
+            if self._use_workspace_config:
+                self._use_workspace_config = False
+                self._update_config_path()
             self._config = Config()
             self._loaded_config_path = self.config_path
             self.ensure_dirs()
@@ -1697,278 +1901,63 @@ class ConfigManager:
     
     def _needs_config_update(self, data: dict) -> bool:
         """Check if the loaded config needs to be updated with new fields"""
-        needs_update = False
-        
-        # Check if config_version is missing or outdated
-        current_version = data.get('config_version', '0.0.0')
-        if is_config_version_older(current_version):
-            needs_update = True
-        
-        # Check if any model is missing provider field
-        models = data.get('models', [])
-        for model in models:
-            if 'provider' not in model:
-                needs_update = True
-                break
+        keys = data.keys()
+
+        # Missing top-level fields, or legacy ones that are dropped on the next save.
+        if not keys >= _REQUIRED_CONFIG_FIELDS or not _LEGACY_CONFIG_FIELDS.isdisjoint(keys):
+            return True
+
+        if is_config_version_older(data.get('config_version', '0.0.0')):
+            return True
+
+        # Models must carry a canonical provider and the explicit vision flag that
+        # replaced thinking_mode; an empty endpoint is dropped on save.
+        for model in data.get('models', []):
+            if not isinstance(model, dict):
+                return True
+            model_keys = model.keys()
+            if not model_keys >= _REQUIRED_MODEL_FIELDS or 'thinking_mode' in model_keys:
+                return True
             raw_provider = str(model.get('provider', '') or '').strip().lower()
             if normalize_model_provider(raw_provider) != raw_provider:
-                needs_update = True
-                break
-        
-        # Migrate standard model entries from legacy thinking_mode to explicit vision capability.
-        for model in models:
-            if 'supports_vision' not in model:
-                needs_update = True
-                break
-            if 'thinking_mode' in model:
-                needs_update = True
-                break
-            endpoint = str(model.get('endpoint', '') or '').strip() if isinstance(model, dict) else ''
-            if isinstance(model, dict) and 'endpoint' in model and not endpoint:
-                needs_update = True
-                break
-        
-        # Check if Config is missing any new fields
-        if 'config_version' not in data:
-            needs_update = True
-        
-        # Check if use_workspace_config field is missing
-        if 'use_workspace_config' not in data:
-            needs_update = True
-        
-        # Check if API settings fields are missing
-        api_fields = ['api_max_retries', 'api_initial_backoff', 'api_timeout', 'api_enable_debug_logging']
-        for field in api_fields:
-            if field not in data:
-                needs_update = True
-                break
-
-        if 'tool_output_style' not in data:
-            needs_update = True
-        elif normalize_tool_output_style(data.get('tool_output_style', 'compact')) != str(data.get('tool_output_style', '')).strip().lower():
-            needs_update = True
+                return True
+            if 'endpoint' in model_keys and not str(model.get('endpoint', '') or '').strip():
+                return True
 
-        if 'thinking_output_style' not in data:
-            needs_update = True
-        elif normalize_thinking_output_style(data.get('thinking_output_style', 'full')) != str(data.get('thinking_output_style', '')).strip().lower():
-            needs_update = True
+        if normalize_tool_output_style(data.get('tool_output_style', 'compact')) != str(data.get('tool_output_style', '')).strip().lower():
+            return True
+        if normalize_thinking_output_style(data.get('thinking_output_style', 'full')) != str(data.get('thinking_output_style', '')).strip().lower():
+            return True
 
-        # Check if active_model_source field is missing/invalid
         active_model_source = normalize_active_model_source(data.get('active_model_source', ''))
         raw_active_model_source = str(data.get('active_model_source', '')).strip().lower().replace("-", "_")
         if active_model_source not in SUPPORTED_ACTIVE_MODEL_SOURCES or raw_active_model_source != active_model_source:
-            needs_update = True
+            return True
 
-        # Gemini CLI reverse-proxy settings are legacy and are removed on the next save.
-        if 'geminicli' in data:
-            needs_update = True
+        if normalize_subagent_config(data.get('subagents')) != data.get('subagents'):
+            return True
 
-        # Check if codex section is missing
-        if 'codex' not in data:
-            needs_update = True
-        elif not isinstance(data.get('codex'), dict):
-            needs_update = True
-        else:
-            for field_name in default_codex_config().keys():
-                if field_name not in data.get('codex', {}):
-                    needs_update = True
-                    break
-
-        # Check if aihubmix section is missing
-        if 'aihubmix' not in data:
-            needs_update = True
-        elif not isinstance(data.get('aihubmix'), dict):
-            needs_update = True
-        else:
-            for field_name in default_aihubmix_config().keys():
-                if field_name not in data.get('aihubmix', {}):
-                    needs_update = True
-                    break
-
-        # Check if agnes section is missing
-        if 'agnes' not in data:
-            needs_update = True
-        elif not isinstance(data.get('agnes'), dict):
-            needs_update = True
-        else:
-            for field_name in default_agnes_config().keys():
-                if field_name not in data.get('agnes', {}):
-                    needs_update = True
-                    break
-
-        # Check if sensenova section is missing
-        if 'sensenova' not in data:
-            needs_update = True
-        elif not isinstance(data.get('sensenova'), dict):
-            needs_update = True
-        else:
-            for field_name in default_sensenova_config().keys():
-                if field_name not in data.get('sensenova', {}):
-                    needs_update = True
-                    break
-
-        # Check if nvidia section is missing
-        if 'nvidia' not in data:
-            needs_update = True
-        elif not isinstance(data.get('nvidia'), dict):
-            needs_update = True
-        else:
-            for field_name in default_nvidia_config().keys():
-                if field_name not in data.get('nvidia', {}):
-                    needs_update = True
-                    break
-
-        # Check if modelscope section is missing
-        if 'modelscope' not in data:
-            needs_update = True
-        elif not isinstance(data.get('modelscope'), dict):
-            needs_update = True
-        else:
-            for field_name in default_modelscope_config().keys():
-                if field_name not in data.get('modelscope', {}):
-                    needs_update = True
-                    break
-
-        # Check if opencode section is missing
-        if 'opencode' not in data:
-            needs_update = True
-        elif not isinstance(data.get('opencode'), dict):
-            needs_update = True
-        else:
-            for field_name in default_opencode_config().keys():
-                if field_name not in data.get('opencode', {}):
-                    needs_update = True
-                    break
-
-        # Check if atlas_mode section is missing
-        if 'atlas_mode' not in data:
-            needs_update = True
-        elif not isinstance(data.get('atlas_mode'), dict):
-            needs_update = True
-        else:
-            for field_name in default_atlas_mode_config().keys():
-                if field_name not in data.get('atlas_mode', {}):
-                    needs_update = True
-                    break
-
-        if 'subagents' not in data:
-            needs_update = True
-        elif normalize_subagent_config(data.get('subagents')) != data.get('subagents'):
-            needs_update = True
-
-        # Check if gamer_mode field is missing
-        if 'gamer_mode' not in data:
-            needs_update = True
-        elif not isinstance(data.get('gamer_mode'), dict):
-            needs_update = True
-        else:
-            for field_name in default_gamer_mode_config().keys():
-                if field_name not in data.get('gamer_mode', {}):
-                    needs_update = True
-                    break
-
-        if 'writer_mode' not in data:
-            needs_update = True
-        elif not isinstance(data.get('writer_mode'), dict):
-            needs_update = True
-        else:
-            for field_name in default_writer_mode_config().keys():
-                if field_name not in data.get('writer_mode', {}):
-                    needs_update = True
-                    break
-        
-        # Check if text_to_image section is missing or incomplete
-        if 'text_to_image' not in data:
-            needs_update = True
-        else:
-            text_to_image = data.get('text_to_image')
-            if not isinstance(text_to_image, dict):
-                needs_update = True
-            else:
-                for field_name in default_text_to_image_config().keys():
-                    if field_name not in text_to_image:
-                        needs_update = True
-                        break
-                tti_aihubmix_defaults = default_text_to_image_config().get("aihubmix", {})
-                tti_aihubmix = text_to_image.get("aihubmix", {})
-                if not isinstance(tti_aihubmix, dict):
-                    needs_update = True
-                else:
-                    for field_name in tti_aihubmix_defaults.keys():
-                        if field_name not in tti_aihubmix:
-                            needs_update = True
-                            break
-                tti_pollinations_defaults = default_text_to_image_config().get("pollinations", {})
-                tti_pollinations = text_to_image.get("pollinations", {})
-                if not isinstance(tti_pollinations, dict):
-                    needs_update = True
-                else:
-                    for field_name in tti_pollinations_defaults.keys():
-                        if field_name not in tti_pollinations:
-                            needs_update = True
-                            break
-                tti_agnes_defaults = default_text_to_image_config().get("agnes", {})
-                tti_agnes = text_to_image.get("agnes", {})
-                if not isinstance(tti_agnes, dict):
-                    needs_update = True
-                else:
-                    for field_name in tti_agnes_defaults.keys():
-                        if field_name not in tti_agnes:
-                            needs_update = True
-                            break
-                tti_sensenova_defaults = default_text_to_image_config().get("sensenova", {})
-                tti_sensenova = text_to_image.get("sensenova", {})
-                if not isinstance(tti_sensenova, dict):
-                    needs_update = True
-                else:
-                    for field_name in tti_sensenova_defaults.keys():
-                        if field_name not in tti_sensenova:
-                            needs_update = True
-                            break
-                models = text_to_image.get('models', [])
-                if not isinstance(models, list):
-                    needs_update = True
-                else:
-                    for model_item in models:
-                        if not isinstance(model_item, dict):
-                            needs_update = True
-                            break
-                        if 'path' not in model_item or 'display_name' not in model_item or 'introduction' not in model_item:
-                            needs_update = True
-                            break
-                # Old config keys from pre-2.0.1 TTI format should be migrated.
-                if 'model_paths' in text_to_image or 'default_model_index' in text_to_image:
-                    needs_update = True
-
-        # Check if text_to_video section is missing or incomplete
-        if 'text_to_video' not in data:
-            needs_update = True
-        else:
-            text_to_video = data.get('text_to_video')
-            if not isinstance(text_to_video, dict):
-                needs_update = True
-            else:
-                for field_name in default_text_to_video_config().keys():
-                    if field_name not in text_to_video:
-                        needs_update = True
-                        break
-                ttv_agnes_defaults = default_text_to_video_config().get("agnes", {})
-                ttv_agnes = text_to_video.get("agnes", {})
-                if not isinstance(ttv_agnes, dict):
-                    needs_update = True
-                else:
-                    for field_name in ttv_agnes_defaults.keys():
-                        if field_name not in ttv_agnes:
-                            needs_update = True
-                            break
-
-        # Canonical config now stores TTI models only under text_to_image.models.
-        if 'tti-models' in data:
-            needs_update = True
-        if 'ttv' in data:
-            needs_update = True
-
-        return needs_update
+        # Provider/mode sections (and their nested provider blocks) must be dicts
+        # holding at least every default field.
+        for (name, *nested), required in _default_section_fields().items():
+            section = data.get(name)
+            if nested and isinstance(section, dict):
+                section = section.get(nested[0], {})
+            if not isinstance(section, dict) or not section.keys() >= required:
+                return True
+
+        text_to_image = data['text_to_image']
+        tti_models = text_to_image.get('models', [])
+        if not isinstance(tti_models, list):
+            return True
+        for model_item in tti_models:
+            if not isinstance(model_item, dict) or not model_item.keys() >= _REQUIRED_TTI_MODEL_FIELDS:
+                return True
+        # Old config keys from pre-2.0.1 TTI format should be migrated.
+        if 'model_paths' in text_to_image or 'default_model_index' in text_to_image:
+            return True
+
+        return False
     
     def save(self, config: Optional[Config] = None) -> None:
         """Save configuration to file"""
@@ -1996,15 +1985,30 @@ class ConfigManager:
         if is_config_version_older(self._config.config_version):
             self._config.config_version = CONFIG_VERSION
         serialized = self._config.to_dict()
+        payload = encode_json_document(serialized)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
 
-        write_json_secure(target_path, serialized)
+        if self._is_unchanged_on_disk(target_path, payload, digest):
+            # Same bytes as the file we last read or wrote, and nobody has
+            # touched it since: skip the atomic rewrite and its fsyncs.
+            return
+
+        self._last_mtime = write_json_secure(target_path, payload)
         self._loaded_config_path = target_path
-        try:
-            self._last_mtime = os.path.getmtime(target_path)
-        except OSError:
-            self._last_mtime = 0
+        self._last_size = len(payload)
+        self._last_digest = digest
         if not self._is_workspace_candidate_path(target_path):
             self._sync_legacy_mirror(serialized)
+        self._candidate_stats = self._stat_candidates()
+
+    def _is_unchanged_on_disk(self, path: Path, payload: bytes, digest: bytes) -> bool:
+        """Return True when ``path`` still holds exactly ``payload`` from our last load/save."""
+        if self._loaded_config_path != path or self._last_digest != digest or self._last_size != len(payload):
+            return False
+        try:
+            return os.path.getmtime(path) == self._last_mtime
+        except OSError:
+            return False
     
     def is_configured(self) -> bool:
         """Check if initial configuration is done"""
@@ -2036,15 +2040,32 @@ class ConfigManager:
             return True
         return False
     
+    def _current_config(self) -> Config:
+        """
+        Return the cached config for a read-modify-save, reloading only if needed.
+
+        Stats the same candidates load() picks from, but skips its parsing and
+        source selection when none of them was created, removed or modified
+        since we last loaded or saved. Any change (including a new workspace
+        config or a flipped ``use_workspace_config``) goes through load().
+        """
+        if (
+            self._config is not None
+            and self._candidate_stats is not None
+            and self._stat_candidates() == self._candidate_stats
+        ):
+            return self._config
+        return self.load()
+
     def add_model(self, model_config: ModelConfig) -> None:
         """Add a new model configuration"""
-        config = self.load()
+        config = self._current_config()
         config.models.append(model_config)
         self.save(config)
     
     def remove_model(self, index: int) -> bool:
         """Remove a model configuration by index"""
-        config = self.load()
+        config = self._current_config()
         if 0 <= index < len(config.models):
             config.models.pop(index)
             # Adjust active index if needed
@@ -2074,7 +2095,7 @@ class ConfigManager:
     
     def set_active_model(self, index: int) -> bool:
         """Set the active model by index"""
-        config = self.load()
+        config = self._current_config()
         if 0 <= index < len(config.models):
             config.active_model_index = index
             config.active_model_source = "standard"
@@ -19,42 +19,52 @@ Advanced Components:
 - Context Engine Core: Unified context management
 """
 
-from .symbol_table import Symbol, SymbolTable, SymbolKind
-from .dependency_graph import Dependency, DependencyGraph, DependencyType
-from .indexer import CodebaseIndexer, IndexResult, IndexProgress, FileInfo, IndexConfig
-from .retriever import (
-    ContextRetriever,
-    RetrievedContextPackage,
-    ContextPackage,
-    SymbolContext,
-    EditContext,
-    TaskContextFile,
-    TaskContextResult,
-)
-from .cache import CacheManager
-from .git_integration import GitIntegration, CommitInfo, BlameInfo, CommitDetails
-from .novel_index import NovelIndex, IndexEntry
-from .emotion_tracker import EmotionTracker, EmotionalSnapshot
-from .plot_analyzer import PlotAnalyzer, CausalityChain, PlotType
-from .continuity_validator import ContinuityValidator, CharacterState, TemporalEvent
+# Submodules are imported on first attribute access so that importing the
+# package (and everything that only needs one component) stays cheap.
+from importlib import import_module
 
-# Advanced components
-from .semantic_indexer import SemanticIndexer, SemanticNode, CodePattern
-from .knowledge_graph import KnowledgeGraph, Entity, Relation, RelationType, PathResult
-from .commit_history_indexer import CommitHistoryIndexer, CommitPattern, CodeEvolution, TeamConvention, ChangeType
-from .context_engine_core import ContextEngineCore, ContextQuery, ContextResult
-from .lsp_manager import LSPManager
-from .workspace import WorkspaceProfile, ProjectBoundary, InstructionLayer, detect_workspace_profile
-from .fast_context import FastContextExplorer, FastContextHit, FastContextResult
-from .fragments import (
-    ContextFragment,
-    estimate_tokens,
-    make_context_fragment,
-    render_context_fragments,
-    sort_context_fragments,
-    truncate_to_token_cap,
-)
+_EXPORTS_BY_MODULE = {
+    '.symbol_table': ('Symbol', 'SymbolTable', 'SymbolKind'),
+    '.dependency_graph': ('Dependency', 'DependencyGraph', 'DependencyType'),
+    '.indexer': ('CodebaseIndexer', 'IndexResult', 'IndexProgress', 'FileInfo', 'IndexConfig'),
+    '.retriever': (
+        'ContextRetriever',
+        'RetrievedContextPackage',
+        'ContextPackage',
+        'SymbolContext',
+        'EditContext',
+        'TaskContextFile',
+        'TaskContextResult',
+    ),
+    '.cache': ('CacheManager', 'LazyCache'),
+    '.git_integration': ('GitIntegration', 'CommitInfo', 'BlameInfo', 'CommitDetails'),
+    '.novel_index': ('NovelIndex', 'IndexEntry'),
+    '.emotion_tracker': ('EmotionTracker', 'EmotionalSnapshot'),
+    '.plot_analyzer': ('PlotAnalyzer', 'CausalityChain', 'PlotType'),
+    '.continuity_validator': ('ContinuityValidator', 'CharacterState', 'TemporalEvent'),
+    # Advanced components
+    '.semantic_indexer': ('SemanticIndexer', 'SemanticNode', 'CodePattern'),
+    '.knowledge_graph': ('KnowledgeGraph', 'Entity', 'Relation', 'RelationType', 'PathResult'),
+    '.commit_history_indexer': ('CommitHistoryIndexer', 'CommitPattern', 'CodeEvolution', 'TeamConvention', 'ChangeType'),
+    '.context_engine_core': ('ContextEngineCore', 'ContextQuery', 'ContextResult'),
+    '.lsp_manager': ('LSPManager',),
+    '.workspace': ('WorkspaceProfile', 'ProjectBoundary', 'InstructionLayer', 'detect_workspace_profile'),
+    '.fast_context': ('FastContextExplorer', 'FastContextHit', 'FastContextResult'),
+    '.fragments': (
+        'ContextFragment',
+        'estimate_tokens',
+        'make_context_fragment',
+        'render_context_fragments',
+        'sort_context_fragments',
+        'truncate_to_token_cap',
+    ),
+}
 
+_LAZY_EXPORTS = {
+    name: module_name
+    for module_name, names in _EXPORTS_BY_MODULE.items()
+    for name in names
+}
 
 __all__ = [
     # Symbol Table
@@ -80,6 +90,7 @@ __all__ = [
     'TaskContextResult',
     # Cache
     'CacheManager',
+    'LazyCache',
     # Git
     'GitIntegration',
     'CommitInfo',
@@ -128,3 +139,17 @@ __all__ = [
     'sort_context_fragments',
     'truncate_to_token_cap',
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -11,16 +11,36 @@ Optimized for large codebases with efficient incremental updates.
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+import hashlib
 import json
 import time
-import gzip
+import mmap
 import os
 import logging
 import tempfile
 import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    # ISA-L's igzip is a drop-in for gzip with SIMD DEFLATE/CRC32 and
+    # produces standard gzip streams, so existing .json.gz files still load.
+    from isal import igzip as gzip
+except ImportError:  # pragma: no cover - optional dependency
+    import gzip
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
 from .symbol_table import SymbolTable
 from .dependency_graph import DependencyGraph
 from ..diagnostics import report_suppressed_exception
@@ -28,6 +48,116 @@ from ..diagnostics import report_suppressed_exception
 
 logger = logging.getLogger(__name__)
 
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _shard_bucket(file_path: str) -> int:
+    """Stable symbol shard for a file path (``hash()`` is salted per process)."""
+    return zlib.crc32(file_path.encode('utf-8', 'surrogatepass')) & 0xff
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize compact UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) fall back to json.
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_json(raw: Any) -> Any:
+    """Parse UTF-8 JSON from any bytes-like buffer, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json accepts a few inputs orjson does not (NaN, huge integers).
+            pass
+    return json.loads(str(raw, 'utf-8'))
+
+
+def _load_mapped_json(path: Path, inflate: Optional[Callable[[memoryview], Any]] = None) -> Any:
+    """Parse a JSON file through a read-only mmap, optionally inflating it first."""
+    with open(path, 'rb') as stream:
+        if os.fstat(stream.fileno()).st_size == 0:
+            # Empty files cannot be mapped; let the decoder report them.
+            return _decode_json(inflate(memoryview(b'')) if inflate else b'')
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Pages are faulted in as the decoder reads them instead of being
+            # copied into a bytes object first. The view must be released
+            # before the mapping closes.
+            with memoryview(mapped) as view:
+                return _decode_json(inflate(view) if inflate else view)
+
+
+def _inflate(compressed: memoryview) -> bytes:
+    """Decompress a zstd or gzip cache payload, chosen by its frame magic."""
+    if zstandard is not None and compressed[:4] == _ZSTD_MAGIC:
+        return zstandard.ZstdDecompressor().decompress(compressed)
+    return gzip.decompress(compressed)
+
+
+class LazyCache(Mapping):
+    """
+    Result of `CacheManager.load`, deferring the symbol and dependency payloads.
+
+    The index, shard manifest and file tracking data are validated when the
+    cache is loaded; the symbol shards and dependency graph are inflated and
+    parsed on first access. It is also a read-only mapping, so
+    ``cache['symbol_table']`` works like the plain dict ``load`` used to return.
+    A deferred payload that turns out to be unreadable yields None.
+    """
+
+    _KEYS = ('symbol_table', 'dependency_graph', 'file_info', 'metadata', 'saved_at', 'load_time_ms')
+
+    def __init__(
+        self,
+        manager: 'CacheManager',
+        index_data: Dict[str, Any],
+        shard_manifest: Dict[str, Any],
+        file_info: Dict[str, Any],
+        load_time_ms: float,
+    ):
+        self._manager = manager
+        self._shard_manifest = shard_manifest
+        self._symbol_table: Optional[SymbolTable] = None
+        self._dependency_graph: Optional[DependencyGraph] = None
+        self.file_info = file_info
+        self.metadata = index_data.get('metadata', {})
+        self.saved_at = index_data.get('saved_at')
+        self.load_time_ms = load_time_ms
+
+    @property
+    def symbol_table(self) -> Optional[SymbolTable]:
+        if self._symbol_table is None:
+            with self._manager._io_lock:
+                symbol_data = self._manager._read_symbol_shards(self._shard_manifest)
+            if symbol_data is not None:
+                self._symbol_table = SymbolTable.from_dict(symbol_data)
+        return self._symbol_table
+
+    @property
+    def dependency_graph(self) -> Optional[DependencyGraph]:
+        if self._dependency_graph is None:
+            with self._manager._io_lock:
+                dep_data = self._manager._load_compressed(self._manager.dependencies_path)
+            if dep_data is not None:
+                self._dependency_graph = DependencyGraph.from_dict(dep_data)
+        return self._dependency_graph
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
 
 class CacheManager:
     """
@@ -36,17 +166,22 @@ class CacheManager:
     Cache structure:
     .reverie/context_cache/
     ├── index.json          # Metadata and version info
-    ├── symbols.json.gz     # Compressed symbol table
-    ├── dependencies.json.gz # Compressed dependency graph
+    ├── symbols.json.gz     # Compressed shard manifest (.json.zst with zstandard)
+    ├── symbols/            # Symbol table sharded by file path, <00..ff>.json.gz
+    ├── dependencies.json.gz # Compressed dependency graph (.json.zst with zstandard)
     └── files.json          # File tracking info
     """
     
-    CACHE_VERSION = "1.10.0"
+    CACHE_VERSION = "1.11.0"
     COMPRESSION_LEVEL = 3
     
     def __init__(self, cache_dir: Path):
         self.cache_dir = Path(cache_dir)
         self._io_lock = threading.RLock()
+        # zstd compresses and inflates the large tables several times faster
+        # than DEFLATE; gzip stays the format when zstandard is not installed.
+        self.compression = 'zstd' if zstandard is not None else 'gzip'
+        self._compressed_suffix = '.json.zst' if zstandard is not None else '.json.gz'
         self._ensure_cache_dir()
     
     def _ensure_cache_dir(self) -> None:
@@ -59,11 +194,18 @@ class CacheManager:
     
     @property
     def symbols_path(self) -> Path:
-        return self.cache_dir / 'symbols.json.gz'
+        return self.cache_dir / f'symbols{self._compressed_suffix}'
+    
+    @property
+    def symbol_shards_dir(self) -> Path:
+        return self.cache_dir / 'symbols'
+
+    def _shard_path(self, bucket: int) -> Path:
+        return self.symbol_shards_dir / f'{bucket:02x}{self._compressed_suffix}'
     
     @property
     def dependencies_path(self) -> Path:
-        return self.cache_dir / 'dependencies.json.gz'
+        return self.cache_dir / f'dependencies{self._compressed_suffix}'
     
     @property
     def files_path(self) -> Path:
@@ -88,18 +230,18 @@ class CacheManager:
         try:
             started_at = time.perf_counter()
             with self._io_lock:
+                # Digests of the files the previous save wrote; unchanged payloads are not rewritten.
+                previous_digests = self._read_previous_digests()
                 # A cache is valid only after the final index manifest is replaced.
                 self.index_path.unlink(missing_ok=True)
 
-                # Save symbol table (compressed)
+                # Snapshot everything on this thread, then write the payloads
+                # concurrently: compression and fsync release the GIL.
                 symbol_data = symbol_table.to_dict()
-                self._save_compressed(self.symbols_path, symbol_data)
-
-                # Save dependency graph (compressed)
+                shards: Dict[int, Dict[str, Any]] = {}
+                for qualified_name, payload in symbol_data['symbols'].items():
+                    shards.setdefault(_shard_bucket(payload['file_path']), {})[qualified_name] = payload
                 dep_data = dependency_graph.to_dict()
-                self._save_compressed(self.dependencies_path, dep_data)
-
-                # Save file info
                 files_data = {}
                 for path, info in file_info.items():
                     try:
@@ -111,7 +253,33 @@ class CacheManager:
                             'size': getattr(info, 'size', 0),
                             'content_hash': getattr(info, 'content_hash', ''),
                         }
-                self._atomic_write_json(self.files_path, files_data)
+                previous_shards = self._read_shard_manifest()
+                self.symbol_shards_dir.mkdir(exist_ok=True)
+                with ThreadPoolExecutor(max_workers=4, thread_name_prefix="context-cache-save") as executor:
+                    futures = {
+                        'dependencies': executor.submit(
+                            self._write_if_changed, self.dependencies_path, _encode_json(dep_data),
+                            previous_digests.get('dependencies'),
+                        ),
+                        'files': executor.submit(
+                            self._write_if_changed, self.files_path, _encode_json(files_data),
+                            previous_digests.get('files'), False,
+                        ),
+                    }
+                    shard_futures = {
+                        bucket: executor.submit(self._save_shard, bucket, payload, previous_shards.get(f'{bucket:02x}'))
+                        for bucket, payload in shards.items()
+                    }
+                    digests = {name: future.result() for name, future in futures.items()}
+                    manifest = {f'{bucket:02x}': future.result() for bucket, future in sorted(shard_futures.items())}
+
+                for stale in previous_shards.keys() - manifest.keys():
+                    self._shard_path(int(stale, 16)).unlink(missing_ok=True)
+                digests['symbols'] = self._write_if_changed(
+                    self.symbols_path,
+                    _encode_json({'shards': manifest, 'stats': symbol_data['stats']}),
+                    previous_digests.get('symbols'),
+                )
 
                 # Publish the manifest last so an interrupted save is never valid.
                 index_data = {
@@ -120,7 +288,9 @@ class CacheManager:
                     'symbol_count': len(symbol_table),
                     'dependency_count': len(dependency_graph),
                     'file_count': len(file_info),
+                    'compression': self.compression,
                     'metadata': metadata or {},
+                    'digests': digests,
                     'save_time_ms': round((time.perf_counter() - started_at) * 1000.0, 2),
                 }
                 self._atomic_write_json(self.index_path, index_data)
@@ -130,13 +300,13 @@ class CacheManager:
             report_suppressed_exception("save Context Engine cache", logger=logger, level=logging.WARNING)
             return False
     
-    def load(self, expected_metadata: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
+    def load(self, expected_metadata: Optional[Dict[str, Any]] = None) -> Optional[LazyCache]:
         """
-        Load all context engine data from cache.
+        Load context engine data from cache.
         
-        Returns dict with:
-        - symbol_table: SymbolTable
-        - dependency_graph: DependencyGraph
+        Returns a `LazyCache` with:
+        - symbol_table: SymbolTable (parsed on first access)
+        - dependency_graph: DependencyGraph (parsed on first access)
         - file_info: Dict
         - metadata: Dict
         
@@ -149,30 +319,26 @@ class CacheManager:
                 if not self.index_path.exists():
                     return None
 
-                with open(self.index_path, 'r', encoding='utf-8') as f:
-                    index_data = json.load(f)
+                index_data = _decode_json(self.index_path.read_bytes())
 
                 # Reject incompatible or stale caches before inflating large payloads.
                 if index_data.get('version') != self.CACHE_VERSION:
                     return None
+                if index_data.get('compression', 'gzip') != self.compression:
+                    return None
                 metadata = index_data.get('metadata', {})
                 if expected_metadata and any(metadata.get(key) != value for key, value in expected_metadata.items()):
                     return None
 
-                symbol_data = self._load_compressed(self.symbols_path)
-                if symbol_data is None:
+                shard_manifest = self._load_shard_manifest()
+                if shard_manifest is None:
                     return None
-                symbol_table = SymbolTable.from_dict(symbol_data)
-
-                dep_data = self._load_compressed(self.dependencies_path)
-                if dep_data is None:
+                if not self.dependencies_path.exists():
                     return None
-                dependency_graph = DependencyGraph.from_dict(dep_data)
 
                 if not self.files_path.exists():
                     return None
-                with open(self.files_path, 'r', encoding='utf-8') as f:
-                    files_data = json.load(f)
+                files_data = _load_mapped_json(self.files_path)
             
             # Convert to FileInfo objects (importing here to avoid circular imports)
             from .indexer import FileInfo
@@ -197,14 +363,13 @@ class CacheManager:
                 for path, data in files_data.items()
             }
             
-            return {
-                'symbol_table': symbol_table,
-                'dependency_graph': dependency_graph,
-                'file_info': file_info,
-                'metadata': index_data.get('metadata', {}),
-                'saved_at': index_data.get('saved_at'),
-                'load_time_ms': round((time.perf_counter() - started_at) * 1000.0, 2),
-            }
+            return LazyCache(
+                self,
+                index_data,
+                shard_manifest,
+                file_info,
+                round((time.perf_counter() - started_at) * 1000.0, 2),
+            )
             
         except Exception:
             report_suppressed_exception("load Context Engine cache", logger=logger, level=logging.WARNING)
@@ -216,12 +381,13 @@ class CacheManager:
             return False
         
         try:
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                index_data = json.load(f)
+            index_data = _decode_json(self.index_path.read_bytes())
             
             metadata = index_data.get('metadata', {})
             if index_data.get('version') != self.CACHE_VERSION:
                 return False
+            if index_data.get('compression', 'gzip') != self.compression:
+                return False
             return not expected_metadata or all(
                 metadata.get(key) == value for key, value in expected_metadata.items()
             )
@@ -231,10 +397,16 @@ class CacheManager:
     
     def clear(self) -> None:
         """Clear all cache files"""
-        for path in [self.index_path, self.symbols_path,
-                     self.dependencies_path, self.files_path, self.content_search_path]:
+        for path in [self.index_path, self.files_path, self.content_search_path]:
             if path.exists():
                 path.unlink()
+        for name in ('symbols', 'dependencies'):
+            for suffix in ('.json.gz', '.json.zst'):
+                (self.cache_dir / f'{name}{suffix}').unlink(missing_ok=True)
+        if self.symbol_shards_dir.is_dir():
+            for shard in self.symbol_shards_dir.iterdir():
+                shard.unlink(missing_ok=True)
+            self.symbol_shards_dir.rmdir()
     
     def get_cache_info(self) -> Optional[Dict]:
         """Get cache metadata without loading full data"""
@@ -242,37 +414,118 @@ class CacheManager:
             return None
         
         try:
-            with open(self.index_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _decode_json(self.index_path.read_bytes())
         except Exception:
             report_suppressed_exception("read Context Engine cache metadata", logger=logger)
             return None
 
     def _atomic_write_json(self, path: Path, data: Any) -> None:
         """Write JSON next to its destination and atomically replace it."""
-        descriptor, temporary_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=self.cache_dir)
-        temporary_path = Path(temporary_name)
-        try:
-            with os.fdopen(descriptor, 'w', encoding='utf-8', newline='') as stream:
-                json.dump(data, stream, ensure_ascii=False, separators=(',', ':'))
-                stream.flush()
-                os.fsync(stream.fileno())
-            os.replace(temporary_path, path)
-        except Exception:
-            temporary_path.unlink(missing_ok=True)
-            raise
+        self._atomic_write_bytes(path, _encode_json(data))
     
     def _save_compressed(self, path: Path, data: Dict) -> None:
-        """Save data as compressed JSON"""
-        descriptor, temporary_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=self.cache_dir)
+        """Save data as compressed JSON (zstd when available, else gzip)"""
+        self._atomic_write_bytes(path, self._compress(_encode_json(data)))
+
+    def _save_shard(self, bucket: int, symbols: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write one symbol shard if it changed and return its manifest entry."""
+        entry = self._write_if_changed(self._shard_path(bucket), _encode_json(symbols), previous)
+        entry['count'] = len(symbols)
+        return entry
+
+    def _write_if_changed(
+        self,
+        path: Path,
+        encoded: bytes,
+        previous: Optional[Dict[str, Any]],
+        compress: bool = True,
+    ) -> Dict[str, Any]:
+        """Write an encoded payload unless the file already holds exactly these bytes.
+
+        ``previous`` is the digest record returned by the last write of
+        ``path``. Its digest covers the uncompressed payload, so an unchanged
+        payload skips compression as well as the write and fsync. The file's
+        size and mtime must still match, so edits made outside of save() are
+        overwritten.
+        """
+        digest = hashlib.blake2b(encoded, digest_size=16).hexdigest()
+        if previous and previous.get('digest') == digest:
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_size, stat.st_mtime_ns) == (previous.get('size'), previous.get('mtime_ns')):
+                return dict(previous)
+        self._atomic_write_bytes(path, self._compress(encoded) if compress else encoded)
+        stat = path.stat()
+        return {'digest': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _read_previous_digests(self) -> Dict[str, Dict[str, Any]]:
+        """Return the file digests recorded by the last compatible save, or ``{}``."""
+        try:
+            index_data = _decode_json(self.index_path.read_bytes())
+        except Exception:
+            # No usable index only means every file is rewritten.
+            return {}
+        if index_data.get('version') != self.CACHE_VERSION or index_data.get('compression') != self.compression:
+            return {}
+        digests = index_data.get('digests')
+        return digests if isinstance(digests, dict) else {}
+
+    def _read_shard_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Return the shard entries of the current manifest, or ``{}`` if unreadable."""
+        try:
+            shards = _load_mapped_json(self.symbols_path, _inflate).get('shards')
+        except Exception:
+            # A missing or damaged manifest only means every shard is rewritten.
+            return {}
+        return shards if isinstance(shards, dict) else {}
+
+    def _load_shard_manifest(self) -> Optional[Dict[str, Any]]:
+        """Read the symbol shard manifest, checking each shard against its recorded size."""
+        manifest = self._load_compressed(self.symbols_path)
+        if manifest is None:
+            return None
+        for name, entry in manifest.get('shards', {}).items():
+            # A shard replaced or truncated outside of save() invalidates the cache.
+            try:
+                if self._shard_path(int(name, 16)).stat().st_size != entry.get('size'):
+                    return None
+            except OSError:
+                return None
+        return manifest
+
+    def _read_symbol_shards(self, manifest: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Merge the shards listed in ``manifest`` into one symbol table payload."""
+        shards = manifest.get('shards', {})
+        symbols: Dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="context-cache-load") as executor:
+            for payload in executor.map(self._load_compressed, (self._shard_path(int(name, 16)) for name in shards)):
+                if payload is None:
+                    return None
+                symbols.update(payload)
+        return {'symbols': symbols, 'stats': manifest.get('stats', {})}
+
+    def _compress(self, encoded: bytes) -> bytes:
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=self.COMPRESSION_LEVEL).compress(encoded)
+        return gzip.compress(encoded, compresslevel=self.COMPRESSION_LEVEL, mtime=0)
+
+    def _atomic_write_bytes(self, path: Path, payload: bytes) -> None:
+        """Write a fully built payload to a sibling temp file and atomically replace ``path``."""
+        descriptor, temporary_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
         temporary_path = Path(temporary_name)
         try:
-            with os.fdopen(descriptor, 'wb') as raw:
-                with gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=self.COMPRESSION_LEVEL, mtime=0) as compressed:
-                    encoded = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
-                    compressed.write(encoded)
-                raw.flush()
-                os.fsync(raw.fileno())
+            try:
+                # The payload is built in memory first, so this is normally a
+                # single write(2); loop only for short writes.
+                view = memoryview(payload)
+                written = 0
+                while written < len(view):
+                    written += os.write(descriptor, view[written:])
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
             os.replace(temporary_path, path)
         except Exception:
             temporary_path.unlink(missing_ok=True)
@@ -284,8 +537,7 @@ class CacheManager:
             return None
         
         try:
-            with gzip.open(path, 'rt', encoding='utf-8') as stream:
-                return json.load(stream)
+            return _load_mapped_json(path, _inflate)
         except Exception:
             report_suppressed_exception(f"load compressed Context Engine cache file {path.name}", logger=logger)
             return None
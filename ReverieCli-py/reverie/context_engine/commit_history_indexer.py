@@ -13,16 +13,28 @@ apply successful patterns to new changes.
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Tuple, Any
-from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
 import json
 import re
+import sys
 import time
 from collections import defaultdict
+from itertools import islice
 from datetime import datetime
 
 
+# Kept as separate patterns: each starts with a literal, which lets the regex
+# engine skip ahead quickly; a fused alternation scans measurably slower.
+_DIFF_ENTITY_PATTERNS = (
+    re.compile(r'def\s+(\w+)\s*\('),  # Python functions
+    re.compile(r'class\s+(\w+)\s*:'),  # Python classes
+    re.compile(r'function\s+(\w+)\s*\('),  # JavaScript functions
+    re.compile(r'interface\s+(\w+)'),  # TypeScript interfaces
+)
+
+
 class ChangeType(Enum):
     """Types of changes in commits"""
     ADD = auto()           # Adding new code
@@ -37,7 +49,26 @@ class ChangeType(Enum):
     TEST = auto()          # Test changes
 
 
-@dataclass
+# Lowercase change-type names used as pattern types and index keys, computed
+# once instead of lower()-ing the enum name on every commit.
+_CHANGE_TYPE_KEYS: Dict[ChangeType, str] = {
+    change_type: sys.intern(change_type.name.lower()) for change_type in ChangeType
+}
+
+# Commit-message keywords per change type, in priority order: the first
+# category with any keyword in the message wins.
+_CHANGE_TYPE_KEYWORDS: Tuple[Tuple[ChangeType, Tuple[str, ...]], ...] = (
+    (ChangeType.FIX, ('fix', 'bug', 'issue', 'hotfix')),
+    (ChangeType.FEATURE, ('feature', 'add', 'implement', 'new')),
+    (ChangeType.REFACTOR, ('refactor', 'clean', 'simplify')),
+    (ChangeType.PERFORMANCE, ('performance', 'optimize', 'speed')),
+    (ChangeType.SECURITY, ('security', 'vulnerability', 'secure')),
+    (ChangeType.TEST, ('test', 'spec', 'testing')),
+    (ChangeType.DOCUMENTATION, ('doc', 'readme', 'comment')),
+)
+
+
+@dataclass(slots=True)
 class CommitPattern:
     """A pattern learned from commits"""
     id: str
@@ -48,7 +79,7 @@ class CommitPattern:
     # Pattern statistics
     frequency: int = 0
     success_rate: float = 1.0  # Based on follow-up commits
-    avg_files_changed: float = 0.0
+    total_files_changed: int = 0  # Summed over `frequency` commits
     
     # Pattern examples
     example_commits: List[str] = field(default_factory=list)
@@ -62,6 +93,26 @@ class CommitPattern:
     # Common mistakes
     common_mistakes: List[str] = field(default_factory=list)
     
+    # Membership index over example_commits (not serialized)
+    _example_commit_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Only a handful of distinct pattern types exist; share one string each.
+        self.pattern_type = sys.intern(self.pattern_type)
+        self._example_commit_set = set(self.example_commits)
+    
+    @property
+    def avg_files_changed(self) -> float:
+        return self.total_files_changed / self.frequency if self.frequency else 0.0
+    
+    def add_example_commit(self, commit_hash: str) -> bool:
+        """Record an example commit once; returns False if it was already listed."""
+        if commit_hash in self._example_commit_set:
+            return False
+        self._example_commit_set.add(commit_hash)
+        self.example_commits.append(commit_hash)
+        return True
+    
     def to_dict(self) -> dict:
         return {
             'id': self.id,
@@ -71,6 +122,7 @@ class CommitPattern:
             'frequency': self.frequency,
             'success_rate': self.success_rate,
             'avg_files_changed': self.avg_files_changed,
+            'total_files_changed': self.total_files_changed,
             'example_commits': self.example_commits,
             'related_patterns': self.related_patterns,
             'use_cases': self.use_cases,
@@ -79,14 +131,23 @@ class CommitPattern:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'CommitPattern':
+        if data.keys() == _COMMIT_PATTERN_PAYLOAD_FIELDS:
+            values = dict(data)
+            del values['avg_files_changed']  # derived from the total
+            return cls(**values)
+        frequency = data.get('frequency', 0)
+        total_files_changed = data.get('total_files_changed')
+        if total_files_changed is None:
+            # Caches written before the running total only stored the average.
+            total_files_changed = round(data.get('avg_files_changed', 0.0) * frequency)
         return cls(
             id=data['id'],
             name=data['name'],
             pattern_type=data['pattern_type'],
             description=data['description'],
-            frequency=data.get('frequency', 0),
+            frequency=frequency,
             success_rate=data.get('success_rate', 1.0),
-            avg_files_changed=data.get('avg_files_changed', 0.0),
+            total_files_changed=total_files_changed,
             example_commits=data.get('example_commits', []),
             related_patterns=data.get('related_patterns', []),
             use_cases=data.get('use_cases', []),
@@ -94,7 +155,7 @@ class CommitPattern:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeEvolution:
     """Track how code has evolved over time"""
     file_path: str
@@ -124,6 +185,8 @@ class CodeEvolution:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'CodeEvolution':
+        if data.keys() == _CODE_EVOLUTION_FIELDS:
+            return cls(**data)
         return cls(
             file_path=data['file_path'],
             entity_name=data['entity_name'],
@@ -135,7 +198,7 @@ class CodeEvolution:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamConvention:
     """Team coding conventions learned from commits"""
     id: str
@@ -153,6 +216,9 @@ class TeamConvention:
     # When to apply
     context: List[str] = field(default_factory=list)
     
+    def __post_init__(self) -> None:
+        self.convention_type = sys.intern(self.convention_type)
+    
     def to_dict(self) -> dict:
         return {
             'id': self.id,
@@ -167,6 +233,8 @@ class TeamConvention:
     
     @classmethod
     def from_dict(cls, data: dict) -> 'TeamConvention':
+        if data.keys() == _TEAM_CONVENTION_FIELDS:
+            return cls(**data)
         return cls(
             id=data['id'],
             convention_type=data['convention_type'],
@@ -179,6 +247,17 @@ class TeamConvention:
         )
 
 
+def _init_field_names(cls: type) -> frozenset:
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
+# Payloads written by to_dict carry exactly the constructor fields; from_dict
+# passes those straight through instead of defaulting field by field.
+_COMMIT_PATTERN_PAYLOAD_FIELDS = _init_field_names(CommitPattern) | {'avg_files_changed'}
+_CODE_EVOLUTION_FIELDS = _init_field_names(CodeEvolution)
+_TEAM_CONVENTION_FIELDS = _init_field_names(TeamConvention)
+
+
 class CommitHistoryIndexer:
     """
     Index and learn from Git commit history.
@@ -199,6 +278,7 @@ class CommitHistoryIndexer:
         
         # Indexes
         self._pattern_by_type: Dict[str, Set[str]] = defaultdict(set)
+        self._pattern_by_desc_token: Dict[str, Set[str]] = defaultdict(set)
         self._evolution_by_file: Dict[str, Set[str]] = defaultdict(set)
         self._convention_by_type: Dict[str, Set[str]] = defaultdict(set)
         
@@ -212,27 +292,30 @@ class CommitHistoryIndexer:
     
     def index_commits(
         self,
-        commits: List[Dict],
+        commits: Iterable[Dict],
         max_commits: int = 1000
     ) -> None:
         """
         Index commits and extract patterns.
         
         Args:
-            commits: List of commit dictionaries with:
+            commits: Commit dictionaries (a list or a lazy iterator) with:
                 - hash: Commit hash
                 - message: Commit message
                 - author: Author name
                 - date: Commit date
                 - files: List of changed files
-                - diff: Diff content
+                - diff: Diff content, or
+                - entities: Entity names already extracted from the diff
             max_commits: Maximum number of commits to analyze
         """
-        commits_to_analyze = commits[:max_commits]
-        self._stats['total_commits_analyzed'] = len(commits_to_analyze)
-        
-        for commit in commits_to_analyze:
+        # Commits are consumed one at a time, so a generator never needs to
+        # hold every diff in memory at once.
+        analyzed = 0
+        for commit in islice(commits, max(0, max_commits)):
             self._analyze_commit(commit)
+            analyzed += 1
+        self._stats['total_commits_analyzed'] = analyzed
         
         # Post-process to find patterns
         self._extract_patterns()
@@ -243,14 +326,26 @@ class CommitHistoryIndexer:
         commit_hash = commit.get('hash', '')
         message = commit.get('message', '')
         files = commit.get('files', [])
-        diff = commit.get('diff', '')
         
         # Determine change type
         change_type = self._classify_change(message, files)
         
-        # Track code evolution
-        for file_path in files:
-            self._track_evolution(file_path, commit, diff)
+        # Track code evolution; the diff covers the whole commit, so its
+        # entities are extracted once rather than per file.
+        entities = commit.get('entities')
+        if entities is None:
+            entities = self._extract_entities_from_diff(commit.get('diff', '')) if files else []
+        if entities:
+            # Every entity touched by this commit records the same version
+            # entry, so build it once and share it (versions are read-only).
+            version = {
+                'commit_hash': commit_hash,
+                'date': commit.get('date', ''),
+                'message': message,
+                'change_type': change_type.name
+            }
+            for file_path in files:
+                self._track_evolution(file_path, entities, version)
         
         # Extract potential patterns
         self._extract_commit_patterns(commit, change_type)
@@ -258,66 +353,33 @@ class CommitHistoryIndexer:
     def _classify_change(self, message: str, files: List[str]) -> ChangeType:
         """Classify the type of change"""
         message_lower = message.lower()
-        
-        if any(word in message_lower for word in ['fix', 'bug', 'issue', 'hotfix']):
-            return ChangeType.FIX
-        elif any(word in message_lower for word in ['feature', 'add', 'implement', 'new']):
-            return ChangeType.FEATURE
-        elif any(word in message_lower for word in ['refactor', 'clean', 'simplify']):
-            return ChangeType.REFACTOR
-        elif any(word in message_lower for word in ['performance', 'optimize', 'speed']):
-            return ChangeType.PERFORMANCE
-        elif any(word in message_lower for word in ['security', 'vulnerability', 'secure']):
-            return ChangeType.SECURITY
-        elif any(word in message_lower for word in ['test', 'spec', 'testing']):
-            return ChangeType.TEST
-        elif any(word in message_lower for word in ['doc', 'readme', 'comment']):
-            return ChangeType.DOCUMENTATION
-        else:
-            return ChangeType.MODIFY
+        for change_type, keywords in _CHANGE_TYPE_KEYWORDS:
+            for keyword in keywords:
+                if keyword in message_lower:
+                    return change_type
+        return ChangeType.MODIFY
     
-    def _track_evolution(self, file_path: str, commit: Dict, diff: str) -> None:
+    def _track_evolution(self, file_path: str, entities: List[str], version: Dict) -> None:
         """Track how code has evolved"""
-        # Extract entities from diff (simplified)
-        entities = self._extract_entities_from_diff(diff)
-        
+        evolutions = self.evolutions
         for entity in entities:
             key = f"{file_path}:{entity}"
             
-            if key not in self.evolutions:
-                self.evolutions[key] = CodeEvolution(
+            evolution = evolutions.get(key)
+            if evolution is None:
+                evolution = evolutions[key] = CodeEvolution(
                     file_path=file_path,
                     entity_name=entity
                 )
                 self._evolution_by_file[file_path].add(key)
             
-            evolution = self.evolutions[key]
-            evolution.versions.append({
-                'commit_hash': commit.get('hash', ''),
-                'date': commit.get('date', ''),
-                'message': commit.get('message', ''),
-                'change_type': self._classify_change(commit.get('message', ''), [file_path]).name
-            })
+            evolution.versions.append(version)
             evolution.total_changes += 1
     
     def _extract_entities_from_diff(self, diff: str) -> List[str]:
         """Extract function/class names from diff"""
-        entities = []
-        
-        # Look for function/class definitions in diff
         # This is simplified - a real implementation would use proper parsing
-        patterns = [
-            r'def\s+(\w+)\s*\(',  # Python functions
-            r'class\s+(\w+)\s*:',  # Python classes
-            r'function\s+(\w+)\s*\(',  # JavaScript functions
-            r'interface\s+(\w+)',  # TypeScript interfaces
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, diff)
-            entities.extend(matches)
-        
-        return list(set(entities))
+        return list({name for pattern in _DIFF_ENTITY_PATTERNS for name in pattern.findall(diff)})
     
     def _extract_commit_patterns(self, commit: Dict, change_type: ChangeType) -> None:
         """Extract patterns from a commit"""
@@ -327,27 +389,24 @@ class CommitHistoryIndexer:
         # Look for common patterns in commit messages
         patterns = self._identify_message_patterns(message)
         
+        type_key = _CHANGE_TYPE_KEYS[change_type]
         for pattern_name in patterns:
-            pattern_id = f"{change_type.name.lower()}_{pattern_name}"
+            pattern_id = f"{type_key}_{pattern_name}"
             
-            if pattern_id not in self.patterns:
-                self.patterns[pattern_id] = CommitPattern(
+            pattern = self.patterns.get(pattern_id)
+            if pattern is None:
+                pattern = self.patterns[pattern_id] = CommitPattern(
                     id=pattern_id,
                     name=pattern_name,
-                    pattern_type=change_type.name.lower(),
-                    description=f"Pattern for {pattern_name} in {change_type.name.lower()} changes"
+                    pattern_type=type_key,
+                    description=f"Pattern for {pattern_name} in {type_key} changes"
                 )
-                self._pattern_by_type[change_type.name.lower()].add(pattern_id)
+                self._index_pattern(pattern_id, pattern)
             
-            pattern = self.patterns[pattern_id]
             pattern.frequency += 1
-            pattern.avg_files_changed = (
-                (pattern.avg_files_changed * (pattern.frequency - 1) + len(files)) /
-                pattern.frequency
-            )
+            pattern.total_files_changed += len(files)
             
-            if commit.get('hash') not in pattern.example_commits:
-                pattern.example_commits.append(commit.get('hash', ''))
+            pattern.add_example_commit(commit.get('hash', ''))
     
     def _identify_message_patterns(self, message: str) -> List[str]:
         """Identify patterns in commit messages"""
@@ -386,10 +445,10 @@ class CommitHistoryIndexer:
                 merged = group[0]
                 for other in group[1:]:
                     merged.frequency += other.frequency
-                    merged.example_commits.extend(other.example_commits)
-                
-                # Remove duplicates
-                merged.example_commits = list(set(merged.example_commits))
+                    merged.total_files_changed += other.total_files_changed
+                    # Skips duplicates without rebuilding the list
+                    for commit_hash in other.example_commits:
+                        merged.add_example_commit(commit_hash)
     
     def _learn_conventions(self) -> None:
         """Learn team conventions from commits"""
@@ -417,13 +476,21 @@ class CommitHistoryIndexer:
         limit: int = 10
     ) -> List[CommitPattern]:
         """Find patterns relevant to a given context"""
+        context_lower = context.lower()
+        # Count description words shared with the context through the token
+        # index instead of re-splitting every description.
+        desc_matches: Dict[str, int] = {}
+        for token in set(context_lower.split()):
+            for pattern_id in self._pattern_by_desc_token.get(token, ()):
+                desc_matches[pattern_id] = desc_matches.get(pattern_id, 0) + 1
+        
         scored_patterns = []
         
-        for pattern in self.patterns.values():
+        for pattern_id, pattern in self.patterns.items():
             if change_type and pattern.pattern_type != change_type:
                 continue
             
-            score = self._calculate_pattern_relevance(pattern, context)
+            score = self._calculate_pattern_relevance(pattern, context_lower, desc_matches.get(pattern_id, 0))
             if score > 0:
                 scored_patterns.append((pattern, score))
         
@@ -457,25 +524,31 @@ class CommitHistoryIndexer:
             ]
         return list(self.conventions.values())
     
+    def _index_pattern(self, pattern_id: str, pattern: CommitPattern) -> None:
+        """Register a new pattern in the type and description-token indexes"""
+        self._pattern_by_type[pattern.pattern_type].add(pattern_id)
+        for token in set(pattern.description.lower().split()):
+            self._pattern_by_desc_token[token].add(pattern_id)
+    
     def _calculate_pattern_relevance(
         self,
         pattern: CommitPattern,
-        context: str
+        context_lower: str,
+        desc_matches: int
     ) -> float:
-        """Calculate relevance of a pattern for a given context"""
+        """Calculate relevance of a pattern for a lowercased context.
+
+        ``desc_matches`` is the number of distinct description words that
+        also occur in the context.
+        """
         score = 0.0
-        context_lower = context.lower()
         
         # Name matching
         if pattern.name.lower() in context_lower:
             score += 3.0
         
         # Description matching
-        if pattern.description:
-            desc_words = set(pattern.description.lower().split())
-            context_words = set(context_lower.split())
-            matches = desc_words & context_words
-            score += len(matches) * 0.5
+        score += desc_matches * 0.5
         
         # Frequency boost
         score += min(pattern.frequency * 0.1, 2.0)
@@ -486,14 +559,35 @@ class CommitHistoryIndexer:
         return score
     
     def to_dict(self) -> dict:
-        """Serialize to dictionary"""
+        """Serialize to dictionary.
+
+        Commit metadata is written once under ``commits``; evolution versions
+        refer to it by commit hash instead of repeating it per entity.
+        """
+        commits: Dict[str, Dict] = {}
+        evolutions = {}
+        for eid, evolution in self.evolutions.items():
+            evolution_data = evolution.to_dict()
+            evolution_data['versions'] = [self._version_ref(version, commits) for version in evolution.versions]
+            evolutions[eid] = evolution_data
         return {
             'patterns': {pid: p.to_dict() for pid, p in self.patterns.items()},
-            'evolutions': {eid: e.to_dict() for eid, e in self.evolutions.items()},
+            'commits': commits,
+            'evolutions': evolutions,
             'conventions': {cid: c.to_dict() for cid, c in self.conventions.items()},
             'stats': self._stats
         }
     
+    @staticmethod
+    def _version_ref(version: Dict, commits: Dict[str, Dict]) -> Any:
+        """Return the commit hash for a version recorded in ``commits``, else the version itself"""
+        commit_hash = version.get('commit_hash')
+        if not isinstance(commit_hash, str):
+            return version
+        shared = commits.setdefault(commit_hash, version)
+        # Versions edited after indexing no longer match their commit; keep them inline.
+        return commit_hash if shared is version or shared == version else version
+    
     @classmethod
     def from_dict(cls, data: dict, project_root: Path) -> 'CommitHistoryIndexer':
         """Deserialize from dictionary"""
@@ -503,10 +597,19 @@ class CommitHistoryIndexer:
         for pid, pattern_data in data.get('patterns', {}).items():
             pattern = CommitPattern.from_dict(pattern_data)
             indexer.patterns[pid] = pattern
-            indexer._pattern_by_type[pattern.pattern_type].add(pid)
+            indexer._index_pattern(pid, pattern)
         
-        # Load evolutions
+        # Load evolutions, resolving commit references to one shared version record
+        commits = data.get('commits') or {}
         for eid, evolution_data in data.get('evolutions', {}).items():
+            if commits:
+                evolution_data = {
+                    **evolution_data,
+                    'versions': [
+                        commits[version] if isinstance(version, str) else version
+                        for version in evolution_data.get('versions', [])
+                    ],
+                }
             evolution = CodeEvolution.from_dict(evolution_data)
             indexer.evolutions[eid] = evolution
             indexer._evolution_by_file[evolution.file_path].add(eid)
@@ -1,11 +1,27 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import atexit
+import hashlib
 import json
+import os
+import queue
 import re
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 import requests
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
 from ..nvidia import (
     apply_nvidia_request_defaults,
     build_nvidia_openai_options,
@@ -20,6 +36,22 @@ logger = logging.getLogger(__name__)
 REQUEST_RETRY_DELAYS_SECONDS = (1, 3, 5, 7, 15)
 REQUEST_RETRY_ATTEMPTS = len(REQUEST_RETRY_DELAYS_SECONDS)
 
+# Conversation checkpoints are repetitive JSON; store them zstd-compressed
+# when zstandard is installed. Metadata sidecars stay plain JSON.
+CHECKPOINT_SUFFIX = '.json.zst' if zstandard is not None else '.json'
+CHECKPOINT_COMPRESSION_LEVEL = 3
+
+_thread_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """Return this thread's keep-alive session for compression requests."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
 
 def _collect_codex_summary_text(response: requests.Response) -> str:
     """Collect assistant text from Codex SSE output."""
@@ -147,13 +179,17 @@ def _unwrap_memory_block(content: str) -> str:
     return text.strip()
 
 
-def _split_system_memory_messages(messages: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
-    """Separate durable system prompts from Reverie-generated memory wrappers."""
+def _partition_messages(
+    messages: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[str], List[Dict[str, Any]]]:
+    """Split messages in one pass into durable system prompts, memory wrapper texts and non-system messages."""
     system_msgs: List[Dict[str, Any]] = []
     memory_blocks: List[str] = []
+    other_msgs: List[Dict[str, Any]] = []
 
     for message in messages:
         if str(message.get("role", "")).strip().lower() != "system":
+            other_msgs.append(message)
             continue
         content = _get_message_text(message)
         stripped = content.lstrip()
@@ -166,6 +202,12 @@ def _split_system_memory_messages(messages: List[Dict[str, Any]]) -> tuple[List[
             continue
         system_msgs.append(message)
 
+    return system_msgs, memory_blocks, other_msgs
+
+
+def _split_system_memory_messages(messages: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[str]]:
+    """Separate durable system prompts from Reverie-generated memory wrappers."""
+    system_msgs, memory_blocks, _ = _partition_messages(messages)
     return system_msgs, memory_blocks
 
 
@@ -189,6 +231,10 @@ def _select_recent_messages(messages: List[Dict[str, Any]], keep_last: int) -> L
     return list(messages[start:])
 
 
+# Transcript labels for the common roles, so they are not re-uppercased per message.
+_ROLE_LABELS = {"user": "USER", "assistant": "ASSISTANT", "system": "SYSTEM", "developer": "DEVELOPER"}
+
+
 def _format_compression_message(message: Dict[str, Any]) -> str:
     """Render one bounded transcript entry for provider-side compression."""
     role = str(message.get("role", "unknown") or "unknown").strip().lower()
@@ -200,7 +246,7 @@ def _format_compression_message(message: Dict[str, Any]) -> str:
     if not content:
         return ""
 
-    role_label = role.upper()
+    role_label = _ROLE_LABELS.get(role) or role.upper()
     if role == "tool":
         tool_name = str(
             message.get("name")
@@ -230,10 +276,11 @@ def _build_compression_transcript(
     parts = [part for part in (_format_compression_message(message) for message in messages) if part]
     if not parts:
         return ""
-    joined = "\n\n".join(parts)
     max_chars = max(20000, int(max_chars or 160000))
-    if len(joined) <= max_chars:
-        return joined
+    # Measure before joining: a long history is trimmed to head + tail below,
+    # so the full transcript string is never built just to be discarded.
+    if sum(map(len, parts)) + 2 * (len(parts) - 1) <= max_chars:
+        return "\n\n".join(parts)
 
     head_budget = max_chars // 5
     tail_budget = max_chars - head_budget - 120
@@ -269,12 +316,7 @@ def build_memory_digest(messages: List[Dict[str, Any]]) -> str:
     if not messages:
         return ""
 
-    _, memory_blocks = _split_system_memory_messages(messages)
-    non_system = [
-        message
-        for message in messages
-        if str(message.get("role", "")).strip().lower() != "system"
-    ]
+    _, memory_blocks, non_system = _partition_messages(messages)
 
     recent_user: List[str] = []
     recent_assistant: List[str] = []
@@ -552,6 +594,22 @@ def _apply_nvidia_request_payload_defaults(
     return apply_nvidia_request_defaults(prepared, {"selected_model_id": model})
 
 
+def _dump_json(data: Any) -> bytes:
+    """Encode compact UTF-8 JSON for checkpoints and request bodies, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) fall back to json.
+            pass
+    try:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    except UnicodeEncodeError:
+        # Lone surrogates (common in pasted Windows console text) cannot be
+        # UTF-8 encoded; escape them as \uXXXX like requests' ``json=`` did.
+        return json.dumps(data, separators=(',', ':')).encode('ascii')
+
+
 def make_compression_request_with_retry(
     url: str,
     headers: Dict[str, str],
@@ -573,8 +631,16 @@ def make_compression_request_with_retry(
     Raises:
         requests.RequestException: If all retries fail
     """
-    # Validate payload
-    payload = validate_payload_for_compression(payload)
+    # Encode once for every attempt; a successful encode is the validation.
+    # orjson is much faster than the stdlib encoder requests would run for
+    # ``json=`` on a large transcript. Only unencodable payloads are sanitized.
+    try:
+        body = _dump_json(payload)
+    except (TypeError, ValueError):
+        payload = validate_payload_for_compression(payload)
+        body = _dump_json(payload)
+    if not any(str(key).lower() == "content-type" for key in headers):
+        headers = {**headers, "Content-Type": "application/json"}
     
     last_error = None
     attempts = max(0, min(int(max_retries or 0), REQUEST_RETRY_ATTEMPTS))
@@ -582,10 +648,11 @@ def make_compression_request_with_retry(
         try:
             logger.debug(f"Compression request attempt {attempt + 1}/{attempts + 1}")
             
-            response = requests.post(
+            # Reuse the pooled connection so repeated compactions skip the TCP/TLS handshake.
+            response = _get_http_session().post(
                 url,
                 headers=headers,
-                json=payload,
+                data=body,
                 timeout=120  # Longer timeout for compression
             )
             
@@ -602,11 +669,277 @@ def make_compression_request_with_retry(
             )
             
             if attempt < attempts:
-                import time
                 time.sleep(REQUEST_RETRY_DELAYS_SECONDS[attempt])
     
     raise last_error or requests.RequestException("All compression retry attempts failed")
 
+
+def _checkpoint_stem(path: Path) -> str:
+    """Return a checkpoint file name without its ``.json`` or ``.json.zst`` suffix."""
+    name = path.name
+    if name.endswith('.zst'):
+        name = name[:-len('.zst')]
+    return name[:-len('.json')]
+
+
+def _checkpoint_sidecar(path: Path) -> Path:
+    """Return the metadata sidecar path for a ``.json`` or ``.json.zst`` checkpoint."""
+    return path.with_name(_checkpoint_stem(path) + '.meta.json')
+
+
+def _read_checkpoint_bytes(path: Path) -> bytes:
+    """Read a checkpoint file, inflating zstd-compressed checkpoints."""
+    raw = path.read_bytes()
+    if path.name.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path.name}")
+        return zstandard.ZstdDecompressor().decompress(raw)
+    return raw
+
+
+def _load_checkpoint(raw: bytes) -> Any:
+    """Parse checkpoint JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json accepts a few inputs orjson does not (NaN, huge integers).
+            pass
+    return json.loads(raw.decode('utf-8'))
+
+
+def _summarize_openai_chat(*, client: Any, model: str, prompt: List[Dict[str, Any]], **_: Any) -> Tuple[str, Any]:
+    """Summarize through an OpenAI-compatible chat completions client."""
+    # If model indicates thinking-capable mode, include chat_template_kwargs
+    extra_body = _openai_extra_body_for_model(model)
+    model_for_sdk, extra_body, nvidia_options = _resolve_nvidia_openai_call_options(
+        model,
+        extra_body=extra_body,
+    )
+    kwargs: Dict[str, Any] = {
+        "model": model_for_sdk,
+        "messages": prompt,
+        "stream": False,
+    }
+    for key in ("temperature", "top_p", "max_tokens"):
+        if nvidia_options.get(key) is not None:
+            kwargs[key] = nvidia_options[key]
+    if extra_body is not None:
+        kwargs["extra_body"] = extra_body
+    response = client.chat.completions.create(**kwargs)
+    return response.choices[0].message.content, getattr(response, "usage", None)
+
+
+def _summarize_openai_responses(*, client: Any, model: str, prompt: List[Dict[str, Any]], **_: Any) -> Tuple[str, Any]:
+    """Summarize through the OpenAI Responses API."""
+    from ..codex import build_codex_request_payload
+
+    converted = build_codex_request_payload(model, prompt, tools=None, stream=False)
+    response = client.responses.create(
+        model=model,
+        input=converted["input"],
+        stream=False,
+    )
+    return str(getattr(response, "output_text", "") or ""), getattr(response, "usage", None)
+
+
+def _summarize_request(
+    *,
+    model: str,
+    prompt: List[Dict[str, Any]],
+    base_url: str,
+    api_key: str,
+    custom_headers: Optional[Dict[str, str]],
+    **_: Any,
+) -> Tuple[str, Any]:
+    """Summarize through a raw OpenAI-compatible HTTP endpoint."""
+    payload = {
+        "model": model,
+        "messages": prompt,
+        "stream": False
+    }
+    payload = _apply_nvidia_request_payload_defaults(base_url, payload)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+    for key, value in (custom_headers or {}).items():
+        normalized_key = str(key or "").strip()
+        normalized_value = str(value or "").strip()
+        if normalized_key and normalized_value:
+            headers[normalized_key] = normalized_value
+    response = make_compression_request_with_retry(
+        base_url, apply_reverie_client_identity(headers), payload
+    )
+    response_data = response.json()
+    usage = response_data.get("usage") if isinstance(response_data, dict) else None
+    return response_data["choices"][0]["message"]["content"], usage
+
+
+def _summarize_anthropic(*, client: Any, model: str, prompt: List[Dict[str, Any]], **_: Any) -> Tuple[str, Any]:
+    """Summarize through the Anthropic SDK, lifting the system prompt out of the messages."""
+    anthropic_messages = []
+    system_message = None
+
+    for msg in prompt:
+        if msg["role"] == "system":
+            system_message = msg["content"]
+        else:
+            anthropic_messages.append({
+                "role": msg["role"],
+                "content": msg["content"]
+            })
+
+    kwargs: Dict[str, Any] = {
+        "model": model,
+        "messages": anthropic_messages,
+        "max_tokens": 4096,
+    }
+
+    if system_message:
+        kwargs["system"] = system_message
+
+    response = client.messages.create(**kwargs)
+    return response.content[0].text, getattr(response, "usage", None)
+
+
+def _summarize_codex(
+    *,
+    model: str,
+    prompt: List[Dict[str, Any]],
+    base_url: str,
+    api_key: str,
+    custom_headers: Optional[Dict[str, str]],
+    **_: Any,
+) -> Tuple[str, Any]:
+    """Summarize through the Codex streaming endpoint; empty without credentials."""
+    from ..codex import (
+        build_codex_request_payload,
+        detect_codex_cli_credentials,
+        get_codex_request_headers,
+        resolve_codex_request_url,
+    )
+
+    cred = detect_codex_cli_credentials()
+    access_token = str(api_key or cred.get("api_key", "") or "").strip()
+    if not access_token:
+        return "", None
+    request_url = resolve_codex_request_url(base_url, "")
+
+    payload = build_codex_request_payload(
+        model_name=model,
+        messages=prompt,
+        tools=None,
+        stream=True,
+    )
+    headers = get_codex_request_headers(
+        api_key=access_token,
+        account_id=str(cred.get("account_id", "")).strip(),
+        auth_mode=str(cred.get("auth_mode", "")).strip(),
+        extra_headers=custom_headers,
+        stream=True,
+        request_url=request_url,
+    )
+    response = _get_http_session().post(
+        request_url,
+        headers=headers,
+        json=payload,
+        stream=True,
+        timeout=120,
+    )
+    response.raise_for_status()
+    with response:
+        return _collect_codex_summary_text(response), None
+
+
+# Summary request per provider. Each takes keyword arguments (client, model,
+# prompt, base_url, api_key, custom_headers) and returns (summary, usage).
+_SUMMARY_PROVIDERS: Dict[str, Callable[..., Tuple[str, Any]]] = {
+    "openai-sdk": _summarize_openai_chat,
+    "openai-chat": _summarize_openai_chat,
+    "openai-responses": _summarize_openai_responses,
+    "request": _summarize_request,
+    "anthropic": _summarize_anthropic,
+    "codex": _summarize_codex,
+}
+
+
+def _atomic_write(path: Path, data: bytes, fsync: bool) -> None:
+    """Write ``data`` to a sibling temp file and rename it over ``path``."""
+    temporary = path.with_name(path.name + '.tmp')
+    try:
+        with open(temporary, 'wb') as stream:
+            stream.write(data)
+            if fsync:
+                stream.flush()
+                os.fsync(stream.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def _write_checkpoint_files(path: Path, payload: bytes, metadata: bytes, fsync: bool = True) -> None:
+    """Atomically write a checkpoint and its metadata sidecar.
+
+    Readers never see a torn file: each one is renamed into place once
+    complete. ``fsync=False`` leaves flushing to the OS, which is enough for
+    automatic checkpoints that are superseded moments later.
+    """
+    if path.name.endswith('.zst'):
+        payload = zstandard.ZstdCompressor(level=CHECKPOINT_COMPRESSION_LEVEL).compress(payload)
+    _atomic_write(path, payload, fsync)
+    # A few hundred bytes of metadata, so listing never parses the history.
+    _atomic_write(_checkpoint_sidecar(path), metadata, fsync)
+
+
+class _CheckpointWriter:
+    """Single daemon thread that writes already-encoded checkpoints in order."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[Tuple[Path, bytes, bytes]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Paths submitted but not yet written (or failed).
+        self._pending: Dict[str, int] = {}
+
+    def submit(self, path: Path, payload: bytes, metadata: bytes) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="reverie-checkpoint-writer", daemon=True)
+                self._thread.start()
+                # Daemon threads are killed at exit; finish queued writes first.
+                atexit.register(self.flush)
+            self._pending[str(path)] = self._pending.get(str(path), 0) + 1
+        self._queue.put((path, payload, metadata))
+
+    def is_pending(self, path: str) -> bool:
+        """Return True while a write to ``path`` is still queued or in progress."""
+        with self._lock:
+            return path in self._pending
+
+    def flush(self) -> None:
+        """Block until every submitted checkpoint has been written."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            path, payload, metadata = self._queue.get()
+            try:
+                _write_checkpoint_files(path, payload, metadata, False)
+            except Exception as e:
+                logger.warning("Failed to write checkpoint %s: %s", path.name, e)
+            finally:
+                with self._lock:
+                    remaining = self._pending.pop(str(path), 1) - 1
+                    if remaining:
+                        self._pending[str(path)] = remaining
+                self._queue.task_done()
+
+
+_checkpoint_writer = _CheckpointWriter()
+
+
 class ContextCompressor:
     """
     Handles prompt compression and memory checkpointing.
@@ -616,32 +949,112 @@ class ContextCompressor:
     retainment and recursive summary retrieval.
     """
     
-    def __init__(self, cache_dir: Path):
+    # Digest and path of the last checkpoint saved per (checkpoint dir, session).
+    # Shared across instances because callers build a compressor per compaction.
+    _last_saved: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
+    # list_checkpoints results per (checkpoint dir, session filter), keyed on
+    # the directory mtime: every save or eviction adds or removes an entry.
+    _list_cache: Dict[Tuple[str, Optional[str]], Tuple[int, List[Dict]]] = {}
+    
+    MAX_CHECKPOINTS = 100
+    
+    def __init__(self, cache_dir: Path, max_checkpoints: int = MAX_CHECKPOINTS):
         self.cache_dir = cache_dir / 'checkpoints'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.last_checkpoint = None
+        self.max_checkpoints = max_checkpoints
 
-    def save_checkpoint(self, messages: List[Dict], note: str = "", session_id: str = "default") -> str:
-        """Save current messages to a checkpoint file."""
+    def save_checkpoint(
+        self,
+        messages: List[Dict],
+        note: str = "",
+        session_id: str = "default",
+        wait: bool = True,
+        skip_if_unchanged: bool = False
+    ) -> str:
+        """Save current messages to a checkpoint file.
+
+        The checkpoint is always encoded on the calling thread. With
+        ``wait=False`` the file writes are handed to a background writer,
+        which skips fsync, and the returned path may not exist until `flush`
+        is called. With
+        ``skip_if_unchanged`` nothing is written when the messages match the
+        last checkpoint saved for this session and that file still exists (or
+        is still queued); that path is returned.
+        """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         checkpoint_data = {
             'timestamp': datetime.now().isoformat(),
             'session_id': session_id,
             'note': note,
             'message_count': len(messages),
-            'messages': messages
         }
-        filename = f"checkpoint_{session_id}_{timestamp}.json"
+        filename = f"checkpoint_{session_id}_{timestamp}{CHECKPOINT_SUFFIX}"
         path = self.cache_dir / filename
+        last_key = (str(self.cache_dir), session_id)
         
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint_data, f, ensure_ascii=False, separators=(',', ':'))
+            # The history is encoded once: its bytes are both hashed and
+            # spliced into the checkpoint after the metadata fields.
+            encoded_messages = _dump_json(messages)
+            digest = hashlib.blake2b(encoded_messages, digest_size=16).digest()
+            last_saved = self._last_saved.get(last_key)
+            if (
+                skip_if_unchanged
+                and last_saved is not None
+                and last_saved[0] == digest
+                and (os.path.exists(last_saved[1]) or _checkpoint_writer.is_pending(last_saved[1]))
+            ):
+                self.last_checkpoint = last_saved[1]
+                return last_saved[1]
+            metadata = _dump_json(checkpoint_data)
+            payload = b''.join((metadata[:-1], b',"messages":', encoded_messages, b'}'))
+            if wait:
+                _write_checkpoint_files(path, payload, metadata)
+            else:
+                _checkpoint_writer.submit(path, payload, metadata)
+            self._last_saved[last_key] = (digest, str(path))
             self.last_checkpoint = str(path)
+            self._evict_old_checkpoints()
             return str(path)
         except Exception as e:
             return ""
 
+    def _checkpoint_files(self) -> List[Path]:
+        """Checkpoint files in the directory, excluding sidecars and temp files."""
+        return [
+            p for p in self.cache_dir.glob("checkpoint_*.json*")
+            if p.name.endswith(('.json', '.json.zst')) and not p.name.endswith('.meta.json')
+        ]
+
+    def _evict_old_checkpoints(self) -> None:
+        """Delete the oldest checkpoints (and sidecars) beyond ``max_checkpoints``."""
+        if not self.max_checkpoints or self.max_checkpoints <= 0:
+            return
+        files = self._checkpoint_files()
+        if len(files) <= self.max_checkpoints:
+            return
+        # Names end in _YYYYMMDD_HHMMSS, which orders chronologically across sessions.
+        files.sort(key=lambda p: _checkpoint_stem(p)[-len('YYYYMMDD_HHMMSS'):])
+        evicted = set()
+        for stale in files[:len(files) - self.max_checkpoints]:
+            stale.unlink(missing_ok=True)
+            _checkpoint_sidecar(stale).unlink(missing_ok=True)
+            evicted.add(str(stale))
+        # A later skip_if_unchanged save must not hand back a deleted path.
+        for key, (_, saved_path) in list(self._last_saved.items()):
+            if saved_path in evicted:
+                self._last_saved.pop(key, None)
+
+    def flush(self) -> None:
+        """Wait for checkpoints saved with ``wait=False`` to reach disk."""
+        _checkpoint_writer.flush()
+
+    def load_checkpoint(self, path: Path) -> Dict[str, Any]:
+        """Read a full checkpoint (``.json`` or ``.json.zst``) including its messages."""
+        self.flush()
+        return _load_checkpoint(_read_checkpoint_bytes(Path(path)))
+
     def compress(
         self,
         messages: List[Dict],
@@ -675,12 +1088,7 @@ class ContextCompressor:
         if not messages:
             return []
 
-        system_msgs, memory_blocks = _split_system_memory_messages(messages)
-        other_msgs = [
-            message
-            for message in messages
-            if str(message.get("role", "")).strip().lower() != "system"
-        ]
+        system_msgs, memory_blocks, other_msgs = _partition_messages(messages)
 
         # If conversation is short and we do not need to collapse prior memory wrappers, leave it alone.
         if len(other_msgs) < 8 and not memory_blocks:
@@ -703,7 +1111,8 @@ class ContextCompressor:
             return compact_history or messages
 
         # Save checkpoint before compression (Safety)
-        self.save_checkpoint(messages, "Pre-compression auto-save", session_id)
+        # Written in the background so the provider call is not delayed by disk I/O.
+        self.save_checkpoint(messages, "Pre-compression auto-save", session_id, wait=False, skip_if_unchanged=True)
 
         conversation_text = _build_compression_transcript(history_to_compress)
         if not conversation_text:
@@ -728,7 +1137,7 @@ class ContextCompressor:
                 "content": f"{MEMORY_BLOCK_HEADER}\n{summary_text}\n{MEMORY_BLOCK_END}",
             }
             new_history = system_msgs + [summary_message] + recent_msgs
-            self.save_checkpoint(new_history, note, session_id)
+            self.save_checkpoint(new_history, note, session_id, wait=False)
             return new_history
 
         prompt = [
@@ -757,128 +1166,17 @@ class ContextCompressor:
         ]
         
         try:
-            usage_info = None
-            # Use the provided client to summarize based on provider
-            if provider in {"openai-sdk", "openai-chat"}:
-                # If model indicates thinking-capable mode, include chat_template_kwargs
-                extra_body = _openai_extra_body_for_model(model)
-                model_for_sdk, extra_body, nvidia_options = _resolve_nvidia_openai_call_options(
-                    model,
-                    extra_body=extra_body,
-                )
-                kwargs: Dict[str, Any] = {
-                    "model": model_for_sdk,
-                    "messages": prompt,
-                    "stream": False,
-                }
-                for key in ("temperature", "top_p", "max_tokens"):
-                    if nvidia_options.get(key) is not None:
-                        kwargs[key] = nvidia_options[key]
-                if extra_body is not None:
-                    kwargs["extra_body"] = extra_body
-                response = client.chat.completions.create(**kwargs)
-                summary = response.choices[0].message.content
-                usage_info = getattr(response, "usage", None)
-            elif provider == "openai-responses":
-                from ..codex import build_codex_request_payload
-
-                converted = build_codex_request_payload(model, prompt, tools=None, stream=False)
-                response = client.responses.create(
-                    model=model,
-                    input=converted["input"],
-                    stream=False,
-                )
-                summary = str(getattr(response, "output_text", "") or "")
-                usage_info = getattr(response, "usage", None)
-            elif provider == "request":
-                # Use requests library for request provider
-                payload = {
-                    "model": model,
-                    "messages": prompt,
-                    "stream": False
-                }
-                payload = _apply_nvidia_request_payload_defaults(base_url, payload)
-                headers = {
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-                for key, value in (custom_headers or {}).items():
-                    normalized_key = str(key or "").strip()
-                    normalized_value = str(value or "").strip()
-                    if normalized_key and normalized_value:
-                        headers[normalized_key] = normalized_value
-                response = make_compression_request_with_retry(
-                    base_url, apply_reverie_client_identity(headers), payload
-                )
-                response_data = response.json()
-                summary = response_data["choices"][0]["message"]["content"]
-                usage_info = response_data.get("usage") if isinstance(response_data, dict) else None
-            elif provider == "anthropic":
-                # Use Anthropic SDK
-                # Convert messages to Anthropic format
-                anthropic_messages = []
-                system_message = None
-                
-                for msg in prompt:
-                    if msg["role"] == "system":
-                        system_message = msg["content"]
-                    else:
-                        anthropic_messages.append({
-                            "role": msg["role"],
-                            "content": msg["content"]
-                        })
-                
-                kwargs = {
-                    "model": model,
-                    "messages": anthropic_messages,
-                    "max_tokens": 4096,
-                }
-                
-                if system_message:
-                    kwargs["system"] = system_message
-                
-                response = client.messages.create(**kwargs)
-                summary = response.content[0].text
-                usage_info = getattr(response, "usage", None)
-            elif provider == "codex":
-                from ..codex import (
-                    build_codex_request_payload,
-                    detect_codex_cli_credentials,
-                    get_codex_request_headers,
-                    resolve_codex_request_url,
-                )
-
-                cred = detect_codex_cli_credentials()
-                access_token = str(api_key or cred.get("api_key", "") or "").strip()
-                if not access_token:
-                    return compact_with_summary(get_fallback_summary(), "Post-compression deterministic fallback")
-                request_url = resolve_codex_request_url(base_url, "")
-
-                payload = build_codex_request_payload(
-                    model_name=model,
-                    messages=prompt,
-                    tools=None,
-                    stream=True,
-                )
-                headers = get_codex_request_headers(
-                    api_key=access_token,
-                    account_id=str(cred.get("account_id", "")).strip(),
-                    auth_mode=str(cred.get("auth_mode", "")).strip(),
-                    extra_headers=custom_headers,
-                    stream=True,
-                    request_url=request_url,
-                )
-                response = requests.post(
-                    request_url,
-                    headers=headers,
-                    json=payload,
-                    stream=True,
-                    timeout=120,
-                )
-                response.raise_for_status()
-                summary = _collect_codex_summary_text(response)
-            else:
+            summarize = _SUMMARY_PROVIDERS.get(provider)
+            if summarize is None:
                 raise ValueError(f"Unknown provider: {provider}")
+            summary, usage_info = summarize(
+                client=client,
+                model=model,
+                prompt=prompt,
+                base_url=base_url,
+                api_key=api_key,
+                custom_headers=custom_headers,
+            )
 
             if not str(summary or "").strip():
                 return compact_with_summary(get_fallback_summary(), "Post-compression deterministic fallback")
@@ -902,25 +1200,43 @@ class ContextCompressor:
 
     def list_checkpoints(self, session_id: Optional[str] = None) -> List[Dict]:
         """List all available checkpoints for a session."""
+        self.flush()
+        cache_key = (str(self.cache_dir), session_id)
+        try:
+            dir_mtime_ns = self.cache_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return [dict(item) for item in cached[1]]
+        
         checkpoints = []
-        for p in self.cache_dir.glob("checkpoint_*.json"):
+        for p in self._checkpoint_files():
             try:
-                with open(p, 'r', encoding='utf-8') as f:
-                    # Just read metadata, not the whole message history
-                    data = json.load(f)
-                    if session_id and data.get('session_id') != session_id:
-                        continue
-                    checkpoints.append({
-                        'path': str(p),
-                        'filename': p.name,
-                        'timestamp': data.get('timestamp'),
-                        'note': data.get('note'),
-                        'message_count': data.get('message_count')
-                    })
+                try:
+                    data = _load_checkpoint(_checkpoint_sidecar(p).read_bytes())
+                except FileNotFoundError:
+                    # Checkpoints saved before metadata sidecars existed.
+                    data = _load_checkpoint(_read_checkpoint_bytes(p))
+                if session_id and data.get('session_id') != session_id:
+                    continue
+                checkpoints.append({
+                    'path': str(p),
+                    'filename': p.name,
+                    'timestamp': data.get('timestamp'),
+                    'note': data.get('note'),
+                    'message_count': data.get('message_count')
+                })
             except Exception:
                 continue
         
-        return sorted(checkpoints, key=lambda x: x['timestamp'], reverse=True)
+        checkpoints.sort(key=lambda x: x['timestamp'], reverse=True)
+        # A change landing in the same timestamp tick as this scan would not
+        # move the mtime, so only cache listings of a directory that has been
+        # quiet for a second.
+        if dir_mtime_ns is not None and time.time_ns() - dir_mtime_ns > 1_000_000_000:
+            self._list_cache[cache_key] = (dir_mtime_ns, [dict(item) for item in checkpoints])
+        return checkpoints
 
 
 def summarize_game_context(
@@ -450,13 +450,17 @@ class ContextEngineCore:
             
             if not cached_data:
                 return False
+            symbol_table = cached_data.symbol_table
+            dependency_graph = cached_data.dependency_graph
+            if symbol_table is None or dependency_graph is None:
+                return False
             
             # Load traditional components
-            self.symbol_table.replace_with(cached_data['symbol_table'])
-            self.dependency_graph.replace_with(cached_data['dependency_graph'])
+            self.symbol_table.replace_with(symbol_table)
+            self.dependency_graph.replace_with(dependency_graph)
             
             # Load advanced components from metadata
-            metadata = cached_data.get('metadata', {})
+            metadata = cached_data.metadata
             
             if 'semantic_indexer' in metadata:
                 self.semantic_indexer = SemanticIndexer.from_dict(
@@ -17,8 +17,8 @@ from .compressor import (
     _get_message_text,
     _message_text_from_value,
     _openai_extra_body_for_model,
+    _partition_messages,
     _resolve_nvidia_openai_call_options,
-    _split_system_memory_messages,
     _tool_call_names,
     _truncate_for_memory,
     make_compression_request_with_retry,
@@ -642,12 +642,7 @@ def build_session_handoff_packet(
     workspace_stats_manager: Any = None,
     model_display_name: str = "",
 ) -> SessionHandoffPacket:
-    _, prior_memory_blocks = _split_system_memory_messages(messages)
-    non_system_messages = [
-        message
-        for message in messages
-        if str(message.get("role", "") or "").strip().lower() != "system"
-    ]
+    _, prior_memory_blocks, non_system_messages = _partition_messages(messages)
 
     latest_user_request = _latest_user_request(non_system_messages, latest_user_request)
     source_messages = _select_handoff_source_messages(
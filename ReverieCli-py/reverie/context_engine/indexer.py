@@ -2010,10 +2010,14 @@ class CodebaseIndexer:
         cached = self._cache_manager.load(expected_metadata=self._cache_metadata())
         if not cached:
             return False
-        self.symbol_table.replace_with(cached['symbol_table'])
-        self.dependency_graph.replace_with(cached['dependency_graph'])
+        symbol_table = cached.symbol_table
+        dependency_graph = cached.dependency_graph
+        if symbol_table is None or dependency_graph is None:
+            return False
+        self.symbol_table.replace_with(symbol_table)
+        self.dependency_graph.replace_with(dependency_graph)
         self._file_info.clear()
-        self._file_info.update(cached['file_info'])
+        self._file_info.update(cached.file_info)
         self._large_files.clear()
         self._large_files.update({
             path for path, info in self._file_info.items()
@@ -10,7 +10,7 @@ Stores comprehensive information about all symbols in the codebase:
 Optimized for large codebases (>5MB source code).
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
 from typing import Optional, List, Dict, Set, Tuple
 from pathlib import Path
@@ -122,6 +122,23 @@ class Symbol:
     @classmethod
     def from_dict(cls, data: dict) -> 'Symbol':
         """Deserialize from dictionary"""
+        if data.keys() == _SYMBOL_FIELD_NAMES:
+            # Payloads written by to_dict carry exactly the dataclass fields,
+            # so skip the per-field defaults and pass them straight through.
+            values = dict(data)
+            values['kind'] = SymbolKind[data['kind']]
+            values['references'] = [
+                Reference(
+                    file_path=r['file_path'],
+                    line=r['line'],
+                    column=r['column'],
+                    context=r['context'],
+                    ref_type=r.get('ref_type', 'usage')
+                )
+                for r in data['references'] or ()
+            ]
+            return cls(**values)
+
         references = [
             Reference(
                 file_path=r['file_path'],
@@ -200,6 +217,9 @@ class Symbol:
         return '\n'.join(parts)
 
 
+_SYMBOL_FIELD_NAMES = frozenset(f.name for f in fields(Symbol))
+
+
 class SymbolTable:
     """
     High-performance symbol table for large codebases.
@@ -444,10 +464,53 @@ class SymbolTable:
     def from_dict(cls, data: dict) -> 'SymbolTable':
         """Deserialize from dictionary"""
         table = cls()
-        for qn, s_data in data.get('symbols', {}).items():
-            symbol = Symbol.from_dict(s_data)
-            table.add_symbol(symbol)
+        table._bulk_add(Symbol.from_dict(s_data) for s_data in data.get('symbols', {}).values())
         return table
+
+    def _bulk_add(self, symbols) -> None:
+        """Index many symbols at once, tallying statistics once at the end.
+
+        Equivalent to calling `add_symbol` for each symbol; duplicates of an
+        already indexed qualified name still go through `add_symbol`.
+        """
+        symbol_map = self._symbols
+        file_index = self._file_index
+        kind_index = self._kind_index
+        name_index = self._name_index
+        added = 0
+        new_files = 0
+        by_kind: Dict[str, int] = {}
+        by_language: Dict[str, int] = {}
+        for symbol in symbols:
+            qname = symbol.qualified_name
+            if qname in symbol_map:
+                self.add_symbol(symbol)
+                continue
+            symbol_map[qname] = symbol
+            file_qnames = file_index.get(symbol.file_path)
+            if file_qnames is None:
+                file_index[symbol.file_path] = {qname}
+                new_files += 1
+            else:
+                file_qnames.add(qname)
+            kind_index[symbol.kind].add(qname)
+            name_qnames = name_index.get(symbol.name)
+            if name_qnames is None:
+                name_index[symbol.name] = {qname}
+            else:
+                name_qnames.add(qname)
+            added += 1
+            kind_name = symbol.kind.name
+            by_kind[kind_name] = by_kind.get(kind_name, 0) + 1
+            by_language[symbol.language] = by_language.get(symbol.language, 0) + 1
+
+        stats = self._stats
+        stats['total_symbols'] += added
+        stats['total_files'] += new_files
+        for kind_name, count in by_kind.items():
+            stats['by_kind'][kind_name] += count
+        for language, count in by_language.items():
+            stats['by_language'][language] = stats['by_language'].get(language, 0) + count
     
     def search(
         self,
@@ -13,6 +13,11 @@ import tempfile
 
 from .diagnostics import report_suppressed_exception
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 class WorkspaceSecurityError(ValueError):
     """Raised when a tool attempts to access a path outside the active workspace."""
@@ -45,41 +50,84 @@ def apply_restrictive_permissions(path: Path) -> None:
         report_suppressed_exception("apply restrictive file permissions")
 
 
-def write_json_secure(path: Path, data: Any) -> None:
-    """Atomically write JSON and tighten file permissions when possible."""
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename on POSIX by syncing its directory entry (no-op on Windows)."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        report_suppressed_exception("open directory for fsync")
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        report_suppressed_exception("fsync directory after atomic write")
+    finally:
+        os.close(fd)
+
+
+def encode_json_document(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) fall back to json.
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _open_sibling_temp_file(target: Path):
+    """Open a temporary file next to ``target``, creating the directory only if missing."""
+    options = dict(mode="wb", prefix=f".{target.name}.tmp-", suffix=".json", delete=False)
+    try:
+        return tempfile.NamedTemporaryFile(dir=str(target.parent), **options)
+    except FileNotFoundError:
+        # Saves normally hit an existing directory; skip the mkdir syscall then.
+        target.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=str(target.parent), **options)
+
+
+def write_json_secure(path: Path, data: Any) -> float:
+    """
+    Atomically write JSON and tighten file permissions when possible.
+
+    ``data`` may also be a document already produced by `encode_json_document`.
+    Returns the modification time of the written file.
+    """
     target = Path(path)
-    target.parent.mkdir(parents=True, exist_ok=True)
     temp_name = ""
 
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=str(target.parent),
-            prefix=f".{target.name}.tmp-",
-            suffix=".json",
-            delete=False,
-        ) as temp_file:
-            json.dump(data, temp_file, indent=2, ensure_ascii=False)
+        payload = data if isinstance(data, bytes) else encode_json_document(data)
+        with _open_sibling_temp_file(target) as temp_file:
+            temp_name = temp_file.name
+            temp_file.write(payload)
             temp_file.flush()
             try:
                 os.fsync(temp_file.fileno())
             except OSError:
                 report_suppressed_exception("flush atomic-write temporary file")
-            temp_name = temp_file.name
+            # The rename below keeps the inode, so this is the target's mtime.
+            written_mtime = os.fstat(temp_file.fileno()).st_mtime
 
-        temp_path = Path(temp_name)
-        apply_restrictive_permissions(temp_path)
+        # On POSIX the temporary file is already created 0600, and the rename
+        # keeps the inode, so only Windows needs a separate permissions pass.
+        if os.name == "nt":
+            apply_restrictive_permissions(Path(temp_name))
         os.replace(temp_name, target)
-        apply_restrictive_permissions(target)
+        temp_name = ""
+        _fsync_directory(target.parent)
+        return written_mtime
     finally:
         if temp_name:
-            leftover = Path(temp_name)
-            if leftover.exists():
-                try:
-                    leftover.unlink()
-                except Exception:
-                    report_suppressed_exception("remove atomic-write temporary file")
+            try:
+                os.unlink(temp_name)
+            except FileNotFoundError:
+                pass
+            except Exception:
+                report_suppressed_exception("remove atomic-write temporary file")
 
 
 def get_workspace_root(project_root: Any = None) -> Path:
@@ -10,6 +10,7 @@ This module provides a comprehensive operation history system that tracks:
 This enables fine-grained rollback to any point in the session.
 """
 
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
@@ -152,6 +153,22 @@ class OperationHistory:
         self.session_id = session_id
         self.operations: List[Operation] = []
         self.current_index = -1  # Current position in history
+        # Positions in ``operations`` grouped by type, so filtered views and
+        # "last question/tool" lookups don't scan the whole history.
+        self._by_type: Dict[OperationType, List[int]] = defaultdict(list)
+    
+    def _append(self, operation: Operation) -> Operation:
+        """Record an operation and index it by type."""
+        self._by_type[operation.operation_type].append(len(self.operations))
+        self.operations.append(operation)
+        self.current_index = len(self.operations) - 1
+        return operation
+    
+    def _rebuild_type_index(self) -> None:
+        """Recompute the type index after ``operations`` is replaced wholesale."""
+        self._by_type = defaultdict(list)
+        for index, op in enumerate(self.operations):
+            self._by_type[op.operation_type].append(index)
     
     def add_user_question(
         self,
@@ -180,9 +197,7 @@ class OperationHistory:
             checkpoint_id=checkpoint_id
         )
         
-        self.operations.append(operation)
-        self.current_index = len(self.operations) - 1
-        return operation
+        return self._append(operation)
     
     def add_tool_call(
         self,
@@ -224,9 +239,7 @@ class OperationHistory:
             parent_id=parent_id
         )
         
-        self.operations.append(operation)
-        self.current_index = len(self.operations) - 1
-        return operation
+        return self._append(operation)
     
     def add_file_operation(
         self,
@@ -265,9 +278,7 @@ class OperationHistory:
             parent_id=parent_id
         )
         
-        self.operations.append(operation)
-        self.current_index = len(self.operations) - 1
-        return operation
+        return self._append(operation)
     
     def add_checkpoint(
         self,
@@ -295,9 +306,7 @@ class OperationHistory:
             message_index=message_index
         )
         
-        self.operations.append(operation)
-        self.current_index = len(self.operations) - 1
-        return operation
+        return self._append(operation)
     
     def get_operations(
         self,
@@ -314,11 +323,13 @@ class OperationHistory:
         Returns:
             List of operations
         """
-        ops = self.operations
-        
         if operation_type:
-            ops = [op for op in ops if op.operation_type == operation_type]
+            indices = self._by_type.get(operation_type, [])
+            if limit:
+                indices = indices[-limit:]
+            return [self.operations[i] for i in indices]
         
+        ops = self.operations
         if limit:
             ops = ops[-limit:]
         
@@ -333,17 +344,13 @@ class OperationHistory:
     
     def get_last_user_question(self) -> Optional[Operation]:
         """Get the last user question operation"""
-        for op in reversed(self.operations):
-            if op.operation_type == OperationType.USER_QUESTION:
-                return op
-        return None
+        indices = self._by_type.get(OperationType.USER_QUESTION)
+        return self.operations[indices[-1]] if indices else None
     
     def get_last_tool_call(self) -> Optional[Operation]:
         """Get the last tool call operation"""
-        for op in reversed(self.operations):
-            if op.operation_type == OperationType.TOOL_CALL:
-                return op
-        return None
+        indices = self._by_type.get(OperationType.TOOL_CALL)
+        return self.operations[indices[-1]] if indices else None
     
     def get_operations_since(self, operation_id: str) -> List[Operation]:
         """
@@ -387,6 +394,7 @@ class OperationHistory:
     def clear(self) -> None:
         """Clear all operations"""
         self.operations.clear()
+        self._by_type.clear()
         self.current_index = -1
     
     def to_dict(self) -> dict:
@@ -402,6 +410,7 @@ class OperationHistory:
         """Create from dictionary"""
         history = cls(data['session_id'])
         history.operations = [Operation.from_dict(op) for op in data.get('operations', [])]
+        history._rebuild_type_index()
         history.current_index = data.get('current_index', -1)
         return history
     
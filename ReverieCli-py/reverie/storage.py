@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -63,6 +65,19 @@ PROJECT_STORAGE_LAYOUT: Dict[str, List[str]] = {
     ],
 }
 
+# Layout directories not already created as the parent of a deeper entry;
+# makedirs() on these builds the whole tree with one call per leaf.
+_PROJECT_LAYOUT_LEAVES = tuple(
+    relative_path
+    for paths in PROJECT_STORAGE_LAYOUT.values()
+    for relative_path in paths
+    if not any(
+        other.startswith(relative_path + "/")
+        for group in PROJECT_STORAGE_LAYOUT.values()
+        for other in group
+    )
+)
+
 
 class ProjectStorageError(RuntimeError):
     """Raised when Reverie cannot use the launcher-local portable store."""
@@ -72,14 +87,11 @@ def _resolve_path(path: Any) -> Path:
     return Path(path).expanduser().resolve()
 
 
-def sanitize_project_name(project_path: Any) -> str:
-    """Return a Windows-safe project folder name derived from the full path."""
-    path = _resolve_path(project_path)
-    raw = str(path).strip()
-    safe = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", raw)
-    safe = re.sub(r"\s+", " ", safe).strip()
-    safe = re.sub(r"_+", "_", safe).strip(" ._")
-    reserved = {
+_UNSAFE_NAME_CHARS = str.maketrans({char: "_" for char in '<>:"/\\|?*' + "".join(map(chr, range(0x20)))})
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_UNDERSCORE_RUN_RE = re.compile(r"_{2,}")
+_RESERVED_WINDOWS_NAMES = frozenset(
+    {
         "CON",
         "PRN",
         "AUX",
@@ -87,7 +99,21 @@ def sanitize_project_name(project_path: Any) -> str:
         *(f"COM{index}" for index in range(1, 10)),
         *(f"LPT{index}" for index in range(1, 10)),
     }
-    if not safe or safe.upper() in reserved:
+)
+
+
+def sanitize_project_name(project_path: Any) -> str:
+    """Return a Windows-safe project folder name derived from the full path."""
+    return _safe_folder_name(str(_resolve_path(project_path)))
+
+
+def _safe_folder_name(resolved_path: str) -> str:
+    raw = resolved_path.strip()
+    safe = _WHITESPACE_RUN_RE.sub(" ", raw.translate(_UNSAFE_NAME_CHARS)).strip()
+    if "__" in safe:
+        safe = _UNDERSCORE_RUN_RE.sub("_", safe)
+    safe = safe.strip(" ._")
+    if not safe or safe.upper() in _RESERVED_WINDOWS_NAMES:
         safe = "workspace"
     return safe[:120]
 
@@ -115,11 +141,13 @@ class ProjectStorageResolver:
     def projects_root(self) -> Path:
         return self.reverie_root / PROJECTS_DATA_DIRNAME
 
-    @property
+    # Both roots are already resolved, and the instance is frozen, so the
+    # derived name and directory are computed once per resolver.
+    @cached_property
     def project_name(self) -> str:
-        return sanitize_project_name(self.project_root)
+        return _safe_folder_name(str(self.project_root))
 
-    @property
+    @cached_property
     def project_dir(self) -> Path:
         return self.projects_root / self.project_name
 
@@ -148,9 +176,9 @@ class ProjectStorageResolver:
         return self.project_dir
 
     def ensure_layout_dirs(self) -> None:
-        for paths in PROJECT_STORAGE_LAYOUT.values():
-            for relative_path in paths:
-                (self.project_dir / relative_path).mkdir(parents=True, exist_ok=True)
+        root = str(self.project_dir)
+        for relative_path in _PROJECT_LAYOUT_LEAVES:
+            os.makedirs(os.path.join(root, relative_path), exist_ok=True)
         self.write_layout()
 
     def write_layout(self) -> None:
@@ -408,9 +408,7 @@ class ContextManagementTool(BaseTool):
         
         # Load checkpoint
         try:
-            import json
-            with open(checkpoint_path, 'r', encoding='utf-8') as f:
-                checkpoint_data = json.load(f)
+            checkpoint_data = compressor.load_checkpoint(checkpoint_path)
             
             messages = checkpoint_data.get('messages', [])
             if not messages:
@@ -98,6 +98,11 @@ setup(
         "build": [
             "pyinstaller==6.21.0",
         ],
+        "speedups": [
+            "orjson==3.10.18",
+            "zstandard==0.25.0",
+            "isal==1.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -206,3 +206,27 @@ def test_codex_model_command_accepts_proxy_only_model_id(monkeypatch, tmp_path)
     saved = manager.load()
     assert saved.active_model_source == "codex"
     assert saved.codex["selected_model_id"] == "vendor/codex-latest"
+
+
+def test_local_source_candidates_are_computed_once_per_location(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    first = codex._iter_local_codex_source_model_paths()
+    assert tmp_path.resolve() / "references" / "codex" / "codex-rs" / "models-manager" / "models.json" in first
+
+    monkeypatch.setattr(codex.Path, "resolve", lambda self, strict=False: pytest.fail("candidates rebuilt"))
+    assert codex._iter_local_codex_source_model_paths() == first
+
+
+def test_local_source_lookup_skips_roots_without_a_references_tree(tmp_path, monkeypatch) -> None:
+    models_json = tmp_path / "references" / "codex-main" / "codex-rs" / "core" / "models.json"
+    models_json.parent.mkdir(parents=True)
+    models_json.write_text("{}", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    checked = []
+    original_exists = codex.Path.exists
+    monkeypatch.setattr(codex.Path, "exists", lambda self: checked.append(self) or original_exists(self))
+
+    assert codex._find_local_codex_source_model_path() == models_json.resolve()
+    # Only candidates under a root that actually has references/ are probed individually.
+    assert checked and all(tmp_path.resolve() in path.parents for path in checked)
@@ -1,6 +1,7 @@
 from pathlib import Path
 import json
 import os
+import sys
 
 import pytest
 
@@ -9,6 +10,7 @@ import reverie.config as config_module
 from reverie.config import (
     Config,
     ConfigManager,
+    ModelConfig,
     _escape_invalid_json_string_control_chars,
     get_app_root,
     get_project_data_dir,
@@ -131,6 +133,16 @@ def test_project_data_dir_uses_portable_safe_full_path_name_without_hash(tmp_pat
     assert get_project_data_dir(project_root) == app_root / ".reverie" / "projects" / expected_name
 
 
+def test_sanitize_project_name_replaces_unsafe_characters_and_collapses_runs(tmp_path: Path) -> None:
+    project_root = tmp_path / 'a<b>c:"d|e?f*g' / "tab\there" / "x___y"
+
+    name = sanitize_project_name(project_root)
+
+    assert not any(char in name for char in '<>:"|?*\t/')
+    assert "__" not in name
+    assert name.endswith("a_b_c_d_e_f_g_tab_here_x_y")
+
+
 def test_config_manager_creates_clean_project_storage_layout_without_legacy_metadata(
     tmp_path: Path,
     monkeypatch,
@@ -579,3 +591,410 @@ def test_read_mcp_resource_cache_defaults_to_project_cache_not_project_root_reve
     assert cache_dir == get_project_data_dir(project_root) / "mcp_resources"
     assert cache_dir.exists()
     assert not (project_root / ".reverie").exists()
+
+
+def test_config_manager_skips_reparse_when_rewritten_with_identical_content(tmp_path: Path, monkeypatch) -> None:
+    app_root = tmp_path / "app"
+    project_root = tmp_path / "project"
+    project_root.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setattr("reverie.config.get_app_root", lambda: app_root)
+    monkeypatch.setattr("reverie.config.get_launcher_root", lambda: app_root)
+
+    manager = ConfigManager(project_root)
+    manager.load()
+    config_path = app_root / ".reverie" / "config.json"
+    raw = config_path.read_bytes()
+
+    # Fresh manager parses the file once and records its digest.
+    manager = ConfigManager(project_root)
+    first = manager.load()
+    parses = []
+    original_from_dict = Config.from_dict
+    monkeypatch.setattr(Config, "from_dict", classmethod(lambda cls, data: parses.append(1) or original_from_dict(data)))
+
+    config_path.write_bytes(raw)
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert manager.load() is first
+    assert parses == []
+
+    payload = json.loads(raw)
+    payload["tool_output_style"] = "full"
+    config_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+    reloaded = manager.load()
+    assert parses == [1]
+    assert reloaded.tool_output_style == "full"
+
+
+def test_config_json_encoding_matches_stdlib_layout_and_round_trips() -> None:
+    from reverie.security_utils import encode_json_document
+
+    payload = Config().to_dict()
+    payload["note"] = "café ✓"
+
+    encoded = encode_json_document(payload)
+
+    assert encoded.decode("utf-8") == json.dumps(payload, indent=2, ensure_ascii=False)
+    assert config_module._parse_json_text(encoded.decode("utf-8")) == payload
+    assert encode_json_document({"big": 2**70}) == b'{\n  "big": 1180591620717411303424\n}'
+
+
+def test_config_payload_is_parsed_from_bytes_including_bom(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(b"\xef\xbb\xbf" + json.dumps({"note": "café"}, ensure_ascii=False).encode("utf-8"))
+    monkeypatch.setattr(Path, "read_text", lambda *args, **kwargs: pytest.fail("decoded as text"))
+
+    assert manager._load_json_payload(config_path, persist_repairs=False, record_notice=False) == {"note": "café"}
+
+
+def test_saving_an_unchanged_config_skips_the_rewrite(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    config = Config()
+    manager.save(config)
+
+    writes = []
+    original = config_module.write_json_secure
+    monkeypatch.setattr(config_module, "write_json_secure", lambda path, data: writes.append(path) or original(path, data))
+
+    manager.save(config)
+    assert writes == []
+
+    config.writer_mode["tone"] = "noir"
+    manager.save(config)
+    assert writes == [manager.global_config_path]
+    assert json.loads(manager.global_config_path.read_text(encoding="utf-8"))["writer_mode"]["tone"] == "noir"
+
+    manager.global_config_path.write_text("{}", encoding="utf-8")
+    os.utime(manager.global_config_path, (1, 1))
+    manager.save(config)
+    assert len(writes) == 2
+
+
+def test_load_migration_writes_once_and_reuses_the_written_mtime(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    manager.global_config_path.parent.mkdir(parents=True)
+    manager.global_config_path.write_text(json.dumps({"config_version": "0.0.1"}), encoding="utf-8")
+
+    getmtime_calls = []
+    original_getmtime = os.path.getmtime
+    monkeypatch.setattr(config_module.os.path, "getmtime", lambda p: getmtime_calls.append(p) or original_getmtime(p))
+
+    manager.load()
+    migrated = manager.global_config_path.read_bytes()
+    assert json.loads(migrated)["config_version"] != "0.0.1"
+    assert manager._last_mtime == os.stat(manager.global_config_path).st_mtime
+    # The parse reuses the candidate stat and the migration save reuses the mtime it wrote.
+    assert getmtime_calls == []
+
+    writes = []
+    monkeypatch.setattr(config_module, "write_json_secure", lambda path, data: writes.append(path))
+    manager.load()
+    assert writes == []
+
+
+def test_load_does_not_reparse_unchanged_config_candidates(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    manager.save(Config())
+    manager.load()
+
+    reads = []
+    original = ConfigManager._read_json_dict
+    monkeypatch.setattr(ConfigManager, "_read_json_dict", lambda self, path: reads.append(path) or original(self, path))
+
+    manager.load()
+    manager.load()
+    assert reads == []
+
+    payload = json.loads(manager.global_config_path.read_text(encoding="utf-8"))
+    payload["tool_output_style"] = "full"
+    manager.global_config_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    os.utime(manager.global_config_path, (manager._last_mtime + 5, manager._last_mtime + 5))
+
+    assert manager.load().tool_output_style == "full"
+    assert reads == [manager.global_config_path]
+
+
+def test_model_mutators_reuse_the_cached_config_until_the_file_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    manager.save(Config())
+
+    loads = []
+    original = ConfigManager.load
+    monkeypatch.setattr(ConfigManager, "load", lambda self: loads.append(1) or original(self))
+
+    manager.add_model(ModelConfig(model="a", model_display_name="A", base_url="http://a"))
+    manager.add_model(ModelConfig(model="b", model_display_name="B", base_url="http://b"))
+    assert manager.set_active_model(1)
+    assert loads == []
+
+    payload = json.loads(manager.global_config_path.read_text(encoding="utf-8"))
+    payload["models"].pop()
+    manager.global_config_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(manager.global_config_path, (manager._last_mtime + 5, manager._last_mtime + 5))
+
+    assert manager.remove_model(0)
+    assert loads == [1]
+    assert json.loads(manager.global_config_path.read_text(encoding="utf-8"))["models"] == []
+
+
+def test_model_mutators_follow_a_newly_enabled_workspace_config(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    manager.add_model(ModelConfig(model="a", model_display_name="A", base_url="http://a"))
+    global_before = manager.global_config_path.read_bytes()
+
+    # Another process enables a workspace config; the loaded global file is untouched.
+    workspace = Config(use_workspace_config=True).to_dict()
+    manager.workspace_config_path.parent.mkdir(parents=True, exist_ok=True)
+    manager.workspace_config_path.write_text(json.dumps(workspace), encoding="utf-8")
+
+    manager.add_model(ModelConfig(model="b", model_display_name="B", base_url="http://b"))
+
+    assert manager.global_config_path.read_bytes() == global_before
+    saved = json.loads(manager.workspace_config_path.read_text(encoding="utf-8"))
+    assert [model["model"] for model in saved["models"]] == ["b"]
+
+
+def test_mode_defaults_are_independent_copies() -> None:
+    first, second = Config(), Config()
+    first.gamer_mode["supported_engines"].append("unity")
+    first.writer_mode["max_chapter_context_window"] = 9
+
+    assert "unity" not in second.gamer_mode["supported_engines"]
+    assert second.writer_mode["max_chapter_context_window"] == 5
+    assert isinstance(config_module.default_gamer_mode_config()["supported_dimensions"], list)
+
+
+def test_needs_config_update_flags_missing_and_legacy_fields(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    current = Config().to_dict()
+    current["models"] = [{"model": "m", "provider": "openai-chat", "supports_vision": False}]
+    assert manager._needs_config_update(current) is False
+
+    def changed(edit) -> bool:
+        data = json.loads(json.dumps(current))
+        edit(data)
+        return manager._needs_config_update(data)
+
+    assert changed(lambda d: d.pop("api_timeout"))
+    assert changed(lambda d: d.update(ttv={}))
+    assert changed(lambda d: d["models"][0].update(thinking_mode=True))
+    assert changed(lambda d: d["models"][0].pop("supports_vision"))
+    assert changed(lambda d: d["nvidia"].popitem())
+    assert changed(lambda d: d["text_to_image"].update(agnes="legacy"))
+    assert changed(lambda d: d["text_to_image"].update(models=[{"path": "p"}]))
+
+
+@pytest.mark.skipif(os.name == "nt", reason="directory fsync is POSIX-only")
+def test_config_save_is_atomic_and_syncs_the_directory_entry(tmp_path: Path, monkeypatch) -> None:
+    import stat
+
+    app_root = tmp_path / "app"
+    project_root = tmp_path / "project"
+    project_root.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setattr("reverie.config.get_app_root", lambda: app_root)
+    monkeypatch.setattr("reverie.config.get_launcher_root", lambda: app_root)
+
+    manager = ConfigManager(project_root)
+    config = manager.load()
+
+    synced_kinds = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (synced_kinds.append(stat.S_ISDIR(os.fstat(fd).st_mode)), real_fsync(fd)))
+    config.tool_output_style = "full"
+    manager.save(config)
+
+    config_dir = app_root / ".reverie"
+    assert synced_kinds == [False, True]
+    assert json.loads((config_dir / "config.json").read_text(encoding="utf-8"))["tool_output_style"] == "full"
+    assert not [p.name for p in config_dir.iterdir() if ".tmp-" in p.name]
+    assert stat.S_IMODE(os.stat(config_dir / "config.json").st_mode) == 0o600
+
+
+def test_secure_json_write_creates_missing_directories_only_when_needed(tmp_path: Path, monkeypatch) -> None:
+    from reverie.security_utils import write_json_secure
+
+    nested = tmp_path / "a" / "b" / "state.json"
+    write_json_secure(nested, {"n": 1})
+    assert json.loads(nested.read_text(encoding="utf-8")) == {"n": 1}
+
+    monkeypatch.setattr(Path, "mkdir", lambda *args, **kwargs: pytest.fail("unexpected mkdir"))
+    write_json_secure(nested, {"n": 2})
+    assert json.loads(nested.read_text(encoding="utf-8")) == {"n": 2}
+
+
+def test_app_root_and_project_data_dir_probe_the_filesystem_once(tmp_path: Path, monkeypatch) -> None:
+    app_root = tmp_path / "app"
+    app_root.mkdir()
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(app_root))
+
+    resolved_app_root = app_root.resolve()
+    assert get_app_root() == resolved_app_root
+    expected = get_project_data_dir(project_root)
+
+    def fail_resolve(self, strict=False):
+        raise AssertionError(f"unexpected resolve of {self}")
+
+    expected_name = get_project_data_name(project_root)
+    monkeypatch.setattr(Path, "resolve", fail_resolve)
+    assert get_app_root() == resolved_app_root
+    assert get_project_data_dir(project_root) == expected
+    assert get_project_data_name(project_root) == expected_name == expected.name
+
+
+def test_get_app_root_is_memoized_until_cleared(tmp_path: Path, monkeypatch) -> None:
+    app_root = tmp_path / "app"
+    app_root.mkdir()
+    monkeypatch.delenv("REVERIE_APP_ROOT", raising=False)
+    monkeypatch.setattr(config_module.sys, "frozen", True, raising=False)
+    monkeypatch.setattr(config_module, "get_launcher_root", lambda: app_root)
+
+    first = get_app_root()
+    monkeypatch.setattr(Path, "resolve", lambda self, strict=False: pytest.fail(f"unexpected resolve of {self}"))
+    assert get_app_root() is first
+
+    monkeypatch.undo()
+    get_app_root.cache_clear()
+    assert get_app_root() != first
+
+
+def test_config_managers_share_the_project_storage_resolver(tmp_path: Path, monkeypatch) -> None:
+    project_root = tmp_path / "project"
+    project_root.mkdir()
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+
+    first = ConfigManager(project_root)
+    monkeypatch.setattr(Path, "resolve", lambda self, strict=False: pytest.fail(f"unexpected resolve of {self}"))
+    second = ConfigManager(project_root)
+
+    assert second.storage_resolver is first.storage_resolver
+    assert second.project_data_dir == get_project_data_dir(project_root) == first.project_data_dir
+
+
+def test_launcher_root_probes_the_script_path_once(tmp_path: Path, monkeypatch) -> None:
+    script = tmp_path / "bin" / "reverie-launch.py"
+    script.parent.mkdir()
+    script.write_text("", encoding="utf-8")
+    monkeypatch.setattr(config_module.sys, "frozen", False, raising=False)
+    monkeypatch.setattr(config_module.sys, "argv", [str(script)])
+
+    assert config_module.get_launcher_root() == script.parent.resolve()
+    monkeypatch.setattr(Path, "is_file", lambda self: pytest.fail("probed again"))
+    assert config_module.get_launcher_root() == script.parent.resolve()
+
+
+def test_config_manager_creates_project_layout_once_per_manager(tmp_path: Path, monkeypatch) -> None:
+    app_root = tmp_path / "app"
+    project_root = tmp_path / "project"
+    project_root.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setattr("reverie.config.get_app_root", lambda: app_root)
+    monkeypatch.setattr("reverie.config.get_launcher_root", lambda: app_root)
+
+    calls = []
+    original = ProjectStorageResolver.ensure_project_dir
+    monkeypatch.setattr(ProjectStorageResolver, "ensure_project_dir", lambda self: calls.append(1) or original(self))
+
+    manager = ConfigManager(project_root)
+    config = manager.load()
+    manager.save(config)
+    manager.save(config)
+
+    assert calls == [1]
+    assert (manager.project_data_dir / "sessions").is_dir()
+
+
+def test_config_manager_load_stats_each_candidate_once(tmp_path: Path, monkeypatch) -> None:
+    app_root = tmp_path / "app"
+    project_root = tmp_path / "project"
+    project_root.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setattr("reverie.config.get_app_root", lambda: app_root)
+    monkeypatch.setattr("reverie.config.get_launcher_root", lambda: app_root)
+
+    manager = ConfigManager(project_root)
+    manager.load()
+    config_path = app_root / ".reverie" / "config.json"
+
+    stats = []
+    real_stat = os.stat
+
+    def recording_stat(path, *args, **kwargs):
+        # Path.resolve() stats internally for loop detection; count existence
+        # and mtime probes only.
+        caller = sys._getframe(1)
+        if "resolve" not in (caller.f_code.co_name, caller.f_back.f_code.co_name):
+            stats.append(str(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", recording_stat)
+    manager.load()
+
+    assert stats.count(str(config_path)) == 1
+
+
+def test_load_only_repoints_config_path_when_the_mode_switches(tmp_path: Path, monkeypatch) -> None:
+    app_root = tmp_path / "app"
+    project_root = tmp_path / "project"
+    project_root.mkdir(parents=True, exist_ok=True)
+
+    monkeypatch.setattr("reverie.config.get_app_root", lambda: app_root)
+    monkeypatch.setattr("reverie.config.get_launcher_root", lambda: app_root)
+
+    manager = ConfigManager(project_root)
+    manager.load()
+    assert manager.config_path == manager.global_config_path
+
+    calls = []
+    original = ConfigManager._update_config_path
+    monkeypatch.setattr(ConfigManager, "_update_config_path", lambda self: calls.append(1) or original(self))
+    manager.load()
+    manager.set_workspace_mode(False)
+    assert calls == []
+
+    manager.set_workspace_mode(True)
+    assert calls == [1]
+    assert manager.config_path == manager.workspace_config_path
+
+
+def test_load_records_the_mtime_of_a_repaired_config(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("REVERIE_APP_ROOT", str(tmp_path / "app"))
+    manager = ConfigManager(tmp_path / "project")
+    manager.global_config_path.parent.mkdir(parents=True)
+    manager.global_config_path.write_text('{"active_model_index": 0, "theme": "a\nb"}', encoding="utf-8")
+    os.utime(manager.global_config_path, (1, 1))
+
+    manager.load()
+
+    assert manager._last_mtime == os.stat(manager.global_config_path).st_mtime
+    assert manager._last_mtime != 1
+
+
+def test_layout_dirs_are_created_from_leaf_paths_only(tmp_path: Path, monkeypatch) -> None:
+    from reverie.storage import PROJECT_STORAGE_LAYOUT
+
+    resolver = ProjectStorageResolver.for_project(tmp_path / "project", launcher_root=tmp_path / "launcher")
+    calls = []
+    real_makedirs = os.makedirs
+    monkeypatch.setattr(os, "makedirs", lambda path, *a, **kw: calls.append(path) or real_makedirs(path, *a, **kw))
+
+    resolver.ensure_project_dir()
+    expected = [path for paths in PROJECT_STORAGE_LAYOUT.values() for path in paths]
+    assert all((resolver.project_dir / path).is_dir() for path in expected)
+
+    # makedirs recurses for missing parents on the cold pass; count a warm one.
+    calls.clear()
+    resolver.ensure_layout_dirs()
+    assert len(calls) < len(expected)
@@ -2,6 +2,8 @@ from pathlib import Path
 import json
 import sqlite3
 
+import pytest
+
 from reverie.context_engine.cache import CacheManager
 from reverie.context_engine.compressor import (
     ContextCompressor,
@@ -15,7 +17,7 @@ from reverie.context_engine.indexer import CodebaseIndexer, FileInfo, IndexConfi
 from reverie.context_engine.parsers.base import ParseResult
 from reverie.context_engine.parsers.config_parser import ConfigParser
 from reverie.context_engine.retriever import ContextRetriever, TaskContextFile
-from reverie.context_engine.symbol_table import Symbol, SymbolKind, SymbolTable
+from reverie.context_engine.symbol_table import Reference, Symbol, SymbolKind, SymbolTable
 from reverie.context_engine.workspace import detect_workspace_profile
 from reverie.session.memory_indexer import MemoryIndexer
 from reverie.tools.codebase_retrieval import CodebaseRetrievalTool
@@ -1270,6 +1272,77 @@ def test_context_cache_uses_fast_compact_gzip_roundtrip(tmp_path: Path) -> None:
     assert manager._load_compressed(manager.symbols_path) == payload
 
 
+def test_context_cache_rejects_index_written_with_another_compression(tmp_path: Path) -> None:
+    manager = CacheManager(tmp_path)
+    assert manager.save(SymbolTable(), DependencyGraph(), {})
+    assert manager.is_valid()
+
+    index = json.loads(manager.index_path.read_text(encoding="utf-8"))
+    assert index["compression"] == manager.compression
+    index["compression"] = "zstd" if manager.compression == "gzip" else "gzip"
+    manager.index_path.write_text(json.dumps(index), encoding="utf-8")
+
+    assert not manager.is_valid()
+    assert manager.load() is None
+
+
+def test_context_cache_reads_gzip_payloads_when_zstd_is_available(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    import gzip
+
+    manager = CacheManager(tmp_path)
+    assert manager.symbols_path.name == "symbols.json.zst"
+    manager._save_compressed(manager.symbols_path, {"a": 1})
+    assert manager.symbols_path.read_bytes().startswith(b"\x28\xb5\x2f\xfd")
+
+    manager.symbols_path.write_bytes(gzip.compress(b'{"a":2}'))
+    assert manager._load_compressed(manager.symbols_path) == {"a": 2}
+
+
+def test_context_cache_loads_through_mapped_files(tmp_path: Path) -> None:
+    manager = CacheManager(tmp_path)
+    file_info = {"a.py": FileInfo(path="a.py", mtime=1.0, size=3, content_hash="h")}
+    assert manager.save(SymbolTable(), DependencyGraph(), file_info)
+
+    loaded = manager.load()
+    assert loaded is not None
+    assert loaded["file_info"]["a.py"].content_hash == "h"
+
+    # Empty files cannot be mapped; they must read as an invalid cache.
+    manager.files_path.write_bytes(b"")
+    assert manager.load() is None
+    manager.symbols_path.write_bytes(b"")
+    assert manager._load_compressed(manager.symbols_path) is None
+
+
+def test_context_cache_gzip_payloads_interoperate_with_stdlib_gzip(tmp_path: Path, monkeypatch) -> None:
+    import gzip
+
+    from reverie.context_engine import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "zstandard", None)
+    manager = CacheManager(tmp_path)
+    manager._save_compressed(manager.symbols_path, {"a": 1})
+    assert json.loads(gzip.decompress(manager.symbols_path.read_bytes())) == {"a": 1}
+
+    manager.symbols_path.write_bytes(gzip.compress(b'{"a":2}'))
+    assert manager._load_compressed(manager.symbols_path) == {"a": 2}
+
+
+def test_context_cache_json_codec_handles_non_string_keys_and_big_ints(tmp_path: Path) -> None:
+    from reverie.context_engine import cache as cache_module
+
+    payload = {1: "one", "big": 2 ** 70, "text": "中文"}
+    encoded = cache_module._encode_json(payload)
+
+    assert isinstance(encoded, bytes)
+    assert cache_module._decode_json(encoded) == {"1": "one", "big": 2 ** 70, "text": "中文"}
+
+    manager = CacheManager(tmp_path)
+    manager._atomic_write_json(manager.files_path, {"a.py": {"size": 3}})
+    assert json.loads(manager.files_path.read_text(encoding="utf-8")) == {"a.py": {"size": 3}}
+
+
 def test_auto_memory_redacts_secrets_and_builds_typed_fragments(tmp_path: Path) -> None:
     sessions_dir = tmp_path / "sessions"
     sessions_dir.mkdir()
@@ -1452,3 +1525,741 @@ def test_parallel_full_index_matches_serial_and_is_reproducible(tmp_path: Path)
     assert parallel_runs[0] == serial
     # ...and is bit-for-bit reproducible across runs.
     assert all(run == parallel_runs[0] for run in parallel_runs)
+
+
+def test_symbol_table_from_dict_matches_incremental_adds() -> None:
+    symbols = [
+        _make_symbol("run", "pkg.alpha.run", "pkg/alpha.py"),
+        _make_symbol("run", "pkg.beta.run", "pkg/beta.py"),
+        _make_symbol("load", "pkg.alpha.load", "pkg/alpha.py"),
+    ]
+    symbols[0].references.append(Reference("pkg/beta.py", 3, 4, "run()", "call"))
+    expected = SymbolTable()
+    for symbol in symbols:
+        expected.add_symbol(symbol)
+
+    payload = json.loads(json.dumps(expected.to_dict()))
+    restored = SymbolTable.from_dict(payload)
+
+    assert restored.to_dict() == expected.to_dict()
+    assert restored.get_statistics() == expected.get_statistics()
+    assert restored._file_index == expected._file_index
+    assert restored._name_index == expected._name_index
+    assert restored.get_symbol("pkg.alpha.run").references == symbols[0].references
+
+    # Older payloads without newer fields still take the defaulting path.
+    legacy = dict(payload["symbols"]["pkg.beta.run"])
+    del legacy["content_hash"], legacy["references"]
+    assert Symbol.from_dict(legacy).references == []
+
+
+def test_context_cache_writes_each_file_with_one_write(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    manager = CacheManager(tmp_path)
+    writes = []
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: writes.append(len(data)) or real_write(fd, data))
+
+    file_info = {f"m{i}.py": FileInfo(path=f"m{i}.py", mtime=1.0, size=i, content_hash="h") for i in range(500)}
+    assert manager.save(SymbolTable(), DependencyGraph(), file_info)
+
+    # symbols, dependencies, files.json and index.json
+    assert len(writes) == 4
+    assert not any(path.name.endswith(".tmp") for path in tmp_path.iterdir())
+    assert manager.load()["file_info"]["m499.py"].size == 499
+
+
+def test_context_cache_save_fails_without_publishing_the_index(tmp_path: Path, monkeypatch) -> None:
+    manager = CacheManager(tmp_path)
+    assert manager.save(SymbolTable(), DependencyGraph(), {})
+
+    def failing_write(path, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(manager, "_atomic_write_json", failing_write)
+    assert manager.save(SymbolTable(), DependencyGraph(), {}) is False
+
+    assert not manager.index_path.exists()
+    assert manager.load() is None
+
+
+def test_commit_history_extracts_diff_entities_once_per_commit(tmp_path: Path, monkeypatch) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    diff = "+def load(x):\n+class Cache:\n-function render() {\n+interface Props {\n undefined(x)\n"
+    assert sorted(indexer._extract_entities_from_diff(diff)) == ["Cache", "Props", "load", "render"]
+
+    calls = []
+    original = indexer._extract_entities_from_diff
+    monkeypatch.setattr(indexer, "_extract_entities_from_diff", lambda text: calls.append(text) or original(text))
+    indexer._analyze_commit({"hash": "abc", "message": "fix cache", "files": ["a.py", "b.py", "c.ts"], "diff": diff})
+
+    assert calls == [diff]
+    assert indexer.evolutions["b.py:load"].total_changes == 1
+    assert indexer.evolutions["b.py:load"].versions[0]["change_type"] == "FIX"
+    assert indexer.evolutions["c.ts:Props"].versions[0]["commit_hash"] == "abc"
+
+
+def test_commit_history_classifies_messages_by_keyword_priority(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import ChangeType, CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    cases = {
+        "Add feature flag and fix crash": ChangeType.FIX,
+        "Implement streaming": ChangeType.FEATURE,
+        "Simplify loader": ChangeType.REFACTOR,
+        "Speed up search": ChangeType.PERFORMANCE,
+        "Harden secure storage": ChangeType.SECURITY,
+        "Extend test coverage": ChangeType.TEST,
+        "Update README": ChangeType.DOCUMENTATION,
+        "Bump version": ChangeType.MODIFY,
+    }
+    assert {message: indexer._classify_change(message, []) for message in cases} == cases
+
+    assert indexer._identify_message_patterns("Add tests and logging") == ["add_tests", "add_logging"]
+    assert indexer._identify_message_patterns("Bump version") == []
+
+
+def test_commit_pattern_tracks_example_commits_once(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer, CommitPattern
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    for commit_hash in ("a1", "b2", "a1"):
+        indexer._analyze_commit({"hash": commit_hash, "message": "Add tests", "files": ["t.py"], "diff": ""})
+
+    pattern = indexer.patterns["feature_add_tests"]
+    assert pattern.example_commits == ["a1", "b2"]
+    assert pattern.frequency == 3
+    assert "_example_commit_set" not in pattern.to_dict()
+
+    restored = CommitPattern.from_dict(pattern.to_dict())
+    assert restored == pattern
+    assert restored.add_example_commit("b2") is False
+    assert restored.add_example_commit("c3") is True
+    assert restored.example_commits == ["a1", "b2", "c3"]
+
+
+def test_commit_history_classifies_each_commit_once(tmp_path: Path, monkeypatch) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    calls = []
+    original = indexer._classify_change
+    monkeypatch.setattr(indexer, "_classify_change", lambda message, files: calls.append(message) or original(message, files))
+
+    commit = {"hash": "abc", "message": "Implement cache", "files": ["a.py", "b.py"], "diff": "+def load(x):\n+def save(x):\n"}
+    indexer._analyze_commit(commit)
+
+    assert calls == ["Implement cache"]
+    assert {evolution.versions[0]["change_type"] for evolution in indexer.evolutions.values()} == {"FEATURE"}
+    assert len(indexer.evolutions) == 4
+
+
+def test_commit_history_indexes_a_lazy_commit_stream(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    produced = []
+
+    def commits():
+        for index in range(10):
+            produced.append(index)
+            yield {"hash": f"c{index}", "message": "Fix bug", "files": ["a.py"], "entities": [f"fn{index}"]}
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    indexer.index_commits(commits(), max_commits=3)
+
+    assert produced == [0, 1, 2]
+    assert indexer.to_dict()["stats"]["total_commits_analyzed"] == 3
+    assert sorted(indexer.evolutions) == ["a.py:fn0", "a.py:fn1", "a.py:fn2"]
+
+
+def test_commit_history_round_trips_through_to_dict(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CodeEvolution, CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    indexer.index_commits(
+        [
+            {"hash": "a1", "message": "Add tests", "files": ["t.py"], "diff": "+def test_x():\n"},
+            {"hash": "b2", "message": "Fix typo", "files": ["t.py"], "diff": "+def test_x():\n"},
+        ]
+    )
+    payload = json.loads(json.dumps(indexer.to_dict()))
+
+    restored = CommitHistoryIndexer.from_dict(payload, tmp_path)
+
+    assert restored.to_dict() == payload
+    assert restored.patterns["feature_add_tests"].add_example_commit("a1") is False
+    # Older payloads missing optional fields still load with defaults.
+    legacy = CodeEvolution.from_dict({"file_path": "t.py", "entity_name": "test_x"})
+    assert legacy.versions == [] and legacy.stability_score == 1.0
+
+
+def test_commit_history_records_use_slots_and_shared_type_strings() -> None:
+    from reverie.context_engine.commit_history_indexer import CodeEvolution, CommitPattern, TeamConvention
+
+    first = CommitPattern(id="a", name="x", pattern_type="".join(["fe", "ature"]), description="")
+    second = CommitPattern.from_dict(json.loads(json.dumps(first.to_dict())))
+
+    assert first.pattern_type is second.pattern_type
+    for record in (first, CodeEvolution("a.py", "fn"), TeamConvention("c", "naming", "d", "p")):
+        assert not hasattr(record, "__dict__")
+
+
+def test_commit_patterns_are_indexed_under_lowercase_change_types(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    indexer._analyze_commit({"hash": "a1", "message": "Fix typo", "files": [], "diff": ""})
+    indexer._analyze_commit({"hash": "b2", "message": "Add logging", "files": [], "diff": ""})
+
+    assert dict(indexer._pattern_by_type) == {"fix": {"fix_fix_typo"}, "feature": {"feature_add_logging"}}
+    assert indexer.patterns["fix_fix_typo"].pattern_type == "fix"
+    assert [p.id for p in indexer.find_relevant_patterns("typo", change_type="fix")] == ["fix_fix_typo"]
+
+
+def test_commit_pattern_average_files_changed_is_exact(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer, CommitPattern
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    for index, file_count in enumerate((1, 2, 4)):
+        files = [f"f{n}.py" for n in range(file_count)]
+        indexer._analyze_commit({"hash": f"h{index}", "message": "Fix typo", "files": files, "entities": []})
+
+    pattern = indexer.patterns["fix_fix_typo"]
+    assert pattern.total_files_changed == 7
+    assert pattern.avg_files_changed == 7 / 3
+    assert CommitPattern.from_dict(pattern.to_dict()) == pattern
+
+    legacy = pattern.to_dict()
+    del legacy["total_files_changed"]
+    assert CommitPattern.from_dict(legacy).total_files_changed == 7
+
+
+def test_commit_history_shares_one_version_record_per_commit(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    indexer.index_commits(
+        [{"hash": "a1", "message": "Refactor", "date": "2026-01-01", "files": ["a.py", "b.py"], "entities": ["x", "y"]}]
+    )
+
+    versions = [evolution.versions[0] for evolution in indexer.evolutions.values()]
+    assert len(versions) == 4
+    assert all(version is versions[0] for version in versions)
+    assert versions[0] == {"commit_hash": "a1", "date": "2026-01-01", "message": "Refactor", "change_type": "REFACTOR"}
+
+
+def test_context_cache_rewrites_only_changed_symbol_shards(tmp_path: Path, monkeypatch) -> None:
+    from reverie.context_engine import cache as cache_module
+
+    table = SymbolTable()
+    for index in range(12):
+        table.add_symbol(_make_symbol(f"f{index}", f"m{index}.f{index}", f"m{index}.py"))
+    manager = CacheManager(tmp_path)
+    assert manager.save(table, DependencyGraph(), {})
+
+    written = []
+    original_write = manager._atomic_write_bytes
+    monkeypatch.setattr(manager, "_atomic_write_bytes", lambda path, payload: (written.append(path), original_write(path, payload)))
+
+    assert manager.save(table, DependencyGraph(), {})
+    assert not [path for path in written if path.parent == manager.symbol_shards_dir]
+
+    written.clear()
+    table.update_file("m3.py", [_make_symbol("g", "m3.g", "m3.py")])
+    table.remove_file("m7.py")
+    assert manager.save(table, DependencyGraph(), {})
+
+    changed = {manager._shard_path(cache_module._shard_bucket(name)) for name in ("m3.py", "m7.py")}
+    assert {path for path in written if path.parent == manager.symbol_shards_dir} <= changed
+    assert len(list(manager.symbol_shards_dir.iterdir())) == len({cache_module._shard_bucket(f"m{i}.py") for i in range(12) if i != 7})
+
+    loaded = manager.load()
+    assert loaded is not None
+    assert sorted(loaded["symbol_table"].to_dict()["symbols"]) == sorted(table.to_dict()["symbols"])
+
+    manager.clear()
+    assert not manager.symbol_shards_dir.exists()
+
+
+def test_context_cache_rejects_symbol_shards_changed_outside_save(tmp_path: Path) -> None:
+    table = SymbolTable()
+    table.add_symbol(_make_symbol("f", "m.f", "m.py"))
+    manager = CacheManager(tmp_path)
+    assert manager.save(table, DependencyGraph(), {})
+
+    (shard,) = manager.symbol_shards_dir.iterdir()
+    shard.write_bytes(b"")
+    assert manager.load() is None
+
+    # The next save notices the stale file and rewrites the shard.
+    assert manager.save(table, DependencyGraph(), {})
+    assert manager.load()["symbol_table"].get_symbol("m.f") is not None
+
+
+def test_context_cache_skips_unchanged_payload_writes(tmp_path: Path, monkeypatch) -> None:
+    table = SymbolTable()
+    table.add_symbol(_make_symbol("f", "m.f", "m.py"))
+    file_info = {"m.py": FileInfo(path="m.py", mtime=1.0, size=3, content_hash="h")}
+    manager = CacheManager(tmp_path)
+    assert manager.save(table, DependencyGraph(), file_info)
+
+    written = []
+    original_write = manager._atomic_write_bytes
+    monkeypatch.setattr(manager, "_atomic_write_bytes", lambda path, payload: (written.append(path), original_write(path, payload)))
+
+    assert manager.save(table, DependencyGraph(), file_info)
+    assert written == [manager.index_path]
+    assert set(manager.get_cache_info()["digests"]) == {"symbols", "dependencies", "files"}
+
+    written.clear()
+    file_info["m.py"] = FileInfo(path="m.py", mtime=2.0, size=3, content_hash="h2")
+    manager.dependencies_path.write_bytes(b"tampered")
+    assert manager.save(table, DependencyGraph(), file_info)
+    assert set(written) == {manager.files_path, manager.dependencies_path, manager.index_path}
+    assert manager.load()["file_info"]["m.py"].content_hash == "h2"
+
+
+def test_context_cache_load_defers_symbol_and_dependency_payloads(tmp_path: Path, monkeypatch) -> None:
+    from reverie.context_engine import cache as cache_module
+
+    table = SymbolTable()
+    table.add_symbol(_make_symbol("f", "m.f", "m.py"))
+    file_info = {"m.py": FileInfo(path="m.py", mtime=1.0, size=3, content_hash="h")}
+    manager = CacheManager(tmp_path)
+    assert manager.save(table, DependencyGraph(), file_info, metadata={"k": "v"})
+
+    inflated = []
+    original_inflate = cache_module._inflate
+    monkeypatch.setattr(cache_module, "_inflate", lambda view: (inflated.append(1), original_inflate(view))[1])
+
+    cached = manager.load()
+    assert cached is not None
+    assert cached.metadata == {"k": "v"}
+    assert cached["file_info"]["m.py"].content_hash == "h"
+    assert len(inflated) == 1  # only the shard manifest
+
+    assert cached.symbol_table.get_symbol("m.f") is not None
+    assert cached["symbol_table"] is cached.symbol_table
+    assert isinstance(cached["dependency_graph"], DependencyGraph)
+    assert set(cached) >= {"symbol_table", "dependency_graph", "file_info", "metadata"}
+
+    manager.dependencies_path.write_bytes(b"not-compressed")
+    assert manager.load().dependency_graph is None
+
+
+def test_commit_pattern_relevance_uses_description_token_index(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    indexer._analyze_commit({"hash": "a1", "message": "Fix typo", "files": [], "entities": []})
+    indexer._analyze_commit({"hash": "b2", "message": "Add logging", "files": [], "entities": []})
+    assert indexer._pattern_by_desc_token["fix_typo"] == {"fix_fix_typo"}
+    assert indexer._pattern_by_desc_token["changes"] == {"fix_fix_typo", "feature_add_logging"}
+
+    # Description overlap lifts a pattern above one with equal base score.
+    ranked = indexer.find_relevant_patterns("logging in feature changes")
+    assert [p.id for p in ranked] == ["feature_add_logging", "fix_fix_typo"]
+
+    restored = CommitHistoryIndexer.from_dict(indexer.to_dict(), tmp_path)
+    assert restored._pattern_by_desc_token == indexer._pattern_by_desc_token
+    assert [p.id for p in restored.find_relevant_patterns("logging in feature changes")] == [p.id for p in ranked]
+
+
+def test_commit_history_serializes_commit_metadata_once(tmp_path: Path) -> None:
+    from reverie.context_engine.commit_history_indexer import CommitHistoryIndexer
+
+    indexer = CommitHistoryIndexer(tmp_path)
+    indexer.index_commits(
+        [{"hash": "a1", "message": "Refactor", "date": "2026-01-01", "files": ["a.py", "b.py"], "entities": ["x", "y"]}]
+    )
+    payload = json.loads(json.dumps(indexer.to_dict()))
+
+    assert list(payload["commits"]) == ["a1"]
+    assert all(evolution["versions"] == ["a1"] for evolution in payload["evolutions"].values())
+
+    restored = CommitHistoryIndexer.from_dict(payload, tmp_path)
+    versions = [evolution.versions[0] for evolution in restored.evolutions.values()]
+    assert all(version is versions[0] for version in versions)
+    assert versions[0] == indexer.evolutions["a.py:x"].versions[0]
+
+    # Payloads written before the commit table still load.
+    legacy = indexer.to_dict()
+    del legacy["commits"]
+    legacy["evolutions"] = {eid: e.to_dict() for eid, e in indexer.evolutions.items()}
+    assert CommitHistoryIndexer.from_dict(legacy, tmp_path).evolutions["b.py:y"].versions == [versions[0]]
+
+
+def test_checkpoint_files_are_compact_utf8_json(tmp_path: Path) -> None:
+    from reverie.context_engine.compressor import _read_checkpoint_bytes
+
+    compressor = ContextCompressor(tmp_path)
+    messages = [{"role": "user", "content": "中文 checkpoint"}, {"role": "assistant", "content": "ok", "n": 2 ** 70}]
+
+    path = Path(compressor.save_checkpoint(messages, note="before", session_id="s1"))
+
+    raw = _read_checkpoint_bytes(path)
+    assert "中文".encode("utf-8") in raw
+    assert b"\n" not in raw and b'": ' not in raw
+    data = json.loads(raw)
+    assert data["messages"] == messages
+    assert data["message_count"] == 2
+    assert compressor.list_checkpoints("s1")[0]["note"] == "before"
+
+
+def test_list_checkpoints_reads_checkpoints_written_by_stdlib_json(tmp_path: Path) -> None:
+    compressor = ContextCompressor(tmp_path)
+    legacy = {"timestamp": "2024-01-01T00:00:00", "session_id": "s1", "note": "old", "message_count": 1,
+              "messages": [{"role": "user", "content": "hi", "big": 2 ** 70}]}
+    (compressor.cache_dir / "checkpoint_s1_20240101_000000.json").write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+    (compressor.cache_dir / "checkpoint_s1_broken.json").write_bytes(b"{not json")
+    compressor.save_checkpoint([{"role": "user", "content": "new"}], note="new", session_id="s1")
+    compressor.save_checkpoint([], note="other", session_id="s2")
+
+    listed = compressor.list_checkpoints("s1")
+
+    assert [item["note"] for item in listed] == ["new", "old"]
+    assert listed[1]["message_count"] == 1
+
+
+def test_list_checkpoints_reads_metadata_sidecars(tmp_path: Path, monkeypatch) -> None:
+    from reverie.context_engine import compressor as compressor_module
+
+    compressor = ContextCompressor(tmp_path)
+    path = Path(compressor.save_checkpoint([{"role": "user", "content": "x" * 10000}], note="n", session_id="s1"))
+    sidecar = compressor_module._checkpoint_sidecar(path)
+    assert json.loads(sidecar.read_bytes()) == {
+        key: value for key, value in compressor.load_checkpoint(path).items() if key != "messages"
+    }
+
+    parsed = []
+    original_load = compressor_module._load_checkpoint
+    monkeypatch.setattr(compressor_module, "_load_checkpoint", lambda raw: (parsed.append(len(raw)), original_load(raw))[1])
+
+    listed = compressor.list_checkpoints("s1")
+    assert [(item["path"], item["note"], item["message_count"]) for item in listed] == [(str(path), "n", 1)]
+    assert parsed and max(parsed) < 1000
+
+    sidecar.unlink()
+    parsed.clear()
+    assert compressor.list_checkpoints("s1")[0]["note"] == "n"
+    assert max(parsed) > 10000
+
+
+def test_background_checkpoints_are_written_off_the_caller_thread(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    from reverie.context_engine import compressor as compressor_module
+
+    writers = []
+    original_write = compressor_module._write_checkpoint_files
+    monkeypatch.setattr(
+        compressor_module,
+        "_write_checkpoint_files",
+        lambda *args: (writers.append(threading.current_thread().name), original_write(*args)),
+    )
+    compressor = ContextCompressor(tmp_path)
+
+    path = Path(compressor.save_checkpoint([{"role": "user", "content": "hi"}], note="bg", session_id="s1", wait=False))
+    compressor.flush()
+
+    assert writers == ["reverie-checkpoint-writer"]
+    assert compressor.load_checkpoint(path)["note"] == "bg"
+    assert compressor.list_checkpoints("s1")[0]["path"] == str(path)
+
+    compressor.save_checkpoint([], note="sync", session_id="s2")
+    assert writers[-1] == threading.current_thread().name
+
+
+def test_compression_transcript_labels_roles() -> None:
+    transcript = _build_compression_transcript(
+        [
+            {"role": "user", "content": "question"},
+            {"role": "Assistant", "content": "answer"},
+            {"role": "tool", "name": "grep", "content": "hits"},
+            {"role": "critic", "content": "note"},
+        ]
+    )
+
+    assert transcript == "USER: question\n\nASSISTANT: answer\n\nTOOL[grep]: hits\n\nCRITIC: note"
+
+
+def test_partition_messages_splits_in_one_pass() -> None:
+    from reverie.context_engine.compressor import _partition_messages
+
+    user = {"role": "user", "content": "hi"}
+    system = {"role": "system", "content": "rules"}
+    memory = {"role": "system", "content": f"{MEMORY_BLOCK_HEADER}\nremembered\n"}
+    tool = {"role": "tool", "content": "out"}
+
+    system_msgs, memory_blocks, other_msgs = _partition_messages([system, user, memory, tool])
+
+    assert system_msgs == [system]
+    assert other_msgs == [user, tool]
+    assert len(memory_blocks) == 1 and "remembered" in memory_blocks[0]
+
+
+def test_checkpoint_skips_unchanged_history_when_requested(tmp_path: Path) -> None:
+    from reverie.context_engine.compressor import _checkpoint_sidecar
+
+    messages = [{"role": "user", "content": "same"}]
+    first = ContextCompressor(tmp_path).save_checkpoint(messages, note="Pre-compression auto-save", session_id="s1")
+
+    # A fresh compressor (as built per compaction) still sees the earlier save.
+    compressor = ContextCompressor(tmp_path)
+    assert compressor.save_checkpoint(messages, note="again", session_id="s1", skip_if_unchanged=True) == first
+    assert compressor.last_checkpoint == first
+    assert compressor.save_checkpoint(messages, note="other", session_id="s2", skip_if_unchanged=True) != first
+
+    longer = messages + [{"role": "assistant", "content": "new"}]
+    changed = Path(compressor.save_checkpoint(longer, session_id="s1", skip_if_unchanged=True))
+    assert compressor.load_checkpoint(changed) == {
+        **json.loads(_checkpoint_sidecar(changed).read_bytes()),
+        "messages": longer,
+    }
+    assert compressor.load_checkpoint(changed)["message_count"] == 2
+
+
+def test_checkpoint_skip_rewrites_a_missing_or_evicted_checkpoint(tmp_path: Path) -> None:
+    messages = [{"role": "user", "content": "same"}]
+    compressor = ContextCompressor(tmp_path, max_checkpoints=1)
+    first = Path(compressor.save_checkpoint(messages, session_id="s1"))
+    first.unlink()
+
+    again = Path(compressor.save_checkpoint(messages, session_id="s1", skip_if_unchanged=True))
+    assert again.exists()
+    assert compressor.load_checkpoint(again)["messages"] == messages
+
+    # A newer checkpoint from another session pushes s1's out of the cap.
+    (compressor.cache_dir / "checkpoint_s2_29991231_235959.json").write_text("{}", encoding="utf-8")
+    compressor._evict_old_checkpoints()
+    assert not again.exists()
+    assert (str(compressor.cache_dir), "s1") not in ContextCompressor._last_saved
+
+
+def test_compression_dispatches_anthropic_and_rejects_unknown_providers(tmp_path: Path) -> None:
+    calls = []
+
+    class AnthropicClient:
+        class messages:
+            @staticmethod
+            def create(**kwargs):
+                calls.append(kwargs)
+
+                class Block:
+                    text = "anthropic summary"
+
+                class Response:
+                    content = [Block()]
+                    usage = None
+
+                return Response()
+
+    messages = [
+        {"role": "system", "content": "system"},
+        *({"role": "user" if index % 2 == 0 else "assistant", "content": f"message {index}"} for index in range(20)),
+    ]
+
+    compressed = ContextCompressor(tmp_path).compress(messages, client=AnthropicClient(), model="m", provider="anthropic")
+    assert "anthropic summary" in compressed[1]["content"]
+    assert calls[0]["system"].startswith("You are Reverie's Context Engine Optimizer")
+    assert [message["role"] for message in calls[0]["messages"]] == ["user"]
+
+    fallback = ContextCompressor(tmp_path).compress(messages, client=None, model="m", provider="mystery")
+    assert fallback[1]["content"].startswith(MEMORY_BLOCK_HEADER)
+    assert "anthropic summary" not in fallback[1]["content"]
+
+
+def test_compression_requests_reuse_one_keep_alive_session(monkeypatch) -> None:
+    import requests
+
+    from reverie.context_engine.compressor import make_compression_request_with_retry
+
+    sessions = []
+    bodies = []
+
+    class Response:
+        def raise_for_status(self):
+            return None
+
+    def fake_post(self, url, **kwargs):
+        sessions.append(self)
+        bodies.append(kwargs)
+        return Response()
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+    for _ in range(2):
+        make_compression_request_with_retry("https://example.invalid/v1", {}, payload)
+
+    assert len(sessions) == 2
+    assert sessions[0] is sessions[1]
+    assert isinstance(sessions[0], requests.Session)
+    assert "json" not in bodies[0]
+    assert json.loads(bodies[0]["data"]) == payload
+    assert bodies[0]["headers"]["Content-Type"] == "application/json"
+
+
+def test_compression_transcript_keeps_histories_that_fit_exactly() -> None:
+    # Two entries of 9998 + 2 separator chars + 10000 == 20000 == the minimum budget.
+    messages = [
+        {"role": "user", "content": "u" * (9998 - len("USER: "))},
+        {"role": "user", "content": "v" * (10000 - len("USER: "))},
+    ]
+
+    transcript = _build_compression_transcript(messages, max_chars=20000)
+    assert len(transcript) == 20000
+    assert "omitted" not in transcript
+
+    messages[1]["content"] += "v"
+    assert "omitted" in _build_compression_transcript(messages, max_chars=20000)
+
+
+def test_checkpoint_writes_replace_files_atomically(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from reverie.context_engine import compressor as compressor_module
+
+    compressor = ContextCompressor(tmp_path)
+    path = Path(compressor.save_checkpoint([{"role": "user", "content": "kept"}], session_id="s1"))
+    assert sorted(p.name for p in compressor.cache_dir.iterdir()) == sorted(
+        [path.name, compressor_module._checkpoint_sidecar(path).name]
+    )
+
+    synced = []
+    monkeypatch.setattr(compressor_module.os, "fsync", lambda fd: synced.append(fd))
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(compressor_module.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        compressor_module._write_checkpoint_files(path, b'{"torn":', b"{}")
+
+    assert compressor.load_checkpoint(path)["messages"] == [{"role": "user", "content": "kept"}]
+    assert not list(compressor.cache_dir.glob("*.tmp"))
+    assert len(synced) == 1
+
+    monkeypatch.setattr(compressor_module.os, "replace", os.replace)
+    synced.clear()
+    compressor.save_checkpoint([], session_id="s2", wait=False)
+    compressor.flush()
+    assert synced == []
+
+
+def test_checkpoints_are_zstd_compressed_when_available(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    from reverie.context_engine.compressor import _checkpoint_sidecar
+
+    compressor = ContextCompressor(tmp_path)
+    messages = [{"role": "user", "content": "repeat " * 2000}]
+    path = Path(compressor.save_checkpoint(messages, note="z", session_id="s1"))
+
+    assert path.name.endswith(".json.zst")
+    assert path.read_bytes().startswith(b"\x28\xb5\x2f\xfd")
+    assert path.stat().st_size < 2000
+    assert _checkpoint_sidecar(path).name == path.name[: -len(".json.zst")] + ".meta.json"
+    assert compressor.load_checkpoint(path)["messages"] == messages
+
+    legacy = compressor.cache_dir / "checkpoint_s1_20200101_000000.json"
+    legacy.write_text(json.dumps({"timestamp": "2020-01-01T00:00:00", "session_id": "s1", "note": "plain",
+                                  "message_count": 0, "messages": []}), encoding="utf-8")
+    assert [item["note"] for item in compressor.list_checkpoints("s1")] == ["z", "plain"]
+
+
+def test_old_checkpoints_are_evicted_beyond_the_limit(tmp_path: Path) -> None:
+    from reverie.context_engine.compressor import CHECKPOINT_SUFFIX, _checkpoint_sidecar
+
+    compressor = ContextCompressor(tmp_path, max_checkpoints=3)
+    for index, session in enumerate(["b", "a", "c", "a"]):
+        stale = compressor.cache_dir / f"checkpoint_{session}_2020010{index + 1}_000000.json"
+        stale.write_text(json.dumps({"timestamp": f"2020-01-0{index + 1}", "session_id": session, "messages": []}))
+        _checkpoint_sidecar(stale).write_text("{}")
+
+    newest = Path(compressor.save_checkpoint([{"role": "user", "content": "hi"}], session_id="z"))
+
+    remaining = sorted(p.name for p in compressor.cache_dir.iterdir() if not p.name.endswith(".meta.json"))
+    assert remaining == sorted(
+        ["checkpoint_c_20200103_000000.json", "checkpoint_a_20200104_000000.json", newest.name]
+    )
+    assert not (compressor.cache_dir / "checkpoint_b_20200101_000000.meta.json").exists()
+    assert newest.name.endswith(CHECKPOINT_SUFFIX)
+
+
+def test_list_checkpoints_is_cached_until_the_directory_changes(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from reverie.context_engine import compressor as compressor_module
+
+    compressor = ContextCompressor(tmp_path)
+    compressor.save_checkpoint([{"role": "user", "content": "one"}], note="first", session_id="s1")
+    os.utime(compressor.cache_dir, ns=(0, 10_000_000_000))
+    first = compressor.list_checkpoints("s1")
+
+    parsed = []
+    original_load = compressor_module._load_checkpoint
+    monkeypatch.setattr(compressor_module, "_load_checkpoint", lambda raw: (parsed.append(1), original_load(raw))[1])
+
+    again = ContextCompressor(tmp_path).list_checkpoints("s1")
+    assert again == first and parsed == []
+    again[0]["note"] = "mutated"
+    assert compressor.list_checkpoints("s1")[0]["note"] == "first"
+
+    (compressor.cache_dir / "checkpoint_s1_20300101_000000.json").write_text(
+        json.dumps({"timestamp": "2030-01-01T00:00:00", "session_id": "s1", "note": "later", "messages": []})
+    )
+    assert [item["note"] for item in compressor.list_checkpoints("s1")] == ["later", "first"]
+    assert parsed
+
+
+def test_compression_request_encodes_valid_payloads_without_the_stdlib_round_trip(monkeypatch) -> None:
+    import requests
+
+    from reverie.context_engine import compressor as compressor_module
+
+    class Response:
+        def raise_for_status(self):
+            return None
+
+    bodies = []
+    monkeypatch.setattr(requests.Session, "post", lambda self, url, **kwargs: (bodies.append(kwargs["data"]), Response())[1])
+    monkeypatch.setattr(
+        compressor_module,
+        "validate_payload_for_compression",
+        lambda payload: pytest.fail("valid payloads must not be re-validated"),
+    )
+
+    payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+    compressor_module.make_compression_request_with_retry("https://example.invalid/v1", {}, payload)
+    assert json.loads(bodies[-1]) == payload
+
+    sanitized = []
+    monkeypatch.setattr(
+        compressor_module,
+        "validate_payload_for_compression",
+        lambda payload: sanitized.append(1) or {"model": "m", "messages": []},
+    )
+    compressor_module.make_compression_request_with_retry("https://example.invalid/v1", {}, {"model": object()})
+    assert sanitized == [1]
+    assert json.loads(bodies[-1]) == {"model": "m", "messages": []}
+
+
+def test_compression_request_escapes_lone_surrogates_like_requests_json(monkeypatch) -> None:
+    import requests
+
+    from reverie.context_engine import compressor as compressor_module
+
+    class Response:
+        def raise_for_status(self):
+            return None
+
+    bodies = []
+    monkeypatch.setattr(requests.Session, "post", lambda self, url, **kwargs: (bodies.append(kwargs["data"]), Response())[1])
+
+    payload = {"model": "m", "messages": [{"role": "user", "content": "bad \ud83d pasted"}]}
+    compressor_module.make_compression_request_with_retry("https://example.invalid/v1", {}, payload)
+
+    assert b"\\ud83d" in bodies[-1]
+    assert json.loads(bodies[-1]) == payload
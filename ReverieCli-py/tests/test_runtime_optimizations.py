@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
 import sys
 import threading
 import time
@@ -1026,3 +1028,183 @@ def test_partial_stream_errors_are_recoverable_only_after_visible_output() -> No
         tool_state,
         RuntimeError("peer closed connection without sending complete message body (incomplete chunked read)"),
     ) is False
+
+
+def test_markdown_formatter_reuses_width_until_terminal_resize(monkeypatch) -> None:
+    from reverie.cli import markdown_formatter
+
+    console = Console(width=90, record=True)
+    formatter = markdown_formatter.MarkdownFormatter(console=console)
+    monkeypatch.setattr(markdown_formatter, "_resize_handler_active", lambda: True)
+
+    assert formatter._terminal_width() == 90
+    console.width = 120
+    assert formatter._terminal_width() == 90
+
+    markdown_formatter._note_terminal_resize(None, None)
+    assert formatter._terminal_width() == 120
+
+
+def test_markdown_formatter_installs_resize_handler_on_first_use_not_import() -> None:
+    import signal
+
+    if not hasattr(signal, "SIGWINCH"):
+        return
+    script = (
+        "import signal\n"
+        "from reverie.cli import markdown_formatter\n"
+        "print(signal.getsignal(signal.SIGWINCH) is markdown_formatter._note_terminal_resize)\n"
+        "markdown_formatter.MarkdownFormatter()._terminal_width()\n"
+        "print(signal.getsignal(signal.SIGWINCH) is markdown_formatter._note_terminal_resize)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+        env={**os.environ, "PYGLET_SHADOW_WINDOW": "0"},
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_rollback_status_bar_renders_markup_and_tracks_theme() -> None:
+    from types import SimpleNamespace
+
+    from reverie.cli.rollback_ui import RollbackUI
+    from reverie.cli.theme import apply_theme
+
+    summary = {"total_operations": 7, "modified_files": ["a.py", "b.py"], "can_undo": True, "can_redo": False}
+    manager = SimpleNamespace(get_operation_summary=lambda: summary)
+    console = Console(record=True, width=120, color_system="truecolor")
+    ui = RollbackUI(console, manager, operation_history=None)
+
+    ui.show_status_bar()
+    output = console.export_text()
+    assert "7 ops" in output
+    assert "2 files" in output
+    assert "[" not in output
+
+    apply_theme("minimal")
+    try:
+        ui.show_status_bar()
+        assert "--" in console.export_text()
+    finally:
+        apply_theme("default")
+
+
+def test_rollback_history_uses_padded_rows_for_long_histories() -> None:
+    from types import SimpleNamespace
+
+    from reverie.cli.rollback_ui import RollbackUI
+
+    operations = [
+        SimpleNamespace(
+            operation_type=SimpleNamespace(value="file_write"),
+            description=f"edit {index}",
+            timestamp="2024-01-01T10:00:00.123",
+        )
+        for index in range(40)
+    ]
+    history = SimpleNamespace(get_operations=lambda operation_type=None, limit=None: operations[:limit])
+    console = Console(record=True, width=100)
+
+    RollbackUI(console, None, history).show_operation_history(limit=40)
+    output = console.export_text()
+
+    assert " 40 │ file_write   │ edit 39" in output
+    assert "2024-01-01 10:00:00" in output
+    assert "╭──────┬" not in output
+
+
+def test_rollback_history_rows_align_wide_and_multiline_descriptions() -> None:
+    from types import SimpleNamespace
+
+    from rich.cells import cell_len
+
+    from reverie.cli.rollback_ui import RollbackUI
+
+    descriptions = ["修改配置文件", "plain edit", "first line\nsecond line", "emoji 🚀 edit"]
+    operations = [
+        SimpleNamespace(
+            operation_type=SimpleNamespace(value="file_write"),
+            description=description,
+            timestamp="2024-01-01T10:00:00.123",
+        )
+        for description in descriptions
+    ]
+
+    rows = RollbackUI(Console(width=100), None, None)._build_history_rows(operations)
+    lines = rows.plain.split("\n")
+
+    assert len(lines) == len(operations) + 1
+    assert "first line second line" in lines[3]
+    time_columns = {cell_len(line[: line.rindex("│")]) for line in lines}
+    assert len(time_columns) == 1
+
+
+def test_operation_history_type_index_survives_round_trip() -> None:
+    from reverie.session.operation_history import OperationHistory, OperationType
+
+    history = OperationHistory("session-1")
+    first = history.add_user_question("first?", message_index=0)
+    history.add_tool_call("read_file", {"path": "a.py"}, "ok", True, None, parent_id=first.id)
+    history.add_file_operation("a.py", "modify", "old", "new")
+    second = history.add_user_question("second?", message_index=2)
+
+    assert history.get_operations(operation_type=OperationType.USER_QUESTION) == [first, second]
+    assert history.get_operations(operation_type=OperationType.USER_QUESTION, limit=1) == [second]
+    assert history.get_operations(operation_type=OperationType.CHECKPOINT) == []
+    assert history.get_last_tool_call().tool_call.tool_name == "read_file"
+
+    restored = OperationHistory.from_dict(history.to_dict())
+    assert restored.get_last_user_question().id == second.id
+    assert len(restored.get_operations(operation_type=OperationType.FILE_MODIFICATION)) == 1
+
+    restored.clear()
+    assert restored.get_last_user_question() is None
+
+
+def test_rollback_main_menu_maps_selected_item_to_action(monkeypatch) -> None:
+    from reverie.cli import tui_selector
+    from reverie.cli.rollback_ui import RollbackAction, RollbackUI
+
+    seen_items = []
+
+    def fake_run(self):
+        seen_items.append(self.items)
+        undo = next(item for item in self.items if item.id == "undo")
+        return tui_selector.SelectorResult(action=tui_selector.SelectorAction.SELECT, selected_item=undo)
+
+    monkeypatch.setattr(tui_selector.TUISelector, "run", fake_run)
+    ui = RollbackUI(Console(width=100), None, None)
+
+    assert ui.show_main_menu() is RollbackAction.UNDO
+    assert ui.show_main_menu() is RollbackAction.UNDO
+    assert seen_items[0][0] is seen_items[1][0]
+
+
+def test_importing_cli_package_defers_the_selector_module() -> None:
+    import subprocess
+
+    code = (
+        "import sys, reverie.cli, reverie.cli.session_ui as s\n"
+        "assert 'reverie.cli.tui_selector' not in sys.modules\n"
+        "assert s.SessionSelector.__module__ == 'reverie.cli.tui_selector'\n"
+    )
+    env = {**os.environ, "PYGLET_SHADOW_WINDOW": "0"}
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1], env=env)
+
+
+def test_context_engine_package_loads_submodules_on_first_use() -> None:
+    import subprocess
+
+    code = (
+        "import sys, reverie.context_engine as ce\n"
+        "assert 'reverie.context_engine.indexer' not in sys.modules\n"
+        "assert ce.CodebaseIndexer.__module__ == 'reverie.context_engine.indexer'\n"
+        "assert 'reverie.context_engine.knowledge_graph' not in sys.modules\n"
+        "assert all(hasattr(ce, name) for name in ce.__all__)\n"
+    )
+    env = {**os.environ, "PYGLET_SHADOW_WINDOW": "0"}
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1], env=env)
@@ -30,3 +30,55 @@ def test_accessibility_theme_presets_are_distinct() -> None:
     assert DECO.SPARKLE == ""
     apply_theme("default")
     assert DECO.SPARKLE == default_sparkle
+
+
+def test_markdown_formatter_follows_active_theme_preset() -> None:
+    from reverie.cli.markdown_formatter import format_markdown
+
+    apply_theme("light")
+    try:
+        rendered = format_markdown("plain transcript text")
+        assert str(rendered.style) == THEME.TEXT_SECONDARY
+    finally:
+        apply_theme("default")
+    assert str(format_markdown("plain transcript text").style) == THEME.TEXT_SECONDARY
+
+
+def test_dream_text_markup_cache_invalidates_on_theme_change() -> None:
+    from reverie.cli.theme import DreamText
+
+    apply_theme("default")
+    first = DreamText.header("Reverie")
+    assert DreamText.header("Reverie") is first
+
+    apply_theme("light")
+    try:
+        assert THEME.PINK_SOFT in DreamText.header("Reverie")
+        assert DreamText.header("Reverie") != first
+    finally:
+        apply_theme("default")
+
+
+def test_gradient_text_assigns_colors_in_contiguous_bands() -> None:
+    from reverie.cli.theme import DreamText
+
+    colors = ["#111111", "#222222", "#333333"]
+    for text in ("a", "ab", "abcdefg", "x" * 40):
+        rendered = DreamText.gradient_text(text, colors)
+        assert rendered.plain == text
+        expected = [colors[min(int(i / len(text) * len(colors)), len(colors) - 1)] for i in range(len(text))]
+        actual = [None] * len(text)
+        for span in rendered.spans:
+            for index in range(span.start, span.end):
+                actual[index] = str(span.style)
+        assert actual == expected
+        assert len(rendered.spans) <= len(colors)
+    assert DreamText.gradient_text("", colors).plain == ""
+
+
+def test_gradient_text_accepts_pre_resolved_styles() -> None:
+    from reverie.cli.theme import GRADIENT_PINK_PURPLE_STYLES, DreamscapeTheme, DreamText
+
+    rendered = DreamText.gradient_text("Reverie Dreamscape")
+    assert rendered.spans[0].style is GRADIENT_PINK_PURPLE_STYLES[0]
+    assert [str(style.color.triplet.hex) for style in GRADIENT_PINK_PURPLE_STYLES] == DreamscapeTheme.get_gradient_pink_purple()
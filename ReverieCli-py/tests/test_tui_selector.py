@@ -1,3 +1,6 @@
+import os
+import sys
+
 import pytest
 from rich.console import Console
 
@@ -62,3 +65,265 @@ def test_subagent_selector_builds_model_descriptions() -> None:
 
     assert selector.items[0].id == "subagent-001"
     assert "Fake Model" in selector.items[0].description
+
+
+def test_checkpoint_selector_accepts_checkpoint_rows() -> None:
+    from reverie.cli.tui_selector import CheckpointRow, CheckpointSelector
+
+    selector = CheckpointSelector(
+        Console(force_terminal=True, width=120, height=40),
+        [CheckpointRow("cp-1", "", "2024-01-01 10:00:00", 4), CheckpointRow("cp-2", "Before refactor", "2024-01-02 09:30:00", 9)],
+        file_path="app.py",
+    )
+
+    assert [item.id for item in selector.items] == ["cp-1", "cp-2"]
+    assert selector.items[0].title == "Checkpoint"
+    assert selector._item_description(selector.items[1]) == "Created: 2024-01-02 09:30:00 • File: app.py"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX key decoding")
+def test_read_key_decodes_full_escape_sequences_from_stdin(monkeypatch) -> None:
+    from reverie.cli import tui_selector
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"\x1b[B\x1b[6~\x1bOHx")
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb", buffering=0) as pipe:
+        monkeypatch.setattr(sys, "stdin", pipe)
+        keys = [tui_selector._read_key() for _ in range(4)]
+
+    assert keys == [b"\x1b[B", b"\x1b[6~", b"\x1b[H", b"x"]
+
+
+def test_search_coalesces_buffered_keystrokes_into_one_filter_pass(monkeypatch) -> None:
+    from collections import deque
+
+    import rich.live
+    from reverie.cli import tui_selector
+
+    class FakeLive:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def update(self, *args, **kwargs):
+            return None
+
+    # "/" starts search; "alpx<BS>ha" arrives as one burst, then Enter.
+    keys = deque([b"/", b"a", b"l", b"p", b"x", b"\x7f", b"h", b"a", b"\r"])
+    monkeypatch.setattr(rich.live, "Live", FakeLive)
+    monkeypatch.setattr(tui_selector, "_read_key", keys.popleft)
+    monkeypatch.setattr(tui_selector, "_kbhit", lambda timeout=0: len(keys) > 1)
+
+    selector = TUISelector(
+        console=Console(width=120, height=40),
+        title="Pick",
+        items=[SelectorItem(id="beta", title="Beta"), SelectorItem(id="alpha", title="Alpha")],
+    )
+    calls = []
+    original_apply = selector._apply_search
+    monkeypatch.setattr(selector, "_apply_search", lambda: (calls.append(selector.search_query), original_apply()))
+
+    result = selector.run()
+
+    assert calls == ["alpha"]
+    assert result.action == SelectorAction.SELECT
+    assert result.selected_item.id == "alpha"
+
+
+def test_search_narrows_incrementally_and_recovers_on_backspace() -> None:
+    selector = TUISelector(
+        console=Console(width=120, height=40),
+        title="Pick",
+        items=[
+            SelectorItem(id="gpt", title="GPT Large", description="general"),
+            SelectorItem(id="gemma", title="Gemma", description="small open model"),
+            SelectorItem(id="glm", title="GLM", description="general language"),
+        ],
+    )
+
+    def search(query: str) -> list[str]:
+        selector.search_query = query
+        selector._apply_search()
+        return [item.id for item in selector.filtered_items]
+
+    assert search("g") == ["gpt", "gemma", "glm"]
+    assert search("ge") == ["gpt", "gemma", "glm"]
+    assert search("gen") == ["gpt", "glm"]
+    assert search("gene") == ["gpt", "glm"]
+    assert search("ge") == ["gpt", "gemma", "glm"]
+    assert search("open") == ["gemma"]
+    assert search("") == ["gpt", "gemma", "glm"]
+
+
+def test_search_blob_is_cached_on_reused_items(monkeypatch) -> None:
+    items = [SelectorItem(id="one", title="One", description="First Item")]
+    first = TUISelector(console=Console(width=120, height=40), title="Pick", items=items)
+    assert items[0]._search_blob is None
+    first.search_query = "first"
+    first._apply_search()
+    assert items[0]._search_blob == "one one first item"
+
+    monkeypatch.setattr(TUISelector, "_build_search_blob", lambda self, item: pytest.fail("blob rebuilt"))
+    selector = TUISelector(console=Console(width=120, height=40), title="Pick", items=items)
+    assert selector._search_index == ["one one first item"]
+
+
+def test_build_content_measures_terminal_once_and_tracks_theme(monkeypatch) -> None:
+    from reverie.cli.theme import apply_theme
+
+    selector = TUISelector(
+        console=Console(width=120, height=40),
+        title="Pick",
+        items=[SelectorItem(id="one", title="One")],
+    )
+    measurements = []
+    original = selector._console_dimensions
+    monkeypatch.setattr(selector, "_console_dimensions", lambda: measurements.append(1) or original())
+
+    first = selector._build_content()
+    assert len(measurements) == 1
+    assert selector._build_content() is first
+
+    apply_theme("light")
+    try:
+        assert selector._build_content() is not first
+    finally:
+        apply_theme("default")
+
+
+def test_cursor_moves_within_window_restyle_rows_in_place() -> None:
+    selector = TUISelector(
+        console=Console(width=120, height=40),
+        title="Pick",
+        items=[SelectorItem(id=f"item-{i}", title=f"Item {i}", description="desc") for i in range(4)],
+    )
+
+    selector._build_content()
+    panel = selector._list_panel_cache
+    first_row, second_row = selector._list_row_cells[:2]
+    assert first_row[0].plain.strip() and not second_row[0].plain.strip()
+
+    selector._navigate_down()
+    selector._build_content()
+
+    assert selector._list_panel_cache is panel
+    assert not first_row[0].plain.strip()
+    assert second_row[0].plain.strip()
+    assert "on" in str(second_row[2].style) and "on" not in str(first_row[2].style)
+
+
+def test_synchronized_update_brackets_one_buffered_frame() -> None:
+    import io
+
+    from reverie.cli import tui_selector
+
+    output = io.StringIO()
+    console = Console(file=output, force_terminal=True, width=80, legacy_windows=False)
+    with tui_selector._synchronized_update(console):
+        console.print("first line", highlight=False)
+        console.print("second line", highlight=False)
+        assert output.getvalue() == "\x1b[?2026h"
+
+    assert output.getvalue().startswith("\x1b[?2026h")
+    assert output.getvalue().endswith("\x1b[?2026l")
+    assert "first line\nsecond line" in output.getvalue()
+
+    plain = io.StringIO()
+    with tui_selector._synchronized_update(Console(file=plain, force_terminal=False)):
+        pass
+    assert plain.getvalue() == ""
+
+
+def test_scrolling_refills_pooled_row_cells() -> None:
+    selector = TUISelector(
+        console=Console(width=120, height=30),
+        title="Pick",
+        items=[SelectorItem(id=f"item-{i}", title=f"Item {i}") for i in range(40)],
+    )
+
+    selector._build_content()
+    first_window = [cell for row in selector._list_row_cells for cell in row]
+    selector._page_down()
+    selector._build_content()
+
+    assert selector.scroll_offset > 0
+    assert all(a is b for a, b in zip(first_window, (cell for row in selector._list_row_cells for cell in row)))
+    assert selector._list_row_cells[0][2].plain == f"Item {selector.scroll_offset}"
+
+
+def test_empty_query_shares_the_item_list() -> None:
+    items = [SelectorItem(id="one", title="One"), SelectorItem(id="two", title="Two")]
+    selector = TUISelector(console=Console(width=120, height=40), title="Pick", items=items)
+    assert selector.filtered_items is items
+
+    selector.search_query = "tw"
+    selector._apply_search()
+    assert [item.id for item in selector.filtered_items] == ["two"]
+    assert [item.id for item in items] == ["one", "two"]
+
+    selector.search_query = ""
+    selector._apply_search()
+    assert selector.filtered_items is items
+
+
+def test_session_descriptions_are_formatted_only_when_shown() -> None:
+    from reverie.cli.tui_selector import SessionSelector
+
+    sessions = [
+        {"id": f"s{i}", "name": f"Session {i}", "created_at": f"2024-01-{i + 1:02d}", "message_count": i}
+        for i in range(30)
+    ]
+    selector = SessionSelector(Console(width=120, height=30), sessions)
+    assert all(item.description == "" for item in selector.items)
+
+    selector._build_content()
+    described = [item.id for item in selector.items if item.description]
+    assert described and len(described) < len(sessions)
+    assert selector.items[0].description == "2024-01-01 | 0 messages"
+
+    selector.search_query = "2024-01-30"
+    selector._apply_search()
+    assert [item.id for item in selector.filtered_items] == ["s29"]
+
+
+def test_keys_that_do_not_move_the_view_skip_the_repaint(monkeypatch) -> None:
+    from collections import deque
+
+    import rich.live
+    from reverie.cli import tui_selector
+
+    updates = []
+
+    class FakeLive:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def update(self, *args, **kwargs):
+            updates.append(1)
+
+    keys = deque([b"\x1b[A", b"g", b"\x1b[B", b"\x1b[B", b"\x1b[B", b"\r"])
+    monkeypatch.setattr(rich.live, "Live", FakeLive)
+    monkeypatch.setattr(tui_selector, "_read_key", keys.popleft)
+    monkeypatch.setattr(tui_selector, "_kbhit", lambda timeout=0: False)
+
+    selector = TUISelector(
+        console=Console(width=120, height=40),
+        title="Pick",
+        items=[SelectorItem(id="one", title="One"), SelectorItem(id="two", title="Two")],
+    )
+    result = selector.run()
+
+    assert result.selected_item.id == "two"
+    assert len(updates) == 1